@@ -7,6 +7,12 @@ import sys
 
 from ptychodus.cli import DirectoryType, verify_all_arguments_parsed
 from ptychodus.model import ModelCore
+from ptychodus.model.batch import (
+    DEFAULT_BATCH_MODE_TIMEOUT_S,
+    submit_batch_mode_job,
+    wait_for_batch_mode_result,
+)
+from ptychodus.model.core import configure_logger
 import ptychodus
 
 logger = logging.getLogger(__name__)
@@ -20,7 +26,7 @@ def main() -> int:
     parser.add_argument(
         '-b',
         '--batch',
-        choices=('reconstruct', 'train'),
+        choices=('reconstruct', 'train', 'serve'),
         help='Run action non-interactively',
     )
     parser.add_argument(
@@ -30,6 +36,13 @@ def main() -> int:
         type=DirectoryType(must_exist=True),
         help='Path to the input data directory (batch mode only)',
     )
+    parser.add_argument(
+        '--batch-timeout',
+        metavar='SECONDS',
+        type=float,
+        default=DEFAULT_BATCH_MODE_TIMEOUT_S,
+        help='Time to wait for a job submitted to a batch mode service (batch mode only)',
+    )
     parser.add_argument(
         '--log-level',
         type=int,
@@ -50,6 +63,12 @@ def main() -> int:
         help='Path to the settings file.',
         type=argparse.FileType('r'),
     )
+    parser.add_argument(
+        '--spool-directory',
+        metavar='SPOOL_DIR',
+        type=DirectoryType(must_exist=False),
+        help='Path to the job spool directory of a batch mode service (batch mode only)',
+    )
     parser.add_argument(
         '-v',
         '--version',
@@ -60,6 +79,41 @@ def main() -> int:
     parsed_args, unparsed_args = parser.parse_known_args()
     settings_file = Path(parsed_args.settings.name) if parsed_args.settings else None
 
+    if parsed_args.batch is not None and parsed_args.spool_directory is not None:
+        verify_all_arguments_parsed(parser, unparsed_args)
+
+        if parsed_args.batch == 'serve':
+            with ModelCore(settings_file, log_level=parsed_args.log_level) as model:
+                return model.batch_mode_serve(parsed_args.spool_directory)
+
+        if parsed_args.input_directory is None or parsed_args.output_directory is None:
+            parser.error('Batch mode requires input and output arguments!')
+            return -1
+
+        # submit to a warm batch mode service instead of starting a model in this process
+        configure_logger(log_level=parsed_args.log_level)
+        result_file_path = submit_batch_mode_job(
+            parsed_args.spool_directory,
+            parsed_args.batch,
+            parsed_args.input_directory,
+            parsed_args.output_directory,
+        )
+
+        try:
+            job_result = wait_for_batch_mode_result(
+                result_file_path, timeout_s=parsed_args.batch_timeout
+            )
+        except TimeoutError:
+            logger.exception('Batch mode job did not finish!')
+            return -1
+
+        logger.info(f'Batch mode job finished: {job_result}')
+        return job_result.result
+
+    if parsed_args.batch == 'serve':
+        parser.error('Serving batch mode jobs requires a spool directory argument!')
+        return -1
+
     with ModelCore(settings_file, log_level=parsed_args.log_level) as model:
         if parsed_args.batch is not None:
             verify_all_arguments_parsed(parser, unparsed_args)
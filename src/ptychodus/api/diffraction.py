@@ -22,6 +22,17 @@ class CropCenter:
     position_y_px: int
 
 
+@dataclass(frozen=True)
+class PatternRegion:
+    """rectangular region of interest in detector pixel coordinates"""
+
+    slice_x: slice
+    slice_y: slice
+
+    def apply(self, patterns: DiffractionPatterns) -> DiffractionPatterns:
+        return patterns[..., self.slice_y, self.slice_x]
+
+
 class DiffractionArray:
     @abstractmethod
     def get_label(self) -> str:
@@ -32,12 +43,18 @@ class DiffractionArray:
         pass
 
     @abstractmethod
-    def get_patterns(self) -> DiffractionPatterns:
+    def get_patterns(self, region: PatternRegion | None = None) -> DiffractionPatterns:
+        """returns patterns restricted to the region of interest, if any; readers should avoid
+        reading pixels outside of the region"""
         pass
 
     def get_num_patterns(self) -> int:
         return self.get_patterns().shape[0]
 
+    def get_source_files(self) -> Sequence[Path]:
+        """returns the files that patterns are read from, if known; used to detect changes"""
+        return []
+
 
 class SimpleDiffractionArray(DiffractionArray):
     def __init__(
@@ -57,8 +74,8 @@ class SimpleDiffractionArray(DiffractionArray):
     def get_indexes(self) -> DiffractionIndexes:
         return self._indexes
 
-    def get_patterns(self) -> DiffractionPatterns:
-        return self._patterns
+    def get_patterns(self, region: PatternRegion | None = None) -> DiffractionPatterns:
+        return self._patterns if region is None else region.apply(self._patterns)
 
 
 @dataclass(frozen=True)
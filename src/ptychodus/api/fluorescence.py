@@ -52,6 +52,11 @@ class UpscalingStrategy(ABC):
     def __call__(self, emap: ElementMap, product: Product) -> ElementMap:
         pass
 
+    def upscale_all(self, emaps: Sequence[ElementMap], product: Product) -> Sequence[ElementMap]:
+        """upscales several element maps measured at the same probe positions; strategies
+        should override this to share work across element maps"""
+        return [self(emap, product) for emap in emaps]
+
 
 class DeconvolutionStrategy(ABC):
     """Deconvolves the kernel from the accumulated array to obtain the
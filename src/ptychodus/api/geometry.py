@@ -3,6 +3,10 @@ from dataclasses import dataclass
 from decimal import Decimal
 from typing import Generic, TypeVar
 
+import numpy
+
+from .typing import RealArrayType
+
 T = TypeVar('T', int, float, Decimal)
 
 
@@ -21,6 +25,12 @@ class AffineTransform:
         xp = self.a10 * y + self.a11 * x + self.a12
         return yp, xp
 
+    def transform_coordinates(self, coordinates: RealArrayType) -> RealArrayType:
+        """transforms (y, x) coordinates with shape (..., 2)"""
+        matrix = numpy.array([[self.a00, self.a01], [self.a10, self.a11]])
+        offset = numpy.array([self.a02, self.a12])
+        return coordinates @ matrix.T + offset
+
 
 @dataclass(frozen=True)
 class PixelGeometry:
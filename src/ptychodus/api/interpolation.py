@@ -0,0 +1,240 @@
+from __future__ import annotations
+from collections import OrderedDict
+from collections.abc import Callable
+import concurrent.futures
+import hashlib
+import threading
+
+from scipy.interpolate import CloughTocher2DInterpolator
+from scipy.spatial import Delaunay, cKDTree
+import numpy
+
+from .typing import RealArrayType
+
+__all__ = [
+    'GridInterpolator',
+    'evaluate_on_grid',
+    'get_grid_interpolator',
+]
+
+GRID_CHUNK_SIZE = 1 << 18  # query points per chunk
+
+
+def _get_row_chunks(grid_shape: tuple[int, int]) -> list[slice]:
+    height, width = grid_shape
+    rows_per_chunk = max(1, GRID_CHUNK_SIZE // max(1, width))
+    return [
+        slice(row, min(row + rows_per_chunk, height)) for row in range(0, height, rows_per_chunk)
+    ]
+
+
+def _get_query_points(grid_shape: tuple[int, int], rows: slice) -> RealArrayType:
+    """returns (y, x) pixel coordinates with shape (num_points, 2) for a band of grid rows"""
+    yy, xx = numpy.mgrid[rows, : grid_shape[1]]
+    return numpy.column_stack((yy.ravel(), xx.ravel())).astype(float)
+
+
+def evaluate_on_grid(
+    evaluate: Callable[[RealArrayType], RealArrayType],
+    grid_shape: tuple[int, int],
+    *,
+    max_workers: int | None = None,
+) -> RealArrayType:
+    """evaluates a function of (y, x) query points with shape (num_points, 2) over every
+    pixel of a grid, in bands of rows across a thread pool; functions returning shape
+    (num_points, num_columns) yield an array with shape (num_columns, height, width)"""
+    chunks = _get_row_chunks(grid_shape)
+
+    def evaluate_chunk(rows: slice) -> RealArrayType:
+        return evaluate(_get_query_points(grid_shape, rows))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(evaluate_chunk, chunks))
+
+    values = numpy.concatenate(results, axis=0) if results else numpy.zeros(0)
+    height, width = grid_shape
+
+    if values.ndim > 1:
+        return values.T.reshape(-1, height, width)
+
+    return values.reshape(height, width)
+
+
+class GridInterpolator:
+    """interpolates values at scattered (y, x) points onto every pixel of a grid. The
+    triangulation (or KD-tree) and the per-pixel interpolation weights are computed once, so
+    any number of value columns can be evaluated cheaply."""
+
+    METHODS = ('nearest', 'linear', 'cubic')
+
+    def __init__(
+        self,
+        points: RealArrayType,
+        grid_shape: tuple[int, int],
+        method: str = 'linear',
+        *,
+        max_workers: int | None = None,
+    ) -> None:
+        if method not in GridInterpolator.METHODS:
+            raise ValueError(f'Unknown interpolation method "{method}"!')
+
+        self._points = numpy.asarray(points, dtype=float).reshape(-1, 2)
+        self._grid_shape = grid_shape
+        self._method = method
+        self._max_workers = max_workers
+        self._triangulation: Delaunay | None = None
+        self._vertices: numpy.ndarray | None = None
+        self._weights: numpy.ndarray | None = None
+
+        if method == 'nearest':
+            tree = cKDTree(self._points)
+
+            def query_nearest(query_points: RealArrayType) -> RealArrayType:
+                _, indexes = tree.query(query_points)
+                return indexes.astype(numpy.int32)
+
+            self._vertices = evaluate_on_grid(
+                query_nearest, grid_shape, max_workers=max_workers
+            ).ravel()
+        else:
+            self._triangulation = Delaunay(self._points)
+
+            if method == 'linear':
+                self._precompute_barycentric_weights(self._triangulation)
+
+    def _precompute_barycentric_weights(self, triangulation: Delaunay) -> None:
+        num_pixels = self._grid_shape[0] * self._grid_shape[1]
+        vertices = numpy.empty((num_pixels, 3), dtype=numpy.int32)
+        weights = numpy.empty((num_pixels, 3), dtype=numpy.float32)
+        width = self._grid_shape[1]
+
+        def compute_chunk(rows: slice) -> None:
+            query_points = _get_query_points(self._grid_shape, rows)
+            simplex = triangulation.find_simplex(query_points)
+            transform = triangulation.transform[simplex]
+            barycentric = numpy.einsum(
+                'qij,qj->qi', transform[:, :2, :], query_points - transform[:, 2, :]
+            )
+            pixels = slice(rows.start * width, rows.stop * width)
+            vertices[pixels] = triangulation.simplices[simplex]
+            weights[pixels, :2] = barycentric
+            weights[pixels, 2] = 1.0 - barycentric.sum(axis=1)
+
+            # pixels outside the convex hull are marked with a negative vertex index
+            vertices[pixels][simplex < 0] = -1
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            for _ in executor.map(compute_chunk, _get_row_chunks(self._grid_shape)):
+                pass
+
+        self._vertices = vertices
+        self._weights = weights
+
+    @property
+    def grid_shape(self) -> tuple[int, int]:
+        return self._grid_shape
+
+    @property
+    def nbytes(self) -> int:
+        """approximate memory held by the points, triangulation, and precomputed weights"""
+        nbytes = self._points.nbytes
+
+        for array in (self._vertices, self._weights):
+            if array is not None:
+                nbytes += array.nbytes
+
+        if self._triangulation is not None:
+            nbytes += self._triangulation.simplices.nbytes
+            nbytes += self._triangulation.neighbors.nbytes
+
+        return nbytes
+
+    def __call__(self, values: RealArrayType, *, fill_value: float = 0.0) -> RealArrayType:
+        """interpolates values with shape (num_points,) or (num_points, num_columns) to an
+        array with shape (height, width) or (num_columns, height, width)"""
+        values = numpy.asarray(values)
+
+        if values.shape[0] != len(self._points):
+            raise ValueError(f'Expected {len(self._points)} values (actual={values.shape[0]})!')
+
+        height, width = self._grid_shape
+
+        if self._method == 'cubic':
+            interpolator = CloughTocher2DInterpolator(
+                self._triangulation, values, fill_value=fill_value
+            )
+            return evaluate_on_grid(interpolator, self._grid_shape, max_workers=self._max_workers)
+
+        assert self._vertices is not None
+
+        if self._method == 'nearest':
+            result = values[self._vertices]
+        else:
+            assert self._weights is not None
+            vertices = self._vertices
+            weights = self._weights
+            columns = values.reshape(len(values), -1)
+            result = numpy.empty((len(vertices), columns.shape[1]), dtype=float)
+
+            def evaluate_chunk(rows: slice) -> None:
+                pixels = slice(rows.start * width, rows.stop * width)
+                chunk_vertices = vertices[pixels]
+                is_outside = chunk_vertices[:, 0] < 0
+                result[pixels] = numpy.einsum(
+                    'qv,qvk->qk', weights[pixels], columns[chunk_vertices]
+                )
+                result[pixels][is_outside] = fill_value
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                for _ in executor.map(evaluate_chunk, _get_row_chunks(self._grid_shape)):
+                    pass
+
+            if values.ndim == 1:
+                result = result[:, 0]
+
+        if result.ndim > 1:
+            return result.T.reshape(-1, height, width)
+
+        return result.reshape(height, width)
+
+
+_interpolator_cache: OrderedDict[tuple[bytes, tuple[int, int], str], GridInterpolator] = (
+    OrderedDict()
+)
+_interpolator_cache_lock = threading.Lock()
+_INTERPOLATOR_CACHE_BYTES = 1 << 30  # interpolators larger than this are not cached
+
+
+def get_grid_interpolator(
+    points: RealArrayType, grid_shape: tuple[int, int], method: str = 'linear'
+) -> GridInterpolator:
+    """returns a cached interpolator for these scattered points and grid, creating it if
+    needed; the cache is keyed by a digest of the point coordinates and evicts least recently
+    used interpolators to stay within a memory budget"""
+    points = numpy.ascontiguousarray(points, dtype=float).reshape(-1, 2)
+    digest = hashlib.blake2b(points.tobytes(), digest_size=16).digest()
+    key = (digest, (int(grid_shape[0]), int(grid_shape[1])), method)
+
+    with _interpolator_cache_lock:
+        try:
+            interpolator = _interpolator_cache[key]
+        except KeyError:
+            pass
+        else:
+            _interpolator_cache.move_to_end(key)
+            return interpolator
+
+    interpolator = GridInterpolator(points, key[1], method)
+
+    if interpolator.nbytes > _INTERPOLATOR_CACHE_BYTES:
+        return interpolator
+
+    with _interpolator_cache_lock:
+        _interpolator_cache[key] = interpolator
+        cache_bytes = sum(cached.nbytes for cached in _interpolator_cache.values())
+
+        while cache_bytes > _INTERPOLATOR_CACHE_BYTES:
+            _, evicted = _interpolator_cache.popitem(last=False)
+            cache_bytes -= evicted.nbytes
+
+    return interpolator
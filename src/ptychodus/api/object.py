@@ -3,12 +3,13 @@ from abc import ABC, abstractmethod
 from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 import numpy
 
-from .geometry import PixelGeometry
+from .geometry import Box2D, PixelGeometry
 from .probe_positions import ProbePosition
-from .typing import ComplexArrayType
+from .typing import ComplexArrayType, RealArrayType
 
 
 @dataclass(frozen=True)
@@ -89,6 +90,20 @@ class ObjectGeometry:
 
         return ObjectPosition(position.index, x_px, y_px)
 
+    def map_coordinates_object_to_probe_array(self, coordinates_px: RealArrayType) -> RealArrayType:
+        """maps object (y, x) pixel coordinates with shape (..., 2) to probe coordinates"""
+        pixel_size_m = numpy.array([self.pixel_height_m, self.pixel_width_m])
+        radius_px = numpy.array([self.height_px / 2, self.width_px / 2])
+        center_m = numpy.array([self.center_y_m, self.center_x_m])
+        return center_m + pixel_size_m * (coordinates_px - radius_px)
+
+    def map_coordinates_probe_to_object_array(self, coordinates_m: RealArrayType) -> RealArrayType:
+        """maps probe (y, x) coordinates with shape (..., 2) to object pixel coordinates"""
+        pixel_size_m = numpy.array([self.pixel_height_m, self.pixel_width_m])
+        radius_px = numpy.array([self.height_px / 2, self.width_px / 2])
+        center_m = numpy.array([self.center_y_m, self.center_x_m])
+        return (coordinates_m - center_m) / pixel_size_m + radius_px
+
     def contains(self, geometry: ObjectGeometry) -> bool:
         dx = self.center_x_m - geometry.center_x_m
         dy = self.center_y_m - geometry.center_y_m
@@ -211,6 +226,58 @@ class Object:
         return f'{self._array.dtype}{self._array.shape}'
 
 
+@dataclass(frozen=True)
+class ObjectRegion:
+    """selects a single layer and/or a rectangular region (in pixels) of an object"""
+
+    layer: int | None = None
+    box: Box2D | None = None
+
+    def _get_slice(self, begin: float, end: float, size: int) -> slice:
+        begin_px = min(max(int(numpy.floor(begin)), 0), size)
+        end_px = min(max(int(numpy.ceil(end)), begin_px), size)
+        return slice(begin_px, end_px)
+
+    def select(
+        self,
+        array: Any,
+        pixel_geometry: PixelGeometry,
+        center: ObjectCenter,
+        layer_spacing_m: Sequence[float],
+    ) -> Object:
+        """creates an object from the selected part of an array-like (such as an h5py
+        dataset) with shape (height, width) or (num_layers, height, width), reading only
+        the selected elements"""
+        height_px, width_px = array.shape[-2:]
+
+        if self.box is None:
+            y_slice = slice(0, height_px)
+            x_slice = slice(0, width_px)
+        else:
+            y_slice = self._get_slice(self.box.y_begin, self.box.y_end, height_px)
+            x_slice = self._get_slice(self.box.x_begin, self.box.x_end, width_px)
+
+        if self.layer is None or array.ndim < 3:
+            layer_index: tuple[Any, ...] = (slice(None),) if array.ndim > 2 else ()
+        else:
+            layer_index = (slice(self.layer, self.layer + 1),)
+            layer_spacing_m = []
+
+        dx_px = (x_slice.start + x_slice.stop - width_px) / 2
+        dy_px = (y_slice.start + y_slice.stop - height_px) / 2
+        region_center = ObjectCenter(
+            coordinate_x_m=center.coordinate_x_m + dx_px * pixel_geometry.width_m,
+            coordinate_y_m=center.coordinate_y_m + dy_px * pixel_geometry.height_m,
+        )
+
+        return Object(
+            array=array[layer_index + (y_slice, x_slice)],
+            pixel_geometry=pixel_geometry,
+            center=region_center,
+            layer_spacing_m=layer_spacing_m,
+        )
+
+
 class ObjectFileReader(ABC):
     @abstractmethod
     def read(self, file_path: Path) -> Object:
@@ -1,13 +1,20 @@
 from __future__ import annotations
-from collections.abc import Iterable, Iterator
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from pathlib import Path
 from types import ModuleType
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeAlias, TypeVar
+import functools
+import hashlib
 import importlib
+import json
 import logging
+import os
 import pkgutil
 import re
+import site
+import sys
+import sysconfig
+import threading
 
 from .diffraction import BadPixelsFileReader, DiffractionFileReader, DiffractionFileWriter
 from .fluorescence import (
@@ -44,8 +51,7 @@ class ProductProbePositionFileReader(ProbePositionFileReader):
         self._reader = reader
 
     def read(self, file_path: Path) -> ProbePositionSequence:
-        product = self._reader.read(file_path)
-        return product.probe_positions
+        return self._reader.read_probe_positions(file_path)
 
 
 class ProductProbeFileReader(ProbeFileReader):
@@ -54,8 +60,7 @@ class ProductProbeFileReader(ProbeFileReader):
         self._reader = reader
 
     def read(self, file_path: Path) -> ProbeSequence:
-        product = self._reader.read(file_path)
-        return product.probes
+        return self._reader.read_probes(file_path)
 
 
 class ProductObjectFileReader(ObjectFileReader):
@@ -64,15 +69,24 @@ class ProductObjectFileReader(ObjectFileReader):
         self._reader = reader
 
     def read(self, file_path: Path) -> Object:
-        product = self._reader.read(file_path)
-        return product.object_
+        return self._reader.read_object(file_path)
 
 
-@dataclass(frozen=True)
 class Plugin(Generic[T]):
-    strategy: T
-    simple_name: str
-    display_name: str
+    def __init__(
+        self, strategy_loader: Callable[[], T], simple_name: str, display_name: str
+    ) -> None:
+        self._strategy_loader = strategy_loader
+        self._strategy: T | None = None
+        self.simple_name = simple_name
+        self.display_name = display_name
+
+    @property
+    def strategy(self) -> T:
+        if self._strategy is None:
+            self._strategy = self._strategy_loader()
+
+        return self._strategy
 
 
 class PluginChooser(Iterable[Plugin[T]], Observable, Observer):
@@ -86,10 +100,18 @@ class PluginChooser(Iterable[Plugin[T]], Observable, Observer):
         return ', '.join(sorted(plugin.simple_name for plugin in self._registered_plugins))
 
     def register_plugin(self, strategy: T, *, display_name: str, simple_name: str = '') -> None:
+        self.register_lazy_plugin(
+            lambda: strategy, display_name=display_name, simple_name=simple_name
+        )
+
+    def register_lazy_plugin(
+        self, strategy_loader: Callable[[], T], *, display_name: str, simple_name: str = ''
+    ) -> None:
+        """registers a plugin whose strategy is created when the plugin is first used"""
         if not simple_name:
             simple_name = re.sub(r'\W+', '', display_name)
 
-        plugin = Plugin[T](strategy, simple_name, display_name)
+        plugin = Plugin[T](strategy_loader, simple_name, display_name)
         self._registered_plugins.append(plugin)
         self._registered_plugins.sort(key=lambda x: x.display_name)
         self.notify_observers()
@@ -132,6 +154,10 @@ class PluginChooser(Iterable[Plugin[T]], Observable, Observer):
             self.set_current_plugin(self._parameter.get_value())
 
 
+# maps chooser attribute names to (simple_name, display_name) pairs
+PluginManifestEntry: TypeAlias = dict[str, list[tuple[str, str]]]
+
+
 class PluginRegistry:
     def __init__(self) -> None:
         self.bad_pixels_file_readers = PluginChooser[BadPixelsFileReader]()
@@ -170,10 +196,15 @@ class PluginRegistry:
             strategy, display_name=display_name, simple_name=simple_name
         )
 
-    @classmethod
-    def load_plugins(cls) -> PluginRegistry:
-        registry = cls()
+    def _get_choosers(self) -> dict[str, PluginChooser[Any]]:
+        return {
+            name: chooser
+            for name, chooser in vars(self).items()
+            if isinstance(chooser, PluginChooser)
+        }
 
+    @staticmethod
+    def _iter_plugin_modules() -> Iterator[pkgutil.ModuleInfo]:
         import ptychodus.plugins
 
         ns_pkg: ModuleType = ptychodus.plugins
@@ -182,19 +213,158 @@ class PluginRegistry:
         # returned name an absolute name instead of a relative one. This allows
         # import_module to work without having to do additional modification to
         # the name.
-        for module_info in pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + '.'):
+        yield from pkgutil.iter_modules(ns_pkg.__path__, ns_pkg.__name__ + '.')
+
+    @classmethod
+    def _get_manifest_key(cls) -> str:
+        """fingerprints plugin sources and installed packages to detect a stale manifest"""
+        import ptychodus.plugins
+
+        digest = hashlib.sha256(sys.version.encode())
+
+        for plugin_dir in ptychodus.plugins.__path__:
+            for file_path in sorted(Path(plugin_dir).rglob('*.py')):
+                stat_result = file_path.stat()
+                digest.update(
+                    f'{file_path}:{stat_result.st_size}:{stat_result.st_mtime_ns}'.encode()
+                )
+
+        # installing or removing optional dependencies modifies site directories
+        site_dirs = {sysconfig.get_path('purelib'), sysconfig.get_path('platlib')}
+        site_dirs.add(site.getusersitepackages())
+
+        for site_dir in sorted(site_dirs):
             try:
-                module = importlib.import_module(module_info.name)
-            except ModuleNotFoundError as exc:
-                logger.info(f'Skipping {module_info.name}')
-                logger.warning(exc)
+                digest.update(f'{site_dir}:{os.stat(site_dir).st_mtime_ns}'.encode())
+            except OSError:
+                pass
+
+        return digest.hexdigest()
+
+    @classmethod
+    def _register_module(cls, module_name: str) -> PluginRegistry | None:
+        """imports a plugin module and registers its plugins with a new registry"""
+        try:
+            module = importlib.import_module(module_name)
+        except ModuleNotFoundError as exc:
+            logger.info(f'Skipping {module_name}')
+            logger.warning(exc)
+            return None
+
+        registry = cls()
+
+        try:
+            module.register_plugins(registry)
+        except AttributeError as exc:
+            logger.info(f'Failed to register {module_name}')
+            logger.warning(exc)
+            return None
+
+        logger.info(f'Registered {module_name}')
+        return registry
+
+    def _merge(self, registry: PluginRegistry) -> PluginManifestEntry:
+        manifest_entry: PluginManifestEntry = dict()
+        choosers = self._get_choosers()
+
+        for chooser_name, chooser in registry._get_choosers().items():
+            if chooser:
+                manifest_entry[chooser_name] = [
+                    (plugin.simple_name, plugin.display_name) for plugin in chooser
+                ]
+
+            for plugin in chooser:
+                choosers[chooser_name].register_plugin(
+                    plugin.strategy,
+                    display_name=plugin.display_name,
+                    simple_name=plugin.simple_name,
+                )
+
+        return manifest_entry
+
+    @classmethod
+    def load_plugins(cls, manifest_path: Path | None = None) -> PluginRegistry:
+        """
+        registers all plugins; if a current manifest exists at manifest_path, plugin modules
+        are imported when their plugins are first used, otherwise all plugin modules are
+        imported and the manifest is written
+        """
+        registry = cls()
+        manifest_key = None if manifest_path is None else cls._get_manifest_key()
+
+        if manifest_path is not None and manifest_path.is_file():
+            try:
+                manifest = json.loads(manifest_path.read_text())
+            except (OSError, ValueError) as exc:
+                logger.warning(f'Failed to read plugin manifest "{manifest_path}": {exc}')
             else:
-                try:
-                    module.register_plugins(registry)
-                except AttributeError as exc:
-                    logger.info(f'Failed to register {module_info.name}')
-                    logger.warning(exc)
-                else:
-                    logger.info(f'Registered {module_info.name}')
+                if manifest.get('key') == manifest_key:
+                    registry._register_lazy_plugins(manifest['modules'])
+                    logger.info(f'Registered plugins from manifest "{manifest_path}"')
+                    return registry
+
+        manifest_modules: dict[str, PluginManifestEntry] = dict()
+
+        for module_info in cls._iter_plugin_modules():
+            module_registry = cls._register_module(module_info.name)
+
+            if module_registry is not None:
+                manifest_modules[module_info.name] = registry._merge(module_registry)
+
+        if manifest_path is not None:
+            # concurrent processes may share the manifest, so replace it atomically
+            tmp_manifest_path = manifest_path.with_name(f'.{manifest_path.name}.{os.getpid()}.tmp')
+
+            try:
+                manifest_path.parent.mkdir(mode=0o755, parents=True, exist_ok=True)
+                tmp_manifest_path.write_text(
+                    json.dumps({'key': manifest_key, 'modules': manifest_modules}, indent=1)
+                )
+                os.replace(tmp_manifest_path, manifest_path)
+            except OSError as exc:
+                logger.warning(f'Failed to write plugin manifest "{manifest_path}": {exc}')
+                tmp_manifest_path.unlink(missing_ok=True)
 
         return registry
+
+    def _register_lazy_plugins(self, manifest_modules: Mapping[str, PluginManifestEntry]) -> None:
+        choosers = self._get_choosers()
+
+        for module_name, manifest_entry in manifest_modules.items():
+            module_loader = _PluginModuleLoader(type(self), module_name)
+
+            for chooser_name, plugin_names in manifest_entry.items():
+                for simple_name, display_name in plugin_names:
+                    choosers[chooser_name].register_lazy_plugin(
+                        functools.partial(
+                            module_loader.get_strategy, chooser_name, simple_name, display_name
+                        ),
+                        display_name=display_name,
+                        simple_name=simple_name,
+                    )
+
+
+class _PluginModuleLoader:
+    """imports a plugin module on demand and looks up the strategies that it registers"""
+
+    def __init__(self, registry_type: type[PluginRegistry], module_name: str) -> None:
+        self._registry_type = registry_type
+        self._module_name = module_name
+        self._registry: PluginRegistry | None = None
+        self._lock = threading.Lock()
+
+    def get_strategy(self, chooser_name: str, simple_name: str, display_name: str) -> Any:
+        with self._lock:
+            if self._registry is None:
+                self._registry = self._registry_type._register_module(self._module_name)
+
+                if self._registry is None:
+                    raise RuntimeError(f'Failed to load plugin module {self._module_name}!')
+
+        chooser = self._registry._get_choosers()[chooser_name]
+
+        for plugin in chooser:
+            if plugin.simple_name == simple_name and plugin.display_name == display_name:
+                return plugin.strategy
+
+        raise RuntimeError(f'Plugin module {self._module_name} did not register "{simple_name}"!')
@@ -1,12 +1,14 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import overload
 
 import numpy
 
+from .typing import IntegerArrayType, RealArrayType
+
 
 @dataclass(frozen=True)
 class ProbePosition:
@@ -58,8 +60,27 @@ class ProbePositionSequence(Sequence[ProbePosition]):
                 coordinates_m.append(point.coordinate_y_m)
                 coordinates_m.append(point.coordinate_x_m)
 
-        self._indexes = numpy.array(indexes)
-        self._coordinates_m = numpy.reshape(coordinates_m, (-1, 2))
+        self._indexes = numpy.array(indexes, dtype=int)
+        self._coordinates_m = numpy.reshape(numpy.array(coordinates_m, dtype=float), (-1, 2))
+
+    @classmethod
+    def create_from_arrays(
+        cls, indexes: IntegerArrayType, coordinates_m: RealArrayType
+    ) -> ProbePositionSequence:
+        """creates positions from indexes with shape (N,) and (y, x) coordinates with shape (N, 2)"""
+        indexes = numpy.asarray(indexes).reshape(-1)
+        coordinates_m = numpy.asarray(coordinates_m, dtype=float).reshape(-1, 2)
+
+        if len(indexes) != len(coordinates_m):
+            raise ValueError(
+                f'Mismatched number of indexes ({len(indexes)}) '
+                f'and coordinates ({len(coordinates_m)})!'
+            )
+
+        seq = cls()
+        seq._indexes = indexes
+        seq._coordinates_m = coordinates_m
+        return seq
 
     def copy(self) -> ProbePositionSequence:
         seq = ProbePositionSequence()
@@ -67,22 +88,64 @@ class ProbePositionSequence(Sequence[ProbePosition]):
         seq._coordinates_m = self._coordinates_m.copy()
         return seq
 
+    @property
+    def indexes(self) -> IntegerArrayType:
+        return self._indexes
+
+    @property
+    def coordinates_m(self) -> RealArrayType:
+        """(y, x) coordinates with shape (N, 2)"""
+        return self._coordinates_m
+
+    @property
+    def coordinates_x_m(self) -> RealArrayType:
+        return self._coordinates_m[:, -1]
+
+    @property
+    def coordinates_y_m(self) -> RealArrayType:
+        return self._coordinates_m[:, -2]
+
+    def get_bounding_box(self) -> ScanBoundingBox | None:
+        if len(self) == 0:
+            return None
+
+        ymin_m, xmin_m = self._coordinates_m.min(axis=0)
+        ymax_m, xmax_m = self._coordinates_m.max(axis=0)
+
+        return ScanBoundingBox(
+            minimum_x_m=float(xmin_m),
+            maximum_x_m=float(xmax_m),
+            minimum_y_m=float(ymin_m),
+            maximum_y_m=float(ymax_m),
+        )
+
+    def get_length_m(self) -> float:
+        """returns the length of the path through consecutive positions"""
+        steps_m = numpy.diff(self._coordinates_m, axis=0)
+        return float(numpy.hypot(steps_m[:, 0], steps_m[:, 1]).sum())
+
     @overload
     def __getitem__(self, index: int) -> ProbePosition: ...
 
     @overload
-    def __getitem__(self, index: slice) -> Sequence[ProbePosition]: ...
+    def __getitem__(self, index: slice) -> ProbePositionSequence: ...
 
-    def __getitem__(self, index: int | slice) -> ProbePosition | Sequence[ProbePosition]:
+    def __getitem__(self, index: int | slice) -> ProbePosition | ProbePositionSequence:
         if isinstance(index, slice):
-            return [self[idx] for idx in range(index.start, index.stop, index.step)]
+            return ProbePositionSequence.create_from_arrays(
+                self._indexes[index], self._coordinates_m[index]
+            )
 
         return ProbePosition(
-            index=self._indexes[index],
-            coordinate_x_m=self._coordinates_m[index, -1],
-            coordinate_y_m=self._coordinates_m[index, -2],
+            index=int(self._indexes[index]),
+            coordinate_x_m=float(self._coordinates_m[index, -1]),
+            coordinate_y_m=float(self._coordinates_m[index, -2]),
         )
 
+    def __iter__(self) -> Iterator[ProbePosition]:
+        for index, (y_m, x_m) in zip(self._indexes.tolist(), self._coordinates_m.tolist()):
+            yield ProbePosition(index=index, coordinate_x_m=x_m, coordinate_y_m=y_m)
+
     def __len__(self) -> int:
         return self._indexes.size
 
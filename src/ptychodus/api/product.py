@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from sys import getsizeof
 
-from .object import Object
+from .object import Object, ObjectRegion
 from .probe import ProbeSequence
 from .probe_positions import ProbePositionSequence
 
@@ -81,6 +81,33 @@ class ProductFileReader(ABC):
         """reads a product from file"""
         pass
 
+    def read_metadata(self, file_path: Path) -> ProductMetadata:
+        """reads only the product metadata; readers should override the partial reads to
+        avoid loading unneeded arrays"""
+        return self.read(file_path).metadata
+
+    def read_probe_positions(self, file_path: Path) -> ProbePositionSequence:
+        """reads only the product probe positions"""
+        return self.read(file_path).probe_positions
+
+    def read_probes(self, file_path: Path) -> ProbeSequence:
+        """reads only the product probes"""
+        return self.read(file_path).probes
+
+    def read_object(self, file_path: Path, region: ObjectRegion | None = None) -> Object:
+        """reads only the product object, optionally restricted to a layer and/or region"""
+        object_ = self.read(file_path).object_
+
+        if region is None:
+            return object_
+
+        return region.select(
+            object_.get_array(),
+            object_.get_pixel_geometry(),
+            object_.get_center(),
+            object_.layer_spacing_m,
+        )
+
 
 class ProductFileWriter(ABC):
     @abstractmethod
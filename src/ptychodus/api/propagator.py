@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 from scipy.fft import fft2, fftfreq, fftshift, ifft2, ifftshift
@@ -75,12 +76,61 @@ class AngularSpectrumPropagator(Propagator):
         ratio = F2 / numpy.square(parameters.dx)
         tf = numpy.exp(i2piz * numpy.sqrt(1 - ratio))
 
-        self._transfer_function = numpy.where(ratio < 1, tf, 0)
+        # frequency coordinates are centered; transfer function must match fft2 ordering
+        self._transfer_function = ifftshift(numpy.where(ratio < 1, tf, 0))
 
     def propagate(self, wavefield: ComplexArrayType) -> ComplexArrayType:
         return fftshift(ifft2(self._transfer_function * fft2(ifftshift(wavefield))))
 
 
+class MultiplaneAngularSpectrumPropagator:
+    """angular spectrum propagator that evaluates many propagation distances in batches; the
+    frequency grid and the forward transform are computed once for all distances"""
+
+    def __init__(
+        self,
+        parameters: PropagatorParameters,
+        *,
+        max_chunk_bytes: int = 1 << 30,
+        workers: int = -1,
+    ) -> None:
+        ar = parameters.pixel_aspect_ratio
+
+        FY, FX = parameters.get_frequency_coordinates()  # noqa: N806
+        F2 = numpy.square(FX) + numpy.square(ar * FY)  # noqa: N806
+        ratio = ifftshift(F2 / numpy.square(parameters.dx))
+
+        self._is_propagating = ratio < 1
+        self._kz_per_m = (
+            2 * numpy.pi / parameters.wavelength_m * numpy.sqrt(numpy.maximum(1 - ratio, 0))
+        )
+        self._max_chunk_bytes = max_chunk_bytes
+        self._workers = workers
+
+    def propagate(
+        self, wavefield: ComplexArrayType, distance_m: Sequence[float]
+    ) -> ComplexArrayType:
+        """propagates wavefield with shape (..., height, width) to each distance; the result has
+        shape (num_distances, ..., height, width)"""
+        axes = (-2, -1)
+        spectrum = fft2(ifftshift(wavefield, axes=axes), axes=axes, workers=self._workers)
+        spectrum *= self._is_propagating
+
+        distance_m = numpy.asarray(distance_m, dtype=float)
+        propagated = numpy.empty((len(distance_m), *spectrum.shape), dtype=spectrum.dtype)
+        chunk_size = max(1, self._max_chunk_bytes // max(1, 2 * spectrum.nbytes))
+        broadcast_shape = (-1,) + (1,) * spectrum.ndim
+
+        for start in range(0, len(distance_m), chunk_size):
+            z_m = distance_m[start : start + chunk_size].reshape(broadcast_shape)
+            transfer_function = numpy.exp(1j * z_m * self._kz_per_m)
+            propagated[start : start + chunk_size] = fftshift(
+                ifft2(transfer_function * spectrum, axes=axes, workers=self._workers), axes=axes
+            )
+
+        return propagated
+
+
 class FresnelTransferFunctionPropagator(Propagator):
     def __init__(self, parameters: PropagatorParameters) -> None:
         ar = parameters.pixel_aspect_ratio
@@ -90,7 +140,7 @@ class FresnelTransferFunctionPropagator(Propagator):
         F2 = numpy.square(FX) + numpy.square(ar * FY)  # noqa: N806
         ratio = F2 / numpy.square(parameters.dx)
 
-        self._transfer_function = numpy.exp(i2piz * (1 - ratio / 2))
+        self._transfer_function = ifftshift(numpy.exp(i2piz * (1 - ratio / 2)))
 
     def propagate(self, wavefield: ComplexArrayType) -> ComplexArrayType:
         return fftshift(ifft2(self._transfer_function * fft2(ifftshift(wavefield))))
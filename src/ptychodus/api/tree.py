@@ -1,12 +1,14 @@
 from __future__ import annotations
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 
 
 class SimpleTreeNode:
     def __init__(self, parent_item: SimpleTreeNode | None, item_data: Sequence[str]) -> None:
         self.parent_item = parent_item
-        self.item_data = item_data
-        self.child_items: list[SimpleTreeNode] = list()
+        self._item_data = item_data
+        self._item_data_loader: Callable[[], Sequence[str]] | None = None
+        self._child_items: list[SimpleTreeNode] = list()
+        self._child_loader: Callable[[SimpleTreeNode], None] | None = None
 
     @classmethod
     def create_root(cls, item_data: Sequence[str]) -> SimpleTreeNode:
@@ -14,9 +16,47 @@ class SimpleTreeNode:
 
     def create_child(self, item_data: Sequence[str]) -> SimpleTreeNode:
         child_item = SimpleTreeNode(self, item_data)
-        self.child_items.append(child_item)
+        self._child_items.append(child_item)
         return child_item
 
+    @property
+    def item_data(self) -> Sequence[str]:
+        loader = self._item_data_loader
+
+        if loader is not None:
+            self._item_data_loader = None
+            self._item_data = loader()
+
+        return self._item_data
+
+    @item_data.setter
+    def item_data(self, item_data: Sequence[str]) -> None:
+        self._item_data = item_data
+        self._item_data_loader = None
+
+    def set_item_data_loader(self, loader: Callable[[], Sequence[str]]) -> None:
+        """defers computing item data until it is first requested"""
+        self._item_data_loader = loader
+
+    @property
+    def child_items(self) -> list[SimpleTreeNode]:
+        loader = self._child_loader
+
+        if loader is not None:
+            self._child_loader = None
+            loader(self)
+
+        return self._child_items
+
+    def set_child_loader(self, loader: Callable[[SimpleTreeNode], None]) -> None:
+        """defers creating children until they are first requested"""
+        self._child_loader = loader
+
+    @property
+    def may_have_children(self) -> bool:
+        """checks for children without loading them"""
+        return self._child_loader is not None or bool(self._child_items)
+
     @property
     def is_root(self) -> bool:
         return self.parent_item is None
@@ -1,14 +1,17 @@
 from __future__ import annotations
 from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
-from typing import Final
+from typing import Final, TypeAlias
 
-from scipy.stats import gaussian_kde
 import numpy
+import numpy.typing
+import scipy.signal
 
 from .geometry import Box2D, Interval, Line2D, PixelGeometry
 from .typing import NumberArrayType, RealArrayType
 
+RGBAArrayType: TypeAlias = numpy.typing.NDArray[numpy.uint8]
+
 
 @dataclass(frozen=True)
 class PlotSeries:
@@ -51,11 +54,93 @@ class LineCut:
     value: Sequence[float | complex]
 
 
+class BinnedKernelDensity:
+    """Gaussian kernel density estimate evaluated on a fixed-bin histogram. Very large
+    datasets are randomly subsampled (in proportion to their weights, if any)."""
+
+    def __init__(
+        self,
+        dataset: RealArrayType,
+        *,
+        weights: RealArrayType | None = None,
+        num_bins: int = 1024,
+        max_num_samples: int = 1 << 22,
+        seed: int = 0,
+    ) -> None:
+        dataset = numpy.ravel(dataset)
+        num_values = dataset.size
+
+        if weights is not None:
+            weights = numpy.ravel(weights)
+
+        if num_values > max_num_samples:
+            rng = numpy.random.default_rng(seed)
+
+            if weights is None:
+                indexes = rng.integers(0, num_values, size=max_num_samples)
+            else:
+                cdf = numpy.cumsum(weights)
+                indexes = numpy.searchsorted(cdf, rng.random(max_num_samples) * cdf[-1])
+                weights = None
+
+            dataset = dataset[indexes]
+            num_values = max_num_samples
+
+        value_lower = float(dataset.min())
+        value_upper = float(dataset.max())
+
+        # Scott's rule, as in scipy.stats.gaussian_kde
+        bandwidth = float(dataset.std()) * num_values ** (-1.0 / 5.0)
+
+        if bandwidth > 0.0:
+            value_lower -= 3.0 * bandwidth
+            value_upper += 3.0 * bandwidth
+        else:
+            value_lower -= 0.5
+            value_upper += 0.5
+
+        edges = numpy.linspace(value_lower, value_upper, num_bins + 1)
+        bin_width = edges[1] - edges[0]
+        counts = numpy.histogram(dataset, bins=edges, weights=weights)[0].astype(float)
+        sigma_bins = bandwidth / bin_width
+
+        if sigma_bins > 0.5:
+            half_width = min(int(numpy.ceil(4.0 * sigma_bins)), num_bins)
+            offsets = numpy.arange(-half_width, half_width + 1)
+            kernel = numpy.exp(-0.5 * (offsets / sigma_bins) ** 2)
+            kernel /= kernel.sum()
+            counts = scipy.signal.fftconvolve(counts, kernel, mode='same')
+            numpy.clip(counts, 0.0, None, out=counts)
+
+        total = counts.sum()
+        self._centers = (edges[:-1] + edges[1:]) / 2.0
+        self._density = counts / (total * bin_width) if total > 0 else numpy.zeros_like(counts)
+
+    def __call__(self, points: RealArrayType) -> RealArrayType:
+        return numpy.interp(points, self._centers, self._density, left=0.0, right=0.0)
+
+
 @dataclass(frozen=True)
 class KernelDensityEstimate:
     value_lower: float
     value_upper: float
-    kde: gaussian_kde
+    kde: BinnedKernelDensity
+
+
+@dataclass(frozen=True)
+class VisualizationTile:
+    """rendered tile of a level-of-detail pyramid; each tile pixel spans 2**level array
+    pixels and the box is the tile extent in full-resolution array pixel coordinates"""
+
+    level: int
+    row: int
+    column: int
+    box: Box2D
+    rgba: RGBAArrayType
+
+    @property
+    def scale(self) -> int:
+        return 1 << self.level
 
 
 class VisualizationProduct:
@@ -65,20 +150,27 @@ class VisualizationProduct:
         self,
         value_label: str,
         values: NumberArrayType,
-        rgba: RealArrayType,
+        rgba: RGBAArrayType | None,
         pixel_geometry: PixelGeometry,
     ) -> None:
+        """rgba may be None when the image is rendered on demand as tiles"""
         if values.ndim != 2:
             raise ValueError(f'Values must be a 2-dimensional ndarray (actual={values.ndim}).')
 
-        if rgba.ndim != 3:
-            raise ValueError(f'RGBA must be a 3-dimensional ndarray (actual={rgba.ndim}).')
+        if rgba is not None:
+            if rgba.ndim != 3:
+                raise ValueError(f'RGBA must be a 3-dimensional ndarray (actual={rgba.ndim}).')
+
+            if rgba.shape[2] != 4:
+                raise ValueError(
+                    f'RGBA final dimension must have length=4 (actual={rgba.shape[2]}).'
+                )
 
-        if rgba.shape[2] != 4:
-            raise ValueError(f'RGBA final dimension must have length=4 (actual={rgba.shape[2]}).')
+            if rgba.dtype != numpy.uint8:
+                raise ValueError(f'RGBA must have dtype=uint8 (actual={rgba.dtype}).')
 
-        if values.shape[0] != rgba.shape[0] or values.shape[1] != rgba.shape[1]:
-            raise ValueError(f'Shape mismatch (values={values.shape} and rgba={rgba.shape}).')
+            if values.shape[0] != rgba.shape[0] or values.shape[1] != rgba.shape[1]:
+                raise ValueError(f'Shape mismatch (values={values.shape} and rgba={rgba.shape}).')
 
         self._value_label = value_label
         self._values = values
@@ -92,7 +184,7 @@ class VisualizationProduct:
     def get_values(self) -> NumberArrayType:
         return self._values
 
-    def get_image_rgba(self) -> RealArrayType:
+    def get_image_rgba(self) -> RGBAArrayType | None:
         return self._rgba
 
     def get_pixel_geometry(self) -> PixelGeometry:
@@ -198,11 +290,10 @@ class VisualizationProduct:
         y_begin = y_range.clamp(int(box.y_begin))
         y_end = y_range.clamp(int(box.y_end) + 1)
 
-        values = self._values[..., y_begin:y_end, x_begin:x_end]
-        values = values.reshape(values.shape[-3], -1) if values.ndim > 2 else values.reshape(-1)
+        values = self._values[y_begin:y_end, x_begin:x_end].ravel()
 
         if numpy.iscomplexobj(values):
             # TODO improve KDE for complex values
             values = numpy.absolute(values)
 
-        return KernelDensityEstimate(values.min(), values.max(), gaussian_kde(values))
+        return KernelDensityEstimate(values.min(), values.max(), BinnedKernelDensity(values))
@@ -71,6 +71,18 @@ class SimpleTreeModel(QAbstractItemModel):
             node = index.internalPointer()
             return node.data(index.column())
 
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:  # noqa: N802
+        if parent.column() > 0:
+            return False
+
+        node = self._root_node
+
+        if parent.isValid():
+            node = parent.internalPointer()
+
+        # avoid loading children of lazy nodes until they are expanded
+        return node.may_have_children
+
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
         if parent.column() > 0:
             return 0
@@ -18,6 +18,7 @@ class FourierRingCorrelationViewController:
         self._dialog.product1_combo_box.textActivated.connect(self._redraw_plot)
         self._dialog.product2_combo_box.setModel(tree_model)
         self._dialog.product2_combo_box.textActivated.connect(self._redraw_plot)
+        self._dialog.apodization_spin_box.valueChanged.connect(self._redraw_plot)
 
     def analyze(self, item_index1: int, item_index2: int) -> None:
         self._dialog.product1_combo_box.setCurrentIndex(item_index1)
@@ -33,7 +34,10 @@ class FourierRingCorrelationViewController:
             logger.warning('Invalid item index for FRC!')
             return
 
-        frc = self._correlator.correlate(current_index1, current_index2)
+        apodization_fraction = self._dialog.apodization_spin_box.value()
+        frc = self._correlator.correlate(
+            current_index1, current_index2, apodization_fraction=apodization_fraction
+        )
         plot2d = frc.get_plot()
         axis_x = plot2d.axis_x
         axis_y = plot2d.axis_y
@@ -52,7 +56,7 @@ class FourierRingCorrelationViewController:
         else:
             logger.warning('Failed to broadcast plot series!')
 
-        if len(axis_x.series) > 1:
+        if len(axis_y.series) > 1:
             ax.legend(loc='upper right')
 
         self._dialog.figure_canvas.draw()
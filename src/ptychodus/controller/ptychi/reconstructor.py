@@ -140,6 +140,10 @@ class PtyChiReconstructorViewController(ParameterViewController):
         self._num_sync_epochs_view_controller = SpinBoxParameterViewController(
             settings.num_sync_epochs, tool_tip='Number of epochs between updates'
         )
+        self._sync_preview_size_view_controller = SpinBoxParameterViewController(
+            settings.sync_preview_size,
+            tool_tip='Maximum object size (in pixels) transferred for intermediate updates; zero transfers the full object',
+        )
         self._batch_size_view_controller = SpinBoxParameterViewController(
             settings.batch_size, tool_tip='Number of data to process in each minibatch'
         )
@@ -197,6 +201,7 @@ class PtyChiReconstructorViewController(ParameterViewController):
         layout = QFormLayout()
         layout.addRow('Number of Epochs:', self._num_epochs_view_controller.get_widget())
         layout.addRow('Update Interval:', self._num_sync_epochs_view_controller.get_widget())
+        layout.addRow('Preview Size:', self._sync_preview_size_view_controller.get_widget())
 
         if dm_settings is None:
             layout.addRow('Batch Size:', self._batch_size_view_controller.get_widget())
@@ -4,7 +4,7 @@ from collections.abc import Iterable, Sequence
 import logging
 
 from PyQt5.QtCore import Qt, QAbstractItemModel
-from PyQt5.QtWidgets import QActionGroup, QLabel, QWidget
+from PyQt5.QtWidgets import QActionGroup, QDialogButtonBox, QLabel, QWidget
 
 from ptychodus.api.observer import Observable, Observer
 from ptychodus.api.product import LossValue
@@ -44,7 +44,10 @@ class ReconstructorViewControllerFactory(ABC):
 
 class ReconstructorProgressController(Observer):
     def __init__(
-        self, monitor: ReconstructorProgressMonitor, dialog: ReconstructorProgressDialog
+        self,
+        monitor: ReconstructorProgressMonitor,
+        presenter: ReconstructorPresenter,
+        dialog: ReconstructorProgressDialog,
     ) -> None:
         super().__init__()
         self._monitor = monitor
@@ -56,6 +59,8 @@ class ReconstructorProgressController(Observer):
             Qt.WindowType.Window | Qt.WindowType.WindowTitleHint | Qt.WindowType.CustomizeWindowHint
         )
         dialog.text_edit.setReadOnly(True)
+        # cancels running and queued reconstructions
+        dialog.rejected.connect(presenter.cancel_reconstructions)
 
         self._sync_model_to_view()
         monitor.add_observer(self)
@@ -63,8 +68,11 @@ class ReconstructorProgressController(Observer):
     def _sync_model_to_view(self) -> None:
         is_reconstructing = self._monitor.is_reconstructing
 
+        # only cancel is available while reconstructing
         for button in self._dialog.button_box.buttons():
-            button.setEnabled(not is_reconstructing)
+            role = self._dialog.button_box.buttonRole(button)
+            is_cancel = role == QDialogButtonBox.ButtonRole.RejectRole
+            button.setEnabled(is_cancel or not is_reconstructing)
 
         for text in self._monitor.message_log():
             self._dialog.text_edit.appendPlainText(text)
@@ -122,7 +130,7 @@ class ReconstructorController(ProductRepositoryObserver, Observer):
         view.parameters_view.product_combo_box.setModel(product_table_model)
 
         self._progress_controller = ReconstructorProgressController(
-            progress_monitor, view.progress_dialog
+            progress_monitor, presenter, view.progress_dialog
         )
 
         open_model_action = view.parameters_view.reconstructor_menu.addAction('Open Model...')
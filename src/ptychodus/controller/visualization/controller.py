@@ -46,6 +46,7 @@ class VisualizationController(Observer):
         item_signals = ImageItemSignals()
         item_signals.line_cut_finished.connect(self._analyze_line_cut)
         item_signals.rectangle_finished.connect(self._analyze_region)
+        item_signals.moved.connect(self._update_tiles)
 
         self._item = ImageItem(item_signals, status_bar)
         engine.add_observer(self)
@@ -56,6 +57,7 @@ class VisualizationController(Observer):
 
         view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        view.viewport_changed.connect(self._update_tiles)
 
     def get_item(self) -> ImageItem:
         return self._item
@@ -77,10 +79,39 @@ class VisualizationController(Observer):
                 ExceptionDialog.show_exception('Renderer', err)
             else:
                 self._item.set_product(product)
+                self._update_tiles()
         else:
             logger.warning('Array contains infinite or NaN values!')
             self._item.clear_product()
 
+    def _update_tiles(self) -> None:
+        product = self._item.get_product()
+
+        if product is None or not self._item.is_tiled():
+            return
+
+        viewport = self._view.viewport()
+
+        if viewport is None:
+            return
+
+        scene_rect = self._view.mapToScene(viewport.rect()).boundingRect()
+        item_rect = self._item.mapRectFromScene(scene_rect)
+        box = Box2D(
+            x=item_rect.x(),
+            y=item_rect.y(),
+            width=item_rect.width(),
+            height=item_rect.height(),
+        )
+        zoom = viewport.width() / scene_rect.width() if scene_rect.width() > 0 else 1.0
+
+        try:
+            tiles = self._engine.render_tiles(product.get_values(), box, zoom)
+        except ValueError as err:
+            logger.exception(err)
+        else:
+            self._item.set_tiles(tiles)
+
     def clear_array(self) -> None:
         self._item.clear_product()
 
@@ -93,7 +124,8 @@ class VisualizationController(Observer):
         )
 
         if file_path:
-            pixmap = self._item.pixmap()
+            # tiled images are only rendered where visible, so save what is on screen
+            pixmap = self._view.grab() if self._item.is_tiled() else self._item.pixmap()
             pixmap.save(str(file_path))
 
     def _analyze_line_cut(self, line: QLineF) -> None:
@@ -169,6 +201,7 @@ class VisualizationController(Observer):
         bounding_rect = scene.itemsBoundingRect()
         scene.setSceneRect(bounding_rect)
         self._view.fitInView(scene.sceneRect(), Qt.AspectRatioMode.KeepAspectRatio)
+        self._update_tiles()
 
     def rerender_image(self, *, autoscale_color_axis: bool = False) -> None:
         product = self._item.get_product()
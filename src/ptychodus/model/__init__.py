@@ -1,5 +1,6 @@
-from .core import ModelCore
+from .core import ModelCore, PtychodusStreamingContext
 
 __all__ = [
     'ModelCore',
+    'PtychodusStreamingContext',
 ]
@@ -66,16 +66,12 @@ class AffineTransformEstimator(Observable):
         self._repository = repository
 
     def _preprocess_coordinates(self, product_indexes: Sequence[int]) -> PreprocessedCoordinates:
-        coordinate_list: list[float] = []
-
-        for product_index in product_indexes:
-            positions = self._repository[product_index].get_probe_positions()
-
-            for point in positions:
-                coordinate_list.append(point.coordinate_y_m)
-                coordinate_list.append(point.coordinate_x_m)
-
-        coordinates = numpy.reshape(coordinate_list, (-1, 2))
+        coordinates = numpy.concatenate(
+            [
+                self._repository[product_index].get_probe_positions().coordinates_m
+                for product_index in product_indexes
+            ]
+        )
 
         # robust centroid estimation
         centroid_x = estimate_mean_hodges_lehman(coordinates[:, -1])
@@ -1,12 +1,14 @@
 from __future__ import annotations
-from collections.abc import Sequence
 from dataclasses import dataclass
+from typing import Final
 import logging
 
 import numpy
 import scipy.fft
+import scipy.signal
 
-from ptychodus.api.typing import ComplexArrayType, IntegerArrayType
+from ptychodus.api.geometry import PixelGeometry
+from ptychodus.api.typing import ComplexArrayType, IntegerArrayType, RealArrayType
 from ptychodus.api.visualization import Plot2D, PlotAxis, PlotSeries
 
 from ..product import ObjectRepository
@@ -16,41 +18,138 @@ logger = logging.getLogger(__name__)
 
 @dataclass(frozen=True)
 class FourierRingCorrelation:
-    spatial_frequency_per_m: Sequence[float]
-    correlation: Sequence[float]
+    spatial_frequency_per_m: RealArrayType
+    correlation: RealArrayType  # shape = (num_layers, num_rings)
+    one_bit_threshold: RealArrayType
+    half_bit_threshold: RealArrayType
 
-    def get_resolution_m(self, threshold: float) -> float:
-        # TODO threshold from bits
-        for freq_rm, frc in zip(self.spatial_frequency_per_m, self.correlation):
-            if frc < threshold:
-                return 1.0 / freq_rm
+    @property
+    def num_layers(self) -> int:
+        return self.correlation.shape[0]
+
+    def get_resolution_m(self, threshold: float | RealArrayType, layer: int = 0) -> float:
+        below_threshold = self.correlation[layer] < threshold
+
+        if numpy.any(below_threshold):
+            freq_rm = self.spatial_frequency_per_m[numpy.argmax(below_threshold)]
+            return 1.0 / freq_rm
 
         return numpy.nan
 
+    def get_one_bit_resolution_m(self, layer: int = 0) -> float:
+        return self.get_resolution_m(self.one_bit_threshold, layer)
+
+    def get_half_bit_resolution_m(self, layer: int = 0) -> float:
+        return self.get_resolution_m(self.half_bit_threshold, layer)
+
     def get_plot(self) -> Plot2D:
         freq_series = PlotSeries('freq', [1.0e-9 * freq for freq in self.spatial_frequency_per_m])
-        frc_series = PlotSeries('frc', self.correlation)
+        frc_series_list: list[PlotSeries] = list()
+
+        for layer, correlation in enumerate(self.correlation):
+            label = 'frc' if self.num_layers == 1 else f'frc (layer {layer})'
+            frc_series_list.append(PlotSeries(label, correlation.tolist()))
+
+        frc_series_list.append(PlotSeries('1-bit', self.one_bit_threshold.tolist()))
+        frc_series_list.append(PlotSeries('1/2-bit', self.half_bit_threshold.tolist()))
 
         return Plot2D(
             axis_x=PlotAxis('Spatial Frequency [1/nm]', [freq_series]),
-            axis_y=PlotAxis('Fourier Ring Correlation', [frc_series]),
+            axis_y=PlotAxis('Fourier Ring Correlation', frc_series_list),
+        )
+
+
+@dataclass(frozen=True)
+class FourierRings:
+    rings: IntegerArrayType  # flattened ring index for each pixel
+    num_pixels_per_ring: IntegerArrayType
+    spatial_frequency_per_m: RealArrayType
+
+    @classmethod
+    def create(cls, height_px: int, width_px: int, pixel_geometry: PixelGeometry) -> FourierRings:
+        x_rm = scipy.fft.fftfreq(width_px, d=pixel_geometry.width_m)
+        y_rm = scipy.fft.fftfreq(height_px, d=pixel_geometry.height_m)
+        radial_bin_size_per_m = max(x_rm[1], y_rm[1])
+
+        rr_rm = numpy.hypot(x_rm[numpy.newaxis, :], y_rm[:, numpy.newaxis])
+        rings = numpy.divide(rr_rm, radial_bin_size_per_m).astype(numpy.intp).ravel()
+        num_pixels_per_ring = numpy.bincount(rings)
+
+        return cls(
+            rings=rings,
+            num_pixels_per_ring=num_pixels_per_ring,
+            spatial_frequency_per_m=numpy.arange(len(num_pixels_per_ring)) * radial_bin_size_per_m,
         )
 
+    @property
+    def num_rings(self) -> int:
+        return len(self.num_pixels_per_ring)
+
+    def integrate(self, array: RealArrayType) -> RealArrayType:
+        """sums each layer of a real-valued array over rings"""
+        return numpy.stack(
+            [
+                numpy.bincount(self.rings, weights=layer.ravel(), minlength=self.num_rings)
+                for layer in array.reshape(-1, *array.shape[-2:])
+            ]
+        )
+
+    def get_threshold(self, snr: float) -> RealArrayType:
+        """
+        See: Marin van Heel and Michael Schatz, "Fourier shell correlation threshold criteria,"
+        J. Struct. Biol. 151, 250-262 (2005)
+        """
+        sqrt_snr = numpy.sqrt(snr)
+        sqrt_n = numpy.sqrt(numpy.maximum(self.num_pixels_per_ring, 1))
+        numerator = snr + (2 * sqrt_snr + 1) / sqrt_n
+        denominator = 1 + snr + 2 * sqrt_snr / sqrt_n
+        return numerator / denominator
+
 
 class FourierRingCorrelator:
+    MAX_CACHED_RINGS: Final[int] = 4
+    # signal-to-noise ratios per half dataset for the 1-bit and 1/2-bit information criteria
+    ONE_BIT_SNR: Final[float] = 0.5
+    HALF_BIT_SNR: Final[float] = (numpy.sqrt(2.0) - 1.0) / 2.0
+
     def __init__(self, repository: ObjectRepository) -> None:
         self._repository = repository
+        self._rings_cache: dict[tuple[int, int, PixelGeometry], FourierRings] = dict()
 
-    @staticmethod
-    def _integrate_rings(rings: IntegerArrayType, array: ComplexArrayType) -> ComplexArrayType:
-        total = numpy.zeros(numpy.max(rings) + 1, dtype=complex)
+    def _get_rings(
+        self, height_px: int, width_px: int, pixel_geometry: PixelGeometry
+    ) -> FourierRings:
+        key = (height_px, width_px, pixel_geometry)
+
+        try:
+            return self._rings_cache[key]
+        except KeyError:
+            pass
 
-        for index, value in zip(rings.flat, array.flat):
-            total[index] += value
+        if len(self._rings_cache) >= self.MAX_CACHED_RINGS:
+            self._rings_cache.pop(next(iter(self._rings_cache)))
 
-        return total
+        rings = FourierRings.create(height_px, width_px, pixel_geometry)
+        self._rings_cache[key] = rings
+        return rings
 
-    def correlate(self, product_index_1: int, product_index_2: int) -> FourierRingCorrelation:
+    @staticmethod
+    def _apodize(array: ComplexArrayType, fraction: float) -> ComplexArrayType:
+        """applies a soft-edged (Tukey) mask; fraction is the tapered portion of each axis"""
+        if fraction <= 0.0:
+            return array
+
+        window_x = scipy.signal.windows.tukey(array.shape[-1], alpha=fraction)
+        window_y = scipy.signal.windows.tukey(array.shape[-2], alpha=fraction)
+        return array * numpy.outer(window_y, window_x)
+
+    def correlate(
+        self,
+        product_index_1: int,
+        product_index_2: int,
+        *,
+        apodization_fraction: float = 0.0,
+    ) -> FourierRingCorrelation:
         """
         See: Joan Vila-Comamala, Ana Diaz, Manuel Guizar-Sicairos, Alexandre Mantion,
         Cameron M. Kewish, Andreas Menzel, Oliver Bunk, and Christian David,
@@ -61,44 +160,40 @@ class FourierRingCorrelator:
         object1 = self._repository[product_index_1].get_object()
         object2 = self._repository[product_index_2].get_object()
 
-        # TODO support multilayer objects
-        array1 = object1.get_layer(0)
-        array2 = object2.get_layer(0)
-
-        if numpy.ndim(array1) != 2 or numpy.ndim(array2) != 2:
-            raise ValueError('Arrays must be 2D!')
+        array1 = object1.get_array()
+        array2 = object2.get_array()
 
         if numpy.shape(array1) != numpy.shape(array2):
             raise ValueError('Arrays must have same shape!')
 
         # TODO verify compatible pixel geometry
         pixel_geometry = object2.get_pixel_geometry()
+        height_px, width_px = array1.shape[-2:]
+        rings = self._get_rings(height_px, width_px, pixel_geometry)
 
         # TODO subpixel image registration: skimage.registration.phase_cross_correlation
         # TODO remove phase offset and ramp
-        # TODO apply soft-edged mask
         # TODO stats: SSNR, area under FRC curve, average SNR, etc.
 
-        x_rm = scipy.fft.fftfreq(array1.shape[-1], d=pixel_geometry.width_m)
-        y_rm = scipy.fft.fftfreq(array1.shape[-2], d=pixel_geometry.height_m)
-        radial_bin_size_per_m = max(x_rm[1], y_rm[1])
-
-        xx_rm, yy_rm = numpy.meshgrid(x_rm, y_rm)
-        rr_rm = numpy.hypot(xx_rm, yy_rm)
-
-        rings = numpy.divide(rr_rm, radial_bin_size_per_m).astype(int)
-        spatial_frequency_per_m = numpy.arange(numpy.max(rings) + 1) * radial_bin_size_per_m
+        sf1 = scipy.fft.fft2(self._apodize(array1, apodization_fraction), workers=-1)
+        sf2 = scipy.fft.fft2(self._apodize(array2, apodization_fraction), workers=-1)
 
-        sf1 = scipy.fft.fft2(array1)
-        sf2 = scipy.fft.fft2(array2)
+        sf12 = numpy.multiply(sf1, numpy.conj(sf2))
+        c12_real = rings.integrate(sf12.real)
+        c12_imag = rings.integrate(sf12.imag)
+        del sf12
 
-        c11 = self._integrate_rings(rings, numpy.multiply(sf1, numpy.conj(sf1)))
-        c12 = self._integrate_rings(rings, numpy.multiply(sf1, numpy.conj(sf2)))
-        c22 = self._integrate_rings(rings, numpy.multiply(sf2, numpy.conj(sf2)))
+        c11 = rings.integrate(numpy.square(numpy.absolute(sf1)))
+        c22 = rings.integrate(numpy.square(numpy.absolute(sf2)))
 
-        correlation = numpy.absolute(c12) / numpy.sqrt(numpy.absolute(numpy.multiply(c11, c22)))
+        correlation = numpy.hypot(c12_real, c12_imag) / numpy.sqrt(numpy.multiply(c11, c22))
 
         # TODO replace NaNs with interpolated values
 
-        rnyquist = numpy.min(array1.shape) // 2 + 1
-        return FourierRingCorrelation(spatial_frequency_per_m[:rnyquist], correlation[:rnyquist])
+        rnyquist = min(height_px, width_px) // 2 + 1
+        return FourierRingCorrelation(
+            spatial_frequency_per_m=rings.spatial_frequency_per_m[:rnyquist],
+            correlation=correlation[:, :rnyquist],
+            one_bit_threshold=rings.get_threshold(self.ONE_BIT_SNR)[:rnyquist],
+            half_bit_threshold=rings.get_threshold(self.HALF_BIT_SNR)[:rnyquist],
+        )
@@ -2,7 +2,7 @@ from __future__ import annotations
 from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Final
 import logging
 
 import numpy
@@ -62,6 +62,8 @@ class IlluminationMap:
 
 
 class IlluminationMapper(Observable):
+    OPR_CHUNK_SIZE: Final[int] = 256
+
     def __init__(self, repository: ProductRepository) -> None:
         super().__init__()
         self._repository = repository
@@ -87,12 +89,35 @@ class IlluminationMapper(Observable):
             numpy.zeros((object_geometry.height_px, object_geometry.width_px))
         )
 
-        for scan_point, probe in zip(product.probe_positions, product.probes):
-            object_point = object_geometry.map_coordinates_probe_to_object(scan_point)
-            stitcher.add_patch(
-                object_point.coordinate_x_px,
-                object_point.coordinate_y_px,
-                probe.get_intensity(),
+        object_coordinates_px = object_geometry.map_coordinates_probe_to_object_array(
+            product.probe_positions.coordinates_m
+        )
+        centers_x = object_coordinates_px[:, -1]
+        centers_y = object_coordinates_px[:, -2]
+        num_points = len(object_coordinates_px)
+
+        if len(product.probes) == 1:
+            probe_intensity = product.probes[0].get_intensity()
+            stitcher.add_patches(
+                centers_x,
+                centers_y,
+                numpy.broadcast_to(probe_intensity, (num_points, *probe_intensity.shape)),
+            )
+        elif len(product.probes) == num_points:
+            # stitch position-dependent (OPR) probes in chunks to bound memory use
+            for start in range(0, num_points, self.OPR_CHUNK_SIZE):
+                stop = min(start + self.OPR_CHUNK_SIZE, num_points)
+                stitcher.add_patches(
+                    centers_x[start:stop],
+                    centers_y[start:stop],
+                    numpy.stack(
+                        [product.probes[idx].get_intensity() for idx in range(start, stop)]
+                    ),
+                )
+        else:
+            raise ValueError(
+                f'Number of probes ({len(product.probes)}) does not match '
+                f'number of positions ({num_points})!'
             )
 
         self._product_data = IlluminationMap(
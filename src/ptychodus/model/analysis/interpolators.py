@@ -1,5 +1,9 @@
+from __future__ import annotations
+from dataclasses import dataclass
 from typing import Generic, TypeVar
+import concurrent.futures
 import logging
+import math
 
 from numpy.typing import NDArray
 import numpy
@@ -19,10 +23,17 @@ logger = logging.getLogger(__name__)
 
 def calculate_support_frac(x: float, n: int) -> tuple[slice, float]:
     lower = x - n / 2
-    whole = int(lower)
+    whole = math.floor(lower)
     return slice(whole, whole + n + 1), lower - whole
 
 
+def _clip_support(support: slice, size: int) -> tuple[slice, slice]:
+    """returns the overlap of a support with an axis of length size (axis slice, support slice)"""
+    lower = min(max(support.start, 0), size)
+    upper = max(min(support.stop, size), lower)
+    return slice(lower, upper), slice(max(0, lower - support.start), max(0, upper - support.start))
+
+
 class NearestNeighborArrayInterpolator(Generic[InexactDType]):
     def __init__(self, array: NDArray[InexactDType]) -> None:
         super().__init__()
@@ -71,6 +82,31 @@ class BarycentricArrayInterpolator(Generic[InexactDType]):
         return patch  # type: ignore
 
 
+@dataclass(frozen=True)
+class _StitchedBand:
+    """accumulated patch updates for the bounding box of a chunk of patches in each layer"""
+
+    row_lower: int
+    column_lower: int
+    upper: NDArray  # shape = (num_layers, band_height, band_width)
+    lower: RealArrayType | None
+
+    def _add_to_layers(self, array: NDArray, updates: NDArray) -> None:
+        rows = slice(self.row_lower, self.row_lower + updates.shape[-2])
+        columns = slice(self.column_lower, self.column_lower + updates.shape[-1])
+        layers = array.reshape(-1, *array.shape[-2:])
+        layers[:, rows, columns] += updates
+
+        if not numpy.may_share_memory(layers, array):
+            array[...] = layers.reshape(array.shape)
+
+    def add_to(self, upper: NDArray, lower: RealArrayType | None) -> None:
+        self._add_to_layers(upper, self.upper)
+
+        if lower is not None and self.lower is not None:
+            self._add_to_layers(lower, self.lower)
+
+
 class BarycentricArrayStitcher(Generic[InexactDType]):
     def __init__(self, upper: NDArray[InexactDType], lower: RealArrayType | None = None) -> None:
         super().__init__()
@@ -110,21 +146,164 @@ class BarycentricArrayStitcher(Generic[InexactDType]):
         weight10 = y_frac * x_frac_c
         weight11 = y_frac * x_frac
 
+        # clip supports so that patches may overhang the edges of the array
+        array_height, array_width = self._upper.shape[-2:]
+        y_array, y_patch = _clip_support(y_support, array_height)
+        x_array, x_patch = _clip_support(x_support, array_width)
+
+        def spread(patch: NDArray) -> NDArray:
+            support = numpy.zeros(
+                (*patch.shape[:-2], patch.shape[-2] + 1, patch.shape[-1] + 1), dtype=patch.dtype
+            )
+            support[..., :-1, :-1] += weight00 * patch
+            support[..., :-1, 1:] += weight01 * patch
+            support[..., 1:, :-1] += weight10 * patch
+            support[..., 1:, 1:] += weight11 * patch
+            return support[..., y_patch, x_patch]
+
         # add patch update to upper array support
         uvalue = value if weight is None else weight * value
-        usupport = self._upper[..., y_support, x_support]
-        usupport[..., :-1, :-1] = usupport[..., :-1, :-1] + weight00 * uvalue
-        usupport[..., :-1, 1:] = usupport[..., :-1, 1:] + weight01 * uvalue
-        usupport[..., 1:, :-1] = usupport[..., 1:, :-1] + weight10 * uvalue
-        usupport[..., 1:, 1:] = usupport[..., 1:, 1:] + weight11 * uvalue
+        self._upper[..., y_array, x_array] += spread(uvalue)
 
         if self._lower is not None and weight is not None:
             # add patch update to lower array support
-            lsupport = self._lower[..., y_support, x_support]
-            lsupport[..., :-1, :-1] += weight00 * weight
-            lsupport[..., :-1, 1:] += weight01 * weight
-            lsupport[..., 1:, :-1] += weight10 * weight
-            lsupport[..., 1:, 1:] += weight11 * weight
+            self._lower[..., y_array, x_array] += spread(weight)
+
+    def add_patches(
+        self,
+        centers_x: RealArrayType,
+        centers_y: RealArrayType,
+        values: NDArray[InexactDType],
+        weights: RealArrayType | None = None,
+        *,
+        max_chunk_size: int = 1 << 16,
+        max_workers: int = 1,
+    ) -> None:
+        """adds a batch of patches with shape (num_patches, ..., height, width);
+        patch pixels that fall outside of the stitched array are ignored"""
+        if numpy.iscomplexobj(self._upper) != numpy.iscomplexobj(values):
+            raise ValueError(f'Mismatched value dtypes! ({self._upper.dtype} != {values.dtype})')
+
+        if weights is not None:
+            if self._lower is None:
+                raise ValueError('Provided weights without a lower array!')
+
+            if values.shape != weights.shape:
+                raise ValueError(f'Mismatched patch shapes! ({values.shape=} != {weights.shape=})')
+
+        num_patches = values.shape[0]
+
+        if centers_x.shape != (num_patches,) or centers_y.shape != (num_patches,):
+            raise ValueError(f'Expected {num_patches} patch centers!')
+
+        # visit patches in raster order so that each chunk updates a compact bounding box
+        order = numpy.lexsort((centers_x, centers_y))
+
+        # number of patches per chunk so that each chunk has about max_chunk_size elements
+        patch_size = (values.shape[-2] + 1) * (values.shape[-1] + 1)
+        chunk_size = max(1, max_chunk_size // patch_size)
+        chunks = [order[start : start + chunk_size] for start in range(0, num_patches, chunk_size)]
+
+        def stitch_chunk(chunk: NDArray) -> _StitchedBand | None:
+            return self._stitch_chunk(
+                centers_x[chunk],
+                centers_y[chunk],
+                values[chunk],
+                None if weights is None else weights[chunk],
+            )
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for band in executor.map(stitch_chunk, chunks):
+                if band is not None:
+                    band.add_to(self._upper, self._lower)
+
+    def _stitch_chunk(
+        self,
+        centers_x: RealArrayType,
+        centers_y: RealArrayType,
+        values: NDArray[InexactDType],
+        weights: RealArrayType | None,
+    ) -> _StitchedBand | None:
+        num_patches = values.shape[0]
+        patch_height, patch_width = values.shape[-2:]
+        array_height, array_width = self._upper.shape[-2:]
+        layer_shape = self._upper.shape[:-2]
+
+        x_lower = centers_x - patch_width / 2
+        x_whole = numpy.floor(x_lower).astype(int)
+        x_frac = x_lower - x_whole
+
+        y_lower = centers_y - patch_height / 2
+        y_whole = numpy.floor(y_lower).astype(int)
+        y_frac = y_lower - y_whole
+
+        # patch supports are one pixel larger than the patches in each direction
+        rows = y_whole[:, numpy.newaxis] + numpy.arange(patch_height + 1)
+        cols = x_whole[:, numpy.newaxis] + numpy.arange(patch_width + 1)
+        valid_rows = numpy.logical_and(rows >= 0, rows < array_height)
+        valid_cols = numpy.logical_and(cols >= 0, cols < array_width)
+        valid = valid_rows[:, :, numpy.newaxis] & valid_cols[:, numpy.newaxis, :]
+
+        if not numpy.any(valid):
+            return None
+
+        # accumulate into the bounding box of the valid pixels rather than whole rows
+        row_lower = rows[valid_rows].min()
+        column_lower = cols[valid_cols].min()
+        band_height = rows[valid_rows].max() + 1 - row_lower
+        band_width = cols[valid_cols].max() + 1 - column_lower
+        band_size = band_height * band_width
+        indexes = (
+            (rows[:, :, numpy.newaxis] - row_lower) * band_width
+            + (cols[:, numpy.newaxis, :] - column_lower)
+        )[valid]
+
+        # barycentric interpolant weights with shape (num_patches, 1, 1, 1)
+        x_frac = x_frac.reshape(-1, 1, 1, 1)
+        x_frac_c = 1.0 - x_frac
+        y_frac = y_frac.reshape(-1, 1, 1, 1)
+        y_frac_c = 1.0 - y_frac
+
+        def accumulate(patches: NDArray) -> NDArray:
+            # broadcast patches to shape (num_patches, num_layers, patch_height, patch_width)
+            missing_layer_axes = (1,) * (len(layer_shape) + 3 - patches.ndim)
+            patches = patches.reshape(num_patches, *missing_layer_axes, *patches.shape[1:])
+            patches = numpy.broadcast_to(
+                patches, (num_patches, *layer_shape, patch_height, patch_width)
+            ).reshape(num_patches, -1, patch_height, patch_width)
+
+            support = numpy.zeros(
+                (num_patches, patches.shape[1], patch_height + 1, patch_width + 1),
+                dtype=patches.dtype,
+            )
+            support[..., :-1, :-1] += y_frac_c * x_frac_c * patches
+            support[..., :-1, 1:] += y_frac_c * x_frac * patches
+            support[..., 1:, :-1] += y_frac * x_frac_c * patches
+            support[..., 1:, 1:] += y_frac * x_frac * patches
+
+            band_list: list[NDArray] = list()
+
+            for layer_index in range(support.shape[1]):
+                updates = support[:, layer_index][valid]
+
+                if numpy.iscomplexobj(updates):
+                    band = numpy.bincount(indexes, weights=updates.real, minlength=band_size)
+                    band = band + 1j * numpy.bincount(
+                        indexes, weights=updates.imag, minlength=band_size
+                    )
+                else:
+                    band = numpy.bincount(indexes, weights=updates, minlength=band_size)
+
+                band_list.append(band)
+
+            return numpy.stack(band_list).reshape(-1, band_height, band_width)
+
+        return _StitchedBand(
+            row_lower=row_lower,
+            column_lower=column_lower,
+            upper=accumulate(values if weights is None else weights * values),
+            lower=None if weights is None else accumulate(weights),
+        )
 
     def stitch(self) -> NDArray[InexactDType]:
         if self._lower is None:
@@ -10,7 +10,7 @@ from ptychodus.api.geometry import PixelGeometry
 from ptychodus.api.observer import Observable
 from ptychodus.api.probe import ProbeSequence
 from ptychodus.api.propagator import (
-    AngularSpectrumPropagator,
+    MultiplaneAngularSpectrumPropagator,
     PropagatorParameters,
     ComplexArrayType,
     intensity,
@@ -54,29 +54,19 @@ class ProbePropagator(Observable):
         item = self._repository[self._product_index]
         probe = item.get_probe_item().get_probes().get_probe_no_opr()  # TODO OPR
         wavelength_m = item.get_geometry().probe_wavelength_m
-        propagated_wavefield = numpy.zeros(
-            (num_steps, probe.num_incoherent_modes, probe.height_px, probe.width_px),
-            dtype=probe.dtype,
-        )
-        propagated_intensity = numpy.zeros((num_steps, probe.height_px, probe.width_px))
         distance_m = numpy.linspace(begin_coordinate_m, end_coordinate_m, num_steps)
         pixel_geometry = probe.get_pixel_geometry()
-
-        for idx, z_m in enumerate(distance_m):
-            propagator_parameters = PropagatorParameters(
-                wavelength_m=wavelength_m,
-                width_px=probe.width_px,
-                height_px=probe.height_px,
-                pixel_width_m=pixel_geometry.width_m,
-                pixel_height_m=pixel_geometry.height_m,
-                propagation_distance_m=float(z_m),
-            )
-            propagator = AngularSpectrumPropagator(propagator_parameters)
-
-            for mode in range(probe.num_incoherent_modes):
-                wf = propagator.propagate(probe.get_incoherent_mode(mode))
-                propagated_wavefield[idx, mode, :, :] = wf
-                propagated_intensity[idx, :, :] += intensity(wf)
+        propagator_parameters = PropagatorParameters(
+            wavelength_m=wavelength_m,
+            width_px=probe.width_px,
+            height_px=probe.height_px,
+            pixel_width_m=pixel_geometry.width_m,
+            pixel_height_m=pixel_geometry.height_m,
+            propagation_distance_m=0.0,  # distances are passed to the multiplane propagator
+        )
+        propagator = MultiplaneAngularSpectrumPropagator(propagator_parameters)
+        propagated_wavefield = propagator.propagate(probe.get_array(), distance_m)
+        propagated_intensity = numpy.sum(intensity(propagated_wavefield), axis=-3)
 
         self._settings.begin_coordinate_m.set_value(begin_coordinate_m)
         self._settings.end_coordinate_m.set_value(end_coordinate_m)
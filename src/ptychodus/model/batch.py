@@ -0,0 +1,214 @@
+from __future__ import annotations
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Final
+import json
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    'DEFAULT_BATCH_MODE_TIMEOUT_S',
+    'BatchModeJob',
+    'BatchModeResult',
+    'BatchModeService',
+    'submit_batch_mode_job',
+    'wait_for_batch_mode_result',
+]
+
+JOB_SUFFIX: Final[str] = '.job.json'
+RUNNING_SUFFIX: Final[str] = '.running.json'
+RESULT_SUFFIX: Final[str] = '.result.json'
+DEFAULT_BATCH_MODE_TIMEOUT_S: Final[float] = 24 * 60 * 60.0
+
+
+@dataclass(frozen=True)
+class BatchModeJob:
+    action: str
+    input_directory: str
+    output_directory: str
+
+
+@dataclass(frozen=True)
+class BatchModeResult:
+    result: int
+    wait_time_s: float
+    reset_time_s: float
+    run_time_s: float
+
+
+def _write_json_atomically(file_path: Path, contents: object) -> None:
+    tmp_file_path = file_path.with_name(f'.{file_path.name}.tmp')
+    tmp_file_path.write_text(json.dumps(contents))
+    os.replace(tmp_file_path, file_path)
+
+
+def submit_batch_mode_job(
+    spool_directory: Path, action: str, input_directory: Path, output_directory: Path
+) -> Path:
+    """submits a job to a batch mode service; returns the path of the future result file"""
+    job = BatchModeJob(
+        action=action,
+        input_directory=str(input_directory.resolve()),
+        output_directory=str(output_directory.resolve()),
+    )
+    job_id = f'{time.time_ns()}-{uuid.uuid4().hex[:8]}'
+    spool_directory.mkdir(parents=True, exist_ok=True)
+    _write_json_atomically(spool_directory / f'{job_id}{JOB_SUFFIX}', asdict(job))
+    return spool_directory / f'{job_id}{RESULT_SUFFIX}'
+
+
+def wait_for_batch_mode_result(
+    result_file_path: Path,
+    *,
+    poll_interval_s: float = 0.5,
+    timeout_s: float | None = DEFAULT_BATCH_MODE_TIMEOUT_S,
+) -> BatchModeResult:
+    """
+    waits for and consumes the result file of a submitted job; raises TimeoutError if the
+    result does not appear within timeout_s (None waits indefinitely)
+    """
+    deadline_s = None if timeout_s is None else time.monotonic() + timeout_s
+
+    while not result_file_path.is_file():
+        if deadline_s is not None and time.monotonic() > deadline_s:
+            raise TimeoutError(f'Timed out waiting for "{result_file_path}"!')
+
+        time.sleep(poll_interval_s)
+
+    job_result = BatchModeResult(**json.loads(result_file_path.read_text()))
+    result_file_path.unlink()
+    return job_result
+
+
+class BatchModeService:
+    """
+    runs batch mode jobs from a spool directory in a long-lived process so that each job
+    reuses warm plugins, reconstructor libraries, and caches
+    """
+
+    def __init__(
+        self,
+        spool_directory: Path,
+        execute: Callable[[str, Path, Path], int],
+        reset: Callable[[], None],
+        *,
+        poll_interval_s: float = 0.5,
+    ) -> None:
+        self._spool_directory = spool_directory
+        self._execute = execute
+        self._reset = reset
+        self._poll_interval_s = poll_interval_s
+        self._stop_event = threading.Event()
+        # running jobs are tagged with their owner so that stale jobs can be recognized
+        self._hostname = socket.gethostname()
+        self._owner = f'{self._hostname}-{os.getpid()}'
+
+    def _claim_next_job(self) -> tuple[str, Path, float] | None:
+        """atomically renames the oldest job file; returns its id, new path, and submit time"""
+        for job_file_path in sorted(self._spool_directory.glob(f'*{JOB_SUFFIX}')):
+            job_id = job_file_path.name.removesuffix(JOB_SUFFIX)
+            running_file_path = self._spool_directory / f'{job_id}@{self._owner}{RUNNING_SUFFIX}'
+
+            try:
+                submit_time_s = job_file_path.stat().st_mtime
+                os.replace(job_file_path, running_file_path)
+            except FileNotFoundError:
+                continue  # claimed by another service
+
+            return job_id, running_file_path, submit_time_s
+
+        return None
+
+    def _run_job(self, job_id: str, running_file_path: Path, submit_time_s: float) -> None:
+        start_time_s = time.time()
+        reset_time_s = 0.0
+        result = -1
+
+        try:
+            job = BatchModeJob(**json.loads(running_file_path.read_text()))
+            logger.info(f'Running batch mode job "{job_id}": {job}')
+            self._reset()
+            reset_time_s = time.time() - start_time_s
+            result = self._execute(
+                job.action, Path(job.input_directory), Path(job.output_directory)
+            )
+        except Exception:
+            logger.exception(f'Batch mode job "{job_id}" failed!')
+        finally:
+            run_time_s = max(0.0, time.time() - start_time_s - reset_time_s)
+            self._finish_job(
+                job_id,
+                running_file_path,
+                BatchModeResult(
+                    result=result,
+                    wait_time_s=max(0.0, start_time_s - submit_time_s),
+                    reset_time_s=reset_time_s,
+                    run_time_s=run_time_s,
+                ),
+            )
+
+    def _finish_job(
+        self, job_id: str, running_file_path: Path, job_result: BatchModeResult
+    ) -> None:
+        logger.info(f'Finished batch mode job "{job_id}": {job_result}')
+        _write_json_atomically(
+            self._spool_directory / f'{job_id}{RESULT_SUFFIX}', asdict(job_result)
+        )
+        running_file_path.unlink(missing_ok=True)
+
+    def _is_stale(self, owner: str) -> bool:
+        """returns True when the owner of a running job was a process on this host that exited"""
+        hostname, _, pid = owner.rpartition('-')
+
+        if hostname != self._hostname:
+            return False
+
+        try:
+            os.kill(int(pid), 0)
+        except ProcessLookupError:
+            return True
+        except (PermissionError, ValueError):
+            return False
+
+        return False
+
+    def _fail_stale_jobs(self) -> None:
+        """fails jobs left running by a service that exited before writing their results"""
+        for running_file_path in sorted(self._spool_directory.glob(f'*{RUNNING_SUFFIX}')):
+            job_id, _, owner = running_file_path.name.removesuffix(RUNNING_SUFFIX).partition('@')
+
+            if not self._is_stale(owner):
+                continue
+
+            logger.warning(f'Failing stale batch mode job "{job_id}"!')
+            job_result = BatchModeResult(
+                result=-1, wait_time_s=0.0, reset_time_s=0.0, run_time_s=0.0
+            )
+            self._finish_job(job_id, running_file_path, job_result)
+
+    def serve(self) -> None:
+        """runs jobs until stopped"""
+        self._spool_directory.mkdir(parents=True, exist_ok=True)
+        self._stop_event.clear()
+        self._fail_stale_jobs()
+        logger.info(f'Serving batch mode jobs from "{self._spool_directory}"')
+
+        while not self._stop_event.is_set():
+            claimed_job = self._claim_next_job()
+
+            if claimed_job is None:
+                self._stop_event.wait(timeout=self._poll_interval_s)
+            else:
+                self._run_job(*claimed_job)
+
+        logger.info('Stopped serving batch mode jobs.')
+
+    def stop(self) -> None:
+        self._stop_event.set()
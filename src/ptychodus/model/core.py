@@ -6,6 +6,7 @@ from types import TracebackType
 from typing import overload
 import logging
 import sys
+import tempfile
 
 try:
     # NOTE must import hdf5plugin before h5py
@@ -25,7 +26,13 @@ from ptychodus.api.workflow import WorkflowAPI
 from .agent import AgentCore
 from .analysis import AnalysisCore
 from .automation import AutomationCore
-from .diffraction import DiffractionCore, PatternsStreamingContext
+from .batch import BatchModeService
+from .diffraction import (
+    DiffractionCore,
+    PatternsStreamingContext,
+    StreamingDropPolicy,
+    StreamingStatistics,
+)
 from .fluorescence import FluorescenceCore
 from .globus import GlobusCore
 from .memory import MemoryPresenter
@@ -82,11 +89,15 @@ class PtychodusStreamingContext:
         self._patterns_context.append_array(array)
 
     def get_queue_size(self) -> int:
-        return 0  # TODO get_queue_size
+        return self._patterns_context.get_queue_size()
+
+    def get_statistics(self) -> StreamingStatistics:
+        return self._patterns_context.get_statistics()
 
     def stop(self) -> None:
+        """stops streaming and assigns positions whose trigger counts match loaded patterns"""
         self._patterns_context.stop()
-        self._positions_context.stop()
+        self._positions_context.stop(self._patterns_context.get_loaded_indexes())
 
 
 class ModelCore:
@@ -96,7 +107,9 @@ class ModelCore:
         configure_logger(log_level=log_level)
 
         self.rng = numpy.random.default_rng()
-        self.plugin_registry = PluginRegistry.load_plugins()
+        self.plugin_registry = PluginRegistry.load_plugins(
+            Path.home() / '.ptychodus' / 'plugin_manifest.json'
+        )
         self._task_manager = TaskManager()
 
         self.memory_presenter = MemoryPresenter()
@@ -225,10 +238,19 @@ class ModelCore:
         self.globus_core.stop()
         self._task_manager.stop(await_finish=False)
 
-    def create_streaming_context(self, metadata: DiffractionMetadata) -> PtychodusStreamingContext:
+    def create_streaming_context(
+        self,
+        metadata: DiffractionMetadata,
+        *,
+        product_index: int = 0,
+        max_queue_size: int = 4096,
+        drop_policy: StreamingDropPolicy = StreamingDropPolicy.BLOCK,
+    ) -> PtychodusStreamingContext:
         return PtychodusStreamingContext(
-            self.product_core.probe_positions_api.create_streaming_context(),
-            self.diffraction_core.diffraction_api.create_streaming_context(metadata),
+            self.product_core.probe_positions_api.create_streaming_context(product_index),
+            self.diffraction_core.diffraction_api.create_streaming_context(
+                metadata, max_queue_size=max_queue_size, drop_policy=drop_policy
+            ),
         )
 
     def run_tasks(self) -> None:
@@ -307,6 +329,37 @@ class ModelCore:
         logger.error(f'Unknown batch mode action "{action}"!')
         return -1
 
+    def _batch_mode_reset(self, settings_snapshot_path: Path) -> None:
+        """restores the state of a freshly started process between batch mode jobs"""
+        product_repository = self.product_core.product_repository
+
+        for index in reversed(range(len(product_repository))):
+            product_repository.remove_product(index)
+
+        self.diffraction_core.dataset.clear()
+        self.settings_registry.open_settings(settings_snapshot_path)
+
+    def batch_mode_serve(self, spool_directory: Path, *, poll_interval_s: float = 0.5) -> int:
+        """runs batch mode jobs submitted to the spool directory until interrupted"""
+        spool_directory.mkdir(parents=True, exist_ok=True)
+
+        with tempfile.TemporaryDirectory(prefix='ptychodus-') as tmp_dir:
+            settings_snapshot_path = Path(tmp_dir) / 'settings.ini'
+            self.settings_registry.save_settings(settings_snapshot_path)
+            service = BatchModeService(
+                spool_directory,
+                self.batch_mode_execute,
+                lambda: self._batch_mode_reset(settings_snapshot_path),
+                poll_interval_s=poll_interval_s,
+            )
+
+            try:
+                service.serve()
+            except KeyboardInterrupt:
+                service.stop()
+
+        return 0
+
     @property
     def is_developer_mode_enabled(self) -> bool:
         return logger.getEffectiveLevel() <= logging.DEBUG
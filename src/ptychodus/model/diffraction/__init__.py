@@ -1,5 +1,6 @@
-from .api import DiffractionAPI, PatternsStreamingContext
+from .api import DiffractionAPI
 from .bad_pixels import BadPixelsProvider
+from .cache import ProcessedPatternsCache
 from .core import DiffractionCore
 from .dataset import (
     AssembledDiffractionArray,
@@ -8,6 +9,7 @@ from .dataset import (
 )
 from .settings import DetectorSettings, DiffractionSettings
 from .sizer import PatternSizer
+from .streaming import PatternsStreamingContext, StreamingDropPolicy, StreamingStatistics
 
 __all__ = [
     'AssembledDiffractionArray',
@@ -20,4 +22,7 @@ __all__ = [
     'DiffractionSettings',
     'PatternSizer',
     'PatternsStreamingContext',
+    'ProcessedPatternsCache',
+    'StreamingDropPolicy',
+    'StreamingStatistics',
 ]
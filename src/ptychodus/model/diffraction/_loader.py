@@ -1,19 +1,21 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from collections.abc import Mapping, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import concurrent.futures
+from typing import Callable, TypeVar
 import logging
+import multiprocessing
 import threading
 
 import numpy
+import numpy.typing
 
 from ptychodus.api.diffraction import (
     BadPixels,
     DiffractionArray,
     DiffractionIndexes,
     DiffractionPatterns,
-    SimpleDiffractionArray,
 )
 from ptychodus.api.units import BYTES_PER_MEGABYTE
 
@@ -22,12 +24,20 @@ from .processor import DiffractionPatternProcessor
 
 logger = logging.getLogger('.'.join(__name__.split('.')[:-1]))
 
+ScalarType = TypeVar('ScalarType', bound=numpy.generic)
+
 
 @dataclass(frozen=True)
 class AssembledDiffractionData:
     indexes: DiffractionIndexes
     patterns: DiffractionPatterns
     pattern_counts: DiffractionPatterns
+    _selection_cache: dict[str, slice | DiffractionIndexes] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _selection_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         if self.indexes.ndim != 1:
@@ -70,17 +80,53 @@ class AssembledDiffractionData:
         return cls(
             indexes=indexes,
             patterns=patterns,
-            pattern_counts=numpy.sum(patterns[:, good_pixels], axis=-1),
+            pattern_counts=numpy.sum(patterns, axis=(-2, -1), where=good_pixels),
         )
 
+    def invalidate_assembled_selection(self) -> None:
+        with self._selection_lock:
+            self._selection_cache.clear()
+
+    def _get_assembled_selection(self) -> slice | DiffractionIndexes:
+        """returns a slice when assembled patterns are contiguous, otherwise an index array"""
+        with self._selection_lock:
+            try:
+                return self._selection_cache['selection']
+            except KeyError:
+                pass
+
+            selection: slice | DiffractionIndexes
+            positions = numpy.flatnonzero(self.indexes >= 0)
+
+            if positions.size == 0:
+                selection = slice(0, 0)
+            elif positions[-1] - positions[0] + 1 == positions.size:
+                selection = slice(int(positions[0]), int(positions[-1]) + 1)
+            else:
+                selection = positions
+
+            self._selection_cache['selection'] = selection
+            return selection
+
+    def _select(self, array: numpy.typing.NDArray[ScalarType]) -> numpy.typing.NDArray[ScalarType]:
+        selection = self._get_assembled_selection()
+
+        if isinstance(selection, slice):
+            view = array[selection]
+            view.flags.writeable = False
+            return view
+
+        return numpy.take(array, selection, axis=0)
+
     def get_assembled_indexes(self) -> DiffractionIndexes:
-        return self.indexes[self.indexes >= 0]
+        return self._select(self.indexes)
 
     def get_assembled_patterns(self) -> DiffractionPatterns:
-        return self.patterns[self.indexes >= 0]
+        """returns a read-only view if assembled patterns are contiguous, otherwise a copy"""
+        return self._select(self.patterns)
 
     def get_assembled_pattern_counts(self) -> DiffractionPatterns:
-        return self.pattern_counts[self.indexes >= 0]
+        return self._select(self.pattern_counts)
 
     def get_pattern_counts_lut(self) -> Mapping[int, int]:
         return dict(zip(self.get_assembled_indexes(), self.get_assembled_pattern_counts()))
@@ -94,13 +140,18 @@ class AssembledDiffractionData:
 
 class ArrayAssembler(ABC):
     @abstractmethod
-    def _create_array_loader(
+    def create_array_loader(
         self, array: DiffractionArray, *, process_patterns: bool
     ) -> BackgroundTask:
         pass
 
     @abstractmethod
-    def _assemble_array(
+    def get_patterns_destination(self, array_index: int) -> DiffractionPatterns:
+        """returns a writable view of the assembled patterns reserved for the array"""
+        pass
+
+    @abstractmethod
+    def assemble_array(
         self,
         array_index: int,
         label: str,
@@ -128,24 +179,25 @@ class LoadArray:
     def __call__(self) -> ForegroundTask | None:
         label = self._array.get_label()
 
+        region = None if self._processor is None else self._processor.get_region()
+
         try:
-            loaded_array = SimpleDiffractionArray(
-                label,
-                self._array.get_indexes(),
-                self._array.get_patterns(),
-            )
+            indexes = self._array.get_indexes()
+            patterns = self._array.get_patterns(region)
         except FileNotFoundError:
             logger.warning(f'File not found for "{label}"!')
         else:
-            processed_array = (
-                loaded_array if self._processor is None else self._processor(loaded_array)
-            )
+            if self._processor is not None:
+                destination = self._assembler.get_patterns_destination(self._array_index)
+                self._processor.process_into(patterns, destination)
+                patterns = destination
+
             data = AssembledDiffractionData.create_pattern_counts(
-                indexes=processed_array.get_indexes(),
-                patterns=processed_array.get_patterns(),
+                indexes=indexes,
+                patterns=patterns,
                 bad_pixels=self._bad_pixels,
             )
-            self._assembler._assemble_array(
+            self._assembler.assemble_array(
                 self._array_index,
                 label,
                 data,
@@ -162,23 +214,25 @@ class LoadAllArrays:
         foreground_task_manager: ForegroundTaskManager,
         *,
         process_patterns: bool,
+        on_finished: Callable[[], None] | None = None,
     ) -> None:
         super().__init__()
         self._array_seq = array_seq
         self._assembler = assembler
         self._foreground_task_manager = foreground_task_manager
         self._process_patterns = process_patterns
+        self._on_finished = on_finished
         self._finished_event = threading.Event()
 
     def get_finished_event(self) -> threading.Event:
         return self._finished_event
 
-    def __call__(self) -> None:
+    def _load_arrays(self) -> None:
         with concurrent.futures.ThreadPoolExecutor() as executor:
             future_list = [
                 executor.submit(
                     lambda loader_task: loader_task(),
-                    self._assembler._create_array_loader(
+                    self._assembler.create_array_loader(
                         array, process_patterns=self._process_patterns
                     ),
                 )
@@ -194,4 +248,175 @@ class LoadAllArrays:
                     if task is not None:
                         self._foreground_task_manager.put_foreground_task(task)
 
-        self._finished_event.set()
+    def __call__(self) -> None:
+        # always signal completion so that blocking callers never wait forever
+        try:
+            self._load_arrays()
+
+            if self._on_finished is not None:
+                try:
+                    self._on_finished()
+                except Exception:
+                    logger.exception('Failed to finish loading arrays!')
+        finally:
+            self._finished_event.set()
+
+
+def _load_array_into_file(
+    array: DiffractionArray,
+    bad_pixels: BadPixels,
+    processor: DiffractionPatternProcessor | None,
+    file_name: str,
+    patterns_dtype: numpy.dtype,
+    patterns_shape: tuple[int, ...],
+    assembled_slice: slice,
+) -> tuple[DiffractionIndexes, DiffractionPatterns] | None:
+    """loads an array into the shared pattern file; returns indexes and pattern counts"""
+    region = None if processor is None else processor.get_region()
+
+    try:
+        indexes = array.get_indexes()
+        patterns = array.get_patterns(region)
+    except FileNotFoundError:
+        logger.warning(f'File not found for "{array.get_label()}"!')
+        return None
+
+    assembled_patterns = numpy.memmap(
+        file_name, dtype=patterns_dtype, mode='r+', shape=patterns_shape
+    )
+    destination = assembled_patterns[assembled_slice]
+
+    if processor is None:
+        destination[...] = patterns
+    else:
+        processor.process_into(patterns, destination)
+
+    data = AssembledDiffractionData.create_pattern_counts(
+        indexes=indexes,
+        patterns=destination,
+        bad_pixels=bad_pixels,
+    )
+    return data.indexes, data.pattern_counts
+
+
+class LoadAllArraysInSubprocesses:
+    """
+    loads arrays in worker processes that write directly into the memory-mapped assembled
+    patterns, sidestepping the h5py global lock; only indexes and counts are sent back
+    """
+
+    def __init__(
+        self,
+        array_seq: Sequence[DiffractionArray],
+        assembler: ArrayAssembler,
+        patterns: numpy.memmap,
+        assembled_slices: Sequence[slice],
+        bad_pixels: BadPixels,
+        processor: DiffractionPatternProcessor | None,
+        *,
+        max_workers: int | None = None,
+        on_finished: Callable[[], None] | None = None,
+    ) -> None:
+        super().__init__()
+        self._array_seq = array_seq
+        self._assembler = assembler
+        self._patterns = patterns
+        self._assembled_slices = assembled_slices
+        self._bad_pixels = bad_pixels
+        self._processor = processor
+        self._max_workers = max_workers
+        self._on_finished = on_finished
+        self._finished_event = threading.Event()
+
+    def get_finished_event(self) -> threading.Event:
+        return self._finished_event
+
+    def _load_arrays(self) -> None:
+        # spawn workers rather than fork a process that is running threads
+        mp_context = multiprocessing.get_context('spawn')
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=self._max_workers, mp_context=mp_context
+        ) as executor:
+            future_to_array_index = {
+                executor.submit(
+                    _load_array_into_file,
+                    array,
+                    self._bad_pixels,
+                    self._processor,
+                    str(self._patterns.filename),
+                    self._patterns.dtype,
+                    self._patterns.shape,
+                    assembled_slice,
+                ): array_index
+                for array_index, (array, assembled_slice) in enumerate(
+                    zip(self._array_seq, self._assembled_slices)
+                )
+            }
+
+            for future in concurrent.futures.as_completed(future_to_array_index):
+                array_index = future_to_array_index[future]
+
+                try:
+                    result = future.result()
+                except Exception as ex:
+                    logger.warning(ex)
+                    continue
+
+                if result is not None:
+                    indexes, pattern_counts = result
+                    data = AssembledDiffractionData(
+                        indexes=indexes,
+                        patterns=self._assembler.get_patterns_destination(array_index),
+                        pattern_counts=pattern_counts,
+                    )
+                    label = self._array_seq[array_index].get_label()
+                    self._assembler.assemble_array(array_index, label, data)
+
+    def __call__(self) -> None:
+        # always signal completion so that blocking callers never wait forever
+        try:
+            self._load_arrays()
+
+            if self._on_finished is not None:
+                try:
+                    self._on_finished()
+                except Exception:
+                    logger.exception('Failed to finish loading arrays!')
+        finally:
+            self._finished_event.set()
+
+
+class LoadCachedArrays:
+    """assembles arrays from previously assembled patterns without loading them again"""
+
+    def __init__(
+        self,
+        labels: Sequence[str],
+        data: AssembledDiffractionData,
+        assembler: ArrayAssembler,
+        array_slices: Sequence[slice],
+    ) -> None:
+        super().__init__()
+        self._labels = labels
+        self._data = data
+        self._assembler = assembler
+        self._array_slices = array_slices
+        self._finished_event = threading.Event()
+
+    def get_finished_event(self) -> threading.Event:
+        return self._finished_event
+
+    def __call__(self) -> None:
+        try:
+            for array_index, (label, array_slice) in enumerate(
+                zip(self._labels, self._array_slices)
+            ):
+                data = AssembledDiffractionData(
+                    indexes=self._data.indexes[array_slice],
+                    patterns=self._data.patterns[array_slice],
+                    pattern_counts=self._data.pattern_counts[array_slice],
+                )
+                self._assembler.assemble_array(array_index, label, data)
+        finally:
+            self._finished_event.set()
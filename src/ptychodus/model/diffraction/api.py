@@ -9,37 +9,17 @@ from ptychodus.api.diffraction import (
     DiffractionFileReader,
     DiffractionFileWriter,
     DiffractionMetadata,
-    DiffractionArray,
-    SimpleDiffractionDataset,
 )
 from ptychodus.api.plugins import PluginChooser
-from ptychodus.api.tree import SimpleTreeNode
 
 from .bad_pixels import BadPixelsProvider
 from .dataset import AssembledDiffractionDataset
 from .settings import DetectorSettings, DiffractionSettings
+from .streaming import PatternsStreamingContext, StreamingDropPolicy
 
 logger = logging.getLogger(__name__)
 
 
-class PatternsStreamingContext:
-    def __init__(self, dataset: AssembledDiffractionDataset, metadata: DiffractionMetadata) -> None:
-        self._dataset = dataset
-        self._metadata = metadata
-
-    def start(self) -> None:
-        contents_tree = SimpleTreeNode.create_root(['Name', 'Type', 'Details'])
-        stream_dataset = SimpleDiffractionDataset(self._metadata, contents_tree, [])
-        self._dataset.reload(stream_dataset, process_patterns=True)
-        self._dataset.load_all_arrays(block=True)
-
-    def append_array(self, array: DiffractionArray) -> None:
-        self._dataset.append_array(array, process_patterns=True)
-
-    def stop(self) -> None:
-        pass
-
-
 class DiffractionAPI:
     def __init__(
         self,
@@ -60,8 +40,16 @@ class DiffractionAPI:
         self._file_reader_chooser = file_reader_chooser
         self._file_writer_chooser = file_writer_chooser
 
-    def create_streaming_context(self, metadata: DiffractionMetadata) -> PatternsStreamingContext:
-        return PatternsStreamingContext(self._dataset, metadata)
+    def create_streaming_context(
+        self,
+        metadata: DiffractionMetadata,
+        *,
+        max_queue_size: int = 4096,
+        drop_policy: StreamingDropPolicy = StreamingDropPolicy.BLOCK,
+    ) -> PatternsStreamingContext:
+        return PatternsStreamingContext(
+            self._dataset, metadata, max_queue_size=max_queue_size, drop_policy=drop_policy
+        )
 
     def get_bad_pixels_file_reader_chooser(self) -> PluginChooser[BadPixelsFileReader]:
         return self._bad_pixels_file_reader_chooser
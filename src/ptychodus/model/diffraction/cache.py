@@ -0,0 +1,209 @@
+from __future__ import annotations
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
+import hashlib
+import logging
+import os
+import shutil
+
+import numpy
+import numpy.lib.format
+
+from ptychodus.api.diffraction import BadPixels, DiffractionDataset
+from ptychodus.api.units import BYTES_PER_MEGABYTE
+
+from ._loader import AssembledDiffractionData
+from .processor import DiffractionPatternProcessor
+from .settings import DiffractionSettings
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    'CachedPatterns',
+    'ProcessedPatternsCache',
+]
+
+
+@dataclass(frozen=True)
+class CachedPatterns:
+    labels: Sequence[str]
+    data: AssembledDiffractionData
+    bad_pixels: BadPixels
+
+
+class ProcessedPatternsCache:
+    """
+    least-recently-used on-disk cache of assembled patterns keyed by the identity of the
+    source file and the pattern processing settings
+    """
+
+    CACHE_DIRECTORY_NAME: Final[str] = 'pattern_cache'
+    PATTERNS_FILE_NAME: Final[str] = 'patterns.npy'
+    INDEXES_FILE_NAME: Final[str] = 'indexes.npy'
+    PATTERN_COUNTS_FILE_NAME: Final[str] = 'pattern_counts.npy'
+    BAD_PIXELS_FILE_NAME: Final[str] = 'bad_pixels.npy'
+    LABELS_FILE_NAME: Final[str] = 'labels.npy'
+    WRITE_BLOCK_SIZE_BYTES: Final[int] = 1 << 26
+
+    def __init__(self, settings: DiffractionSettings) -> None:
+        self._settings = settings
+
+    @property
+    def is_enabled(self) -> bool:
+        return self._settings.pattern_cache_enabled.get_value()
+
+    def _get_cache_directory(self) -> Path:
+        return self._settings.scratch_directory.get_value() / self.CACHE_DIRECTORY_NAME
+
+    def get_key(
+        self,
+        dataset: DiffractionDataset,
+        bad_pixels: BadPixels,
+        processor: DiffractionPatternProcessor | None,
+    ) -> str | None:
+        """
+        returns a key derived from the path, size, and modification time of every file that
+        the dataset reads patterns from (including external link targets); returns None when
+        the dataset has no source file to identify it
+        """
+        metadata = dataset.get_metadata()
+        source_files: dict[Path, None] = dict()
+
+        if metadata.file_path is not None:
+            source_files[metadata.file_path] = None
+
+        for array in dataset:
+            source_files.update(dict.fromkeys(array.get_source_files()))
+
+        if not source_files:
+            return None
+
+        digest = hashlib.sha256()
+
+        for file_path in source_files:
+            try:
+                stat_result = file_path.stat()
+            except OSError:
+                return None
+
+            digest.update(str(file_path.resolve()).encode())
+            digest.update(f'{stat_result.st_size}:{stat_result.st_mtime_ns}'.encode())
+
+        digest.update(repr(list(metadata.num_patterns_per_array)).encode())
+        digest.update(numpy.dtype(metadata.pattern_dtype).str.encode())
+        digest.update(repr(processor).encode())
+        digest.update(repr(bad_pixels.shape).encode())
+        digest.update(numpy.packbits(bad_pixels).tobytes())
+        return digest.hexdigest()
+
+    def load(self, key: str) -> CachedPatterns | None:
+        """memory-maps cached patterns; returns None on a cache miss"""
+        entry_dir = self._get_cache_directory() / key
+
+        if not entry_dir.is_dir():
+            return None
+
+        try:
+            labels = numpy.load(entry_dir / self.LABELS_FILE_NAME).tolist()
+            data = AssembledDiffractionData(
+                indexes=numpy.load(entry_dir / self.INDEXES_FILE_NAME),
+                patterns=numpy.load(entry_dir / self.PATTERNS_FILE_NAME, mmap_mode='r'),
+                pattern_counts=numpy.load(entry_dir / self.PATTERN_COUNTS_FILE_NAME),
+            )
+            bad_pixels = numpy.load(entry_dir / self.BAD_PIXELS_FILE_NAME)
+        except (OSError, ValueError):
+            logger.exception(f'Discarding unreadable cache entry "{entry_dir}"!')
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            return None
+
+        # mark entry as recently used
+        os.utime(entry_dir)
+        logger.info(f'Pattern cache hit "{entry_dir}"')
+        return CachedPatterns(labels, data, bad_pixels)
+
+    def _get_entries(self) -> list[tuple[float, int, Path]]:
+        """returns (access time, size in bytes, path) for each entry"""
+        entries: list[tuple[float, int, Path]] = list()
+
+        for entry_dir in self._get_cache_directory().iterdir():
+            if entry_dir.is_dir() and not entry_dir.name.endswith('.tmp'):
+                size_bytes = sum(fp.stat().st_size for fp in entry_dir.iterdir())
+                entries.append((entry_dir.stat().st_mtime, size_bytes, entry_dir))
+
+        return entries
+
+    def _evict(self, size_bytes: int) -> bool:
+        """evicts least recently used entries to make room; returns False if impossible"""
+        capacity_bytes = int(
+            self._settings.pattern_cache_capacity_MB.get_value() * BYTES_PER_MEGABYTE
+        )
+
+        if size_bytes > capacity_bytes:
+            return False
+
+        entries = sorted(self._get_entries())
+        used_bytes = sum(entry_size for _, entry_size, _ in entries)
+
+        for _, entry_size, entry_dir in entries:
+            if used_bytes + size_bytes <= capacity_bytes:
+                break
+
+            logger.info(f'Evicting pattern cache entry "{entry_dir}"')
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            used_bytes -= entry_size
+
+        return True
+
+    def store(
+        self, key: str, labels: Sequence[str], data: AssembledDiffractionData, bad_pixels: BadPixels
+    ) -> None:
+        cache_dir = self._get_cache_directory()
+        cache_dir.mkdir(mode=0o755, parents=True, exist_ok=True)
+        entry_dir = cache_dir / key
+
+        if entry_dir.is_dir():
+            return
+
+        size_bytes = data.patterns.nbytes + data.indexes.nbytes + data.pattern_counts.nbytes
+
+        if not self._evict(size_bytes):
+            logger.info(f'Not caching {size_bytes / BYTES_PER_MEGABYTE:.2f}MB of patterns!')
+            return
+
+        # write to a temporary directory then rename so that readers never see partial entries
+        tmp_dir = cache_dir / f'{key}.{os.getpid()}.tmp'
+        tmp_dir.mkdir(mode=0o755)
+
+        try:
+            patterns = numpy.lib.format.open_memmap(
+                tmp_dir / self.PATTERNS_FILE_NAME,
+                mode='w+',
+                dtype=data.patterns.dtype,
+                shape=data.patterns.shape,
+            )
+            num_patterns = data.patterns.shape[0]
+            pattern_nbytes = max(1, data.patterns[:1].nbytes)
+            num_patterns_per_write = max(1, self.WRITE_BLOCK_SIZE_BYTES // pattern_nbytes)
+
+            for start in range(0, num_patterns, num_patterns_per_write):
+                stop = start + num_patterns_per_write
+                patterns[start:stop] = data.patterns[start:stop]
+
+            patterns.flush()
+            del patterns
+
+            numpy.save(tmp_dir / self.INDEXES_FILE_NAME, data.indexes)
+            numpy.save(tmp_dir / self.PATTERN_COUNTS_FILE_NAME, data.pattern_counts)
+            numpy.save(tmp_dir / self.BAD_PIXELS_FILE_NAME, bad_pixels)
+            numpy.save(tmp_dir / self.LABELS_FILE_NAME, numpy.array(labels, dtype=str))
+            tmp_dir.rename(entry_dir)
+        except OSError:
+            logger.exception(f'Failed to write pattern cache entry "{entry_dir}"!')
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        else:
+            logger.info(f'Cached {size_bytes / BYTES_PER_MEGABYTE:.2f}MB as "{entry_dir}"')
+
+    def clear(self) -> None:
+        shutil.rmtree(self._get_cache_directory(), ignore_errors=True)
@@ -12,6 +12,7 @@ from ptychodus.api.settings import SettingsRegistry
 from ..task_manager import TaskManager
 from .api import DiffractionAPI
 from .bad_pixels import BadPixelsProvider
+from .cache import ProcessedPatternsCache
 from .dataset import AssembledDiffractionDataset
 from .settings import DetectorSettings, DiffractionSettings
 from .sizer import PatternSizer
@@ -34,8 +35,13 @@ class DiffractionCore(Observer):
         self.diffraction_settings = DiffractionSettings(settings_registry)
         self.pattern_sizer = PatternSizer(self.detector_settings, self.diffraction_settings)
         self.bad_pixels_provider = BadPixelsProvider(self.detector_settings)
+        self.pattern_cache = ProcessedPatternsCache(self.diffraction_settings)
         self.dataset = AssembledDiffractionDataset(
-            self.diffraction_settings, self.pattern_sizer, self.bad_pixels_provider, task_manager
+            self.diffraction_settings,
+            self.pattern_sizer,
+            self.bad_pixels_provider,
+            task_manager,
+            self.pattern_cache,
         )
         self.diffraction_api = DiffractionAPI(
             self.diffraction_settings,
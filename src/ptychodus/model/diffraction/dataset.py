@@ -3,9 +3,12 @@ from abc import ABC, abstractmethod
 from bisect import bisect
 from collections.abc import Mapping, Sequence
 from pathlib import Path
-from typing import overload, Final
+from typing import IO, overload, Final
 import logging
+import mmap
+import shutil
 import tempfile
+import weakref
 
 import h5py
 import numpy
@@ -19,14 +22,23 @@ from ptychodus.api.diffraction import (
     DiffractionIndexes,
     DiffractionMetadata,
     DiffractionPatterns,
+    PatternRegion,
     SimpleDiffractionDataset,
 )
 from ptychodus.api.tree import SimpleTreeNode
 from ptychodus.api.units import BYTES_PER_MEGABYTE
 
 from ..task_manager import BackgroundTask, TaskManager
-from ._loader import ArrayAssembler, AssembledDiffractionData, LoadAllArrays, LoadArray
+from ._loader import (
+    ArrayAssembler,
+    AssembledDiffractionData,
+    LoadAllArrays,
+    LoadAllArraysInSubprocesses,
+    LoadArray,
+    LoadCachedArrays,
+)
 from .bad_pixels import BadPixelsProvider
+from .cache import ProcessedPatternsCache
 from .settings import DiffractionSettings
 from .sizer import PatternSizer
 
@@ -83,8 +95,8 @@ class AssembledDiffractionArray(DiffractionArray):
     def get_indexes(self) -> DiffractionIndexes:
         return self._indexes
 
-    def get_patterns(self) -> DiffractionPatterns:
-        return self._patterns
+    def get_patterns(self, region: PatternRegion | None = None) -> DiffractionPatterns:
+        return self._patterns if region is None else region.apply(self._patterns)
 
     def get_pattern(self, index: int) -> DiffractionPatterns:
         return self._patterns[index]
@@ -106,6 +118,7 @@ class AssembledDiffractionDataset(DiffractionDataset, ArrayAssembler):
     PATTERNS_KEY: Final[str] = 'patterns'
     INDEXES_KEY: Final[str] = 'indexes'
     BAD_PIXELS_KEY: Final[str] = 'bad_pixels'
+    IMPORT_BLOCK_SIZE_BYTES: Final[int] = 1 << 26
 
     def __init__(
         self,
@@ -113,19 +126,25 @@ class AssembledDiffractionDataset(DiffractionDataset, ArrayAssembler):
         sizer: PatternSizer,
         bad_pixels_provider: BadPixelsProvider,
         task_manager: TaskManager,
+        cache: ProcessedPatternsCache,
     ) -> None:
         super().__init__()
         self._settings = settings
         self._sizer = sizer
         self._bad_pixels_provider = bad_pixels_provider
         self._task_manager = task_manager
+        self._cache = cache
         self._observer_list: list[DiffractionDatasetObserver] = []
 
         self._dataset = SimpleDiffractionDataset.create_null()
         self._data = AssembledDiffractionData.create_null()
         self._array_list: list[AssembledDiffractionArray] = list()
         self._array_counter = 0
-        self._array_loader: LoadAllArrays | None = None
+        self._array_loader: (
+            LoadAllArrays | LoadAllArraysInSubprocesses | LoadCachedArrays | None
+        ) = None
+        self._scratch_file: IO[bytes] | None = None
+        self._scratch_mmap: weakref.ref[mmap.mmap] | None = None
 
     def add_observer(self, observer: DiffractionDatasetObserver) -> None:
         if observer not in self._observer_list:
@@ -172,7 +191,7 @@ class AssembledDiffractionDataset(DiffractionDataset, ArrayAssembler):
     def __len__(self) -> int:
         return len(self._array_list)
 
-    def _create_array_loader(
+    def create_array_loader(
         self, array: DiffractionArray, *, process_patterns: bool
     ) -> BackgroundTask:
         """Load a new array into the dataset. Assumes that arrays arrive in order."""
@@ -190,9 +209,14 @@ class AssembledDiffractionDataset(DiffractionDataset, ArrayAssembler):
         )
 
     def append_array(self, array: DiffractionArray, *, process_patterns: bool = True) -> None:
-        task = self._create_array_loader(array, process_patterns=process_patterns)
+        task = self.create_array_loader(array, process_patterns=process_patterns)
         self._task_manager.put_background_task(task)
 
+    def load_array(self, array: DiffractionArray, *, process_patterns: bool = True) -> None:
+        """Load a new array in the calling thread. Assumes that arrays arrive in order."""
+        task = self.create_array_loader(array, process_patterns=process_patterns)
+        task()
+
     def _insert_array(self, array: AssembledDiffractionArray) -> None:
         pos = bisect(self._array_list, array.array_index, key=lambda x: x.array_index)
         self._array_list.insert(pos, array)
@@ -200,29 +224,40 @@ class AssembledDiffractionDataset(DiffractionDataset, ArrayAssembler):
         for observer in self._observer_list:
             observer.handle_array_inserted(pos)
 
-    def _assemble_array(
+    def _get_assembled_slice(self, array_index: int) -> slice:
+        num_patterns_per_array = self.get_metadata().num_patterns_per_array
+        offset = sum(num_patterns_per_array[:array_index])
+        return slice(offset, offset + num_patterns_per_array[array_index])
+
+    def get_patterns_destination(self, array_index: int) -> DiffractionPatterns:
+        return self._data.patterns[self._get_assembled_slice(array_index), :, :]
+
+    def assemble_array(
         self,
         array_index: int,
         label: str,
         data: AssembledDiffractionData,
     ) -> None:
-        metadata = self.get_metadata()
-        num_patterns_per_array = metadata.num_patterns_per_array
-        offset = sum(num_patterns_per_array[:array_index])
-        assembled_indexes = slice(offset, offset + num_patterns_per_array[array_index])
+        assembled_indexes = self._get_assembled_slice(array_index)
 
         self._data.indexes[assembled_indexes] = data.indexes
         indexes_view = self._data.indexes[assembled_indexes]
         indexes_view.flags.writeable = False
 
-        self._data.patterns[assembled_indexes, :, :] = data.patterns
         patterns_view = self._data.patterns[assembled_indexes, :, :]
+
+        if not numpy.may_share_memory(patterns_view, data.patterns):
+            # processed patterns are written in place; only unprocessed patterns need a copy
+            patterns_view[...] = data.patterns
+
         patterns_view.flags.writeable = False
 
         self._data.pattern_counts[assembled_indexes] = data.pattern_counts
         pattern_counts_view = self._data.pattern_counts[assembled_indexes]
         pattern_counts_view.flags.writeable = False
 
+        self._data.invalidate_assembled_selection()
+
         data_views = AssembledDiffractionData(
             indexes=indexes_view,
             patterns=patterns_view,
@@ -246,6 +281,59 @@ class AssembledDiffractionDataset(DiffractionDataset, ArrayAssembler):
         for observer in self._observer_list:
             observer.handle_dataset_reloaded()
 
+    def _allocate_scratch_file(self, nbytes: int) -> IO[bytes]:
+        """
+        returns a sparse scratch file of nbytes zero bytes, reusing the previous scratch file
+        when no arrays still map it
+        """
+        scratch_dir = self._settings.scratch_directory.get_value()
+        scratch_dir.mkdir(mode=0o755, parents=True, exist_ok=True)
+
+        if self._scratch_mmap is None or self._scratch_mmap() is not None:
+            self._scratch_file = tempfile.NamedTemporaryFile(dir=scratch_dir, suffix='.npy')
+        elif self._scratch_file is not None:
+            logger.debug(f'Reusing scratch data file {self._scratch_file.name}')
+
+        if self._scratch_file is None:
+            raise RuntimeError('Failed to create scratch data file!')
+
+        # truncating discards stale data; extending leaves a zero-filled hole without writing
+        self._scratch_file.truncate(0)
+        self._scratch_file.truncate(nbytes)
+
+        free_bytes = shutil.disk_usage(scratch_dir).free
+        logger.info(
+            f'Scratch data file {self._scratch_file.name} reserves '
+            f'{nbytes / BYTES_PER_MEGABYTE:.2f}MB '
+            f'({free_bytes / BYTES_PER_MEGABYTE:.2f}MB free in "{scratch_dir}")'
+        )
+
+        if free_bytes < nbytes:
+            logger.warning('Insufficient free space in scratch directory to load all patterns!')
+
+        return self._scratch_file
+
+    def _allocate_patterns(
+        self, shape: tuple[int, ...], dtype: numpy.typing.DTypeLike, *, file_backed: bool = False
+    ) -> DiffractionPatterns:
+        """allocates zeroed patterns in a scratch file if memmap is enabled or file_backed"""
+        nbytes = numpy.dtype(dtype).itemsize * int(numpy.prod(shape))
+        file_backed |= self._settings.memmap_enabled.get_value()
+
+        if file_backed and nbytes > 0:
+            scratch_file = self._allocate_scratch_file(nbytes)
+            logger.debug(f'Scratch data file {scratch_file.name} is {shape}')
+            patterns: DiffractionPatterns = numpy.memmap(
+                scratch_file, dtype=dtype, mode='r+', shape=shape
+            )
+            self._scratch_mmap = weakref.ref(patterns._mmap)  # type: ignore[attr-defined]
+        else:
+            logger.info(f'Scratch memory is {shape}')
+            patterns = numpy.zeros(shape, dtype=dtype)
+            logger.debug(f'{patterns.nbytes / BYTES_PER_MEGABYTE:.2f}MB allocated for patterns')
+
+        return patterns
+
     def reload(self, dataset: DiffractionDataset, *, process_patterns: bool = True) -> None:
         self.clear()
 
@@ -256,12 +344,36 @@ class AssembledDiffractionDataset(DiffractionDataset, ArrayAssembler):
             self._bad_pixels_provider.set_detector_extent(metadata.detector_extent)
 
         bad_pixels = self._bad_pixels_provider.get_bad_pixels()
+        processor = self._sizer.get_processor() if process_patterns else None
 
-        if process_patterns:
-            processor = self._sizer.get_processor()
+        if processor is not None:
             bad_pixels = processor.process_bad_pixels(bad_pixels)
 
         self._dataset = SimpleDiffractionDataset(metadata, layout, [], bad_pixels)
+        cache_key = (
+            self._cache.get_key(dataset, bad_pixels, processor) if self._cache.is_enabled else None
+        )
+
+        if cache_key is not None:
+            cached = self._cache.load(cache_key)
+
+            if cached is not None and len(cached.labels) == len(metadata.num_patterns_per_array):
+                self._data = cached.data
+                self._array_counter = len(cached.labels)
+
+                for observer in self._observer_list:
+                    observer.handle_dataset_reloaded()
+
+                self._array_loader = LoadCachedArrays(
+                    cached.labels,
+                    cached.data,
+                    self,
+                    [
+                        self._get_assembled_slice(array_index)
+                        for array_index in range(len(cached.labels))
+                    ],
+                )
+                return
 
         num_patterns_total = sum(metadata.num_patterns_per_array)
         indexes = -numpy.ones(num_patterns_total, dtype=int)
@@ -270,32 +382,46 @@ class AssembledDiffractionDataset(DiffractionDataset, ArrayAssembler):
         patterns_dtype = metadata.pattern_dtype
         pattern_counts = numpy.zeros(num_patterns_total, dtype=patterns_dtype)
 
-        if self._settings.memmap_enabled.get_value():
-            scratch_dir = self._settings.scratch_directory.get_value()
-            scratch_dir.mkdir(mode=0o755, parents=True, exist_ok=True)
-            npy_tmp_file = tempfile.NamedTemporaryFile(dir=scratch_dir, suffix='.npy')
-            logger.info(f'Scratch data file {npy_tmp_file.name} is {patterns_shape}')
-            patterns: DiffractionPatterns = numpy.memmap(
-                npy_tmp_file, dtype=patterns_dtype, shape=patterns_shape
-            )
-            patterns[:] = 0
-        else:
-            logger.info(f'Scratch memory is {patterns_shape}')
-            patterns = numpy.zeros(patterns_shape, dtype=patterns_dtype)
-            logger.debug(f'{patterns.nbytes / BYTES_PER_MEGABYTE:.2f}MB allocated for patterns')
-
-        self._data = AssembledDiffractionData(
+        use_subprocesses = self._settings.multiprocess_loading_enabled.get_value()
+        data = AssembledDiffractionData(
             indexes=indexes,
-            patterns=patterns,
+            patterns=self._allocate_patterns(
+                patterns_shape, patterns_dtype, file_backed=use_subprocesses
+            ),
             pattern_counts=pattern_counts,
         )
+        self._data = data
 
         for observer in self._observer_list:
             observer.handle_dataset_reloaded()
 
-        self._array_loader = LoadAllArrays(
-            dataset, self, self._task_manager, process_patterns=process_patterns
-        )
+        def store_in_cache() -> None:
+            if cache_key is not None and numpy.all(data.indexes >= 0):
+                labels = [array.get_label() for array in dataset]
+                self._cache.store(cache_key, labels, data, bad_pixels)
+
+        if use_subprocesses and isinstance(data.patterns, numpy.memmap):
+            assembled_slices = [
+                self._get_assembled_slice(array_index) for array_index in range(len(dataset))
+            ]
+            self._array_counter = len(assembled_slices)
+            self._array_loader = LoadAllArraysInSubprocesses(
+                dataset,
+                self,
+                data.patterns,
+                assembled_slices,
+                bad_pixels,
+                processor,
+                on_finished=store_in_cache,
+            )
+        else:
+            self._array_loader = LoadAllArrays(
+                dataset,
+                self,
+                self._task_manager,
+                process_patterns=process_patterns,
+                on_finished=store_in_cache,
+            )
 
     def load_all_arrays(self, *, block: bool) -> None:
         if self._array_loader is None:
@@ -310,6 +436,59 @@ class AssembledDiffractionDataset(DiffractionDataset, ArrayAssembler):
                     if finished_event.wait(timeout=TaskManager.WAIT_TIME_S):
                         break
 
+    def _import_patterns(
+        self, file_path: Path, h5_patterns: h5py.Dataset, bad_pixels: BadPixels
+    ) -> tuple[DiffractionPatterns, DiffractionPatterns]:
+        """
+        memory-maps contiguous uncompressed patterns in place; otherwise copies patterns into
+        a file-backed scratch array a few chunks at a time to bound the resident set. Either
+        way, pattern counts need one streaming pass over every pattern, which is done a block
+        at a time. Returns the patterns and the pattern counts.
+        """
+        offset = h5_patterns.id.get_offset()
+        is_memmapped = (
+            h5_patterns.chunks is None
+            and h5_patterns.compression is None
+            and h5_patterns.external is None
+            and offset is not None
+        )
+
+        if is_memmapped:
+            logger.info(f'Memory-mapping {h5_patterns.shape} patterns at offset {offset}')
+            patterns: DiffractionPatterns = numpy.memmap(
+                file_path,
+                dtype=h5_patterns.dtype,
+                mode='r',
+                offset=offset,
+                shape=h5_patterns.shape,
+            )
+        else:
+            patterns = self._allocate_patterns(
+                h5_patterns.shape, h5_patterns.dtype, file_backed=True
+            )
+
+        num_patterns = h5_patterns.shape[0]
+        pattern_nbytes = max(1, patterns[:1].nbytes)
+        num_patterns_per_read = max(1, self.IMPORT_BLOCK_SIZE_BYTES // pattern_nbytes)
+
+        if h5_patterns.chunks is not None:
+            # read whole chunks to avoid decompressing any chunk more than once
+            chunk_size = h5_patterns.chunks[0]
+            num_patterns_per_read = max(1, num_patterns_per_read // chunk_size) * chunk_size
+
+        pattern_counts: list[DiffractionPatterns] = list()
+        good_pixels = numpy.logical_not(bad_pixels)
+
+        for start in range(0, num_patterns, num_patterns_per_read):
+            selection = numpy.s_[start : min(start + num_patterns_per_read, num_patterns)]
+
+            if not is_memmapped:
+                h5_patterns.read_direct(patterns, selection, selection)
+
+            pattern_counts.append(numpy.sum(patterns[selection], axis=(-2, -1), where=good_pixels))
+
+        return patterns, numpy.concatenate(pattern_counts) if pattern_counts else numpy.zeros(0)
+
     def import_assembled_patterns(self, file_path: Path) -> None:
         if file_path.is_file():
             self.clear()
@@ -334,10 +513,11 @@ class AssembledDiffractionDataset(DiffractionDataset, ArrayAssembler):
                 bad_pixels = h5_bad_pixels[()]
                 self._bad_pixels_provider.set_bad_pixels(bad_pixels)
 
-                self._data = AssembledDiffractionData.create_pattern_counts(
+                patterns, pattern_counts = self._import_patterns(file_path, h5_patterns, bad_pixels)
+                self._data = AssembledDiffractionData(
                     indexes=h5_indexes[()],
-                    patterns=h5_patterns[()],  # TODO support memmap
-                    bad_pixels=bad_pixels,
+                    patterns=patterns,
+                    pattern_counts=pattern_counts,
                 )
 
             # TODO deconflict detector size with bad_pixels_provider
@@ -9,6 +9,7 @@ from ptychodus.api.diffraction import (
     CropCenter,
     DiffractionArray,
     DiffractionPatterns,
+    PatternRegion,
     SimpleDiffractionArray,
 )
 
@@ -18,6 +19,19 @@ class DiffractionPatternFilterValues:
     lower_bound: int | None
     upper_bound: int | None
 
+    def get_mask(self, data: DiffractionPatterns) -> BadPixels | None:
+        """returns True where values are retained, or None if all values are retained"""
+        mask: BadPixels | None = None
+
+        if self.lower_bound is not None:
+            mask = data >= self.lower_bound
+
+        if self.upper_bound is not None:
+            upper_mask = data < self.upper_bound
+            mask = upper_mask if mask is None else numpy.logical_and(mask, upper_mask, out=mask)
+
+        return mask
+
     def apply(self, data: DiffractionPatterns) -> DiffractionPatterns:
         if self.lower_bound is not None:
             data[data < self.lower_bound] = 0
@@ -38,6 +52,12 @@ class DiffractionPatternCrop:
         radius_y = extent.height_px // 2
         self.slice_y = slice(center_y - radius_y, center_y + radius_y)
 
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(slice_x={self.slice_x}, slice_y={self.slice_y})'
+
+    def get_region(self) -> PatternRegion:
+        return PatternRegion(slice_x=self.slice_x, slice_y=self.slice_y)
+
     def apply_bool(self, data: BadPixels) -> BadPixels:
         return data[self.slice_y, self.slice_x]
 
@@ -62,6 +82,19 @@ class DiffractionPatternBinning:
         shape = (-1, binned_height, self.bin_size_y, binned_width, self.bin_size_x)
         return numpy.sum(data.reshape(shape), axis=(-3, -1), keepdims=False)
 
+    def apply_into(
+        self, data: DiffractionPatterns, out: DiffractionPatterns, where: BadPixels | None
+    ) -> None:
+        binned_width = data.shape[-1] // self.bin_size_x
+        binned_height = data.shape[-2] // self.bin_size_y
+        shape = (-1, binned_height, self.bin_size_y, binned_width, self.bin_size_x)
+        numpy.sum(
+            data.reshape(shape),
+            axis=(-3, -1),
+            out=out,
+            where=True if where is None else where.reshape(shape),
+        )
+
 
 @dataclass(frozen=True)
 class DiffractionPatternPadding:
@@ -69,13 +102,28 @@ class DiffractionPatternPadding:
     pad_y: int
 
     def apply_bool(self, data: BadPixels) -> BadPixels:
-        pad_width = (self.pad_y, self.pad_y, self.pad_x, self.pad_x)
+        pad_width = ((self.pad_y, self.pad_y), (self.pad_x, self.pad_x))
         return numpy.pad(data, pad_width, mode='constant', constant_values=False)
 
     def apply(self, data: DiffractionPatterns) -> DiffractionPatterns:
-        pad_width = (0, 0, self.pad_y, self.pad_y, self.pad_x, self.pad_x)
+        pad_width = ((0, 0), (self.pad_y, self.pad_y), (self.pad_x, self.pad_x))
         return numpy.pad(data, pad_width, mode='constant', constant_values=0)
 
+    def get_interior(self, data: DiffractionPatterns) -> DiffractionPatterns:
+        """zeros the padded border of data in place and returns a view of the interior"""
+        height = data.shape[-2]
+        width = data.shape[-1]
+
+        if self.pad_y > 0:
+            data[:, : self.pad_y, :] = 0
+            data[:, height - self.pad_y :, :] = 0
+
+        if self.pad_x > 0:
+            data[:, :, : self.pad_x] = 0
+            data[:, :, width - self.pad_x :] = 0
+
+        return data[:, self.pad_y : height - self.pad_y, self.pad_x : width - self.pad_x]
+
 
 @dataclass(frozen=True)
 class DiffractionPatternProcessor:
@@ -109,37 +157,81 @@ class DiffractionPatternProcessor:
             processed_bad_pixels = numpy.flip(processed_bad_pixels, axis=-2)
 
         if self.transpose:
-            processed_bad_pixels = numpy.transpose(processed_bad_pixels, axes=(0, 2, 1))
+            processed_bad_pixels = numpy.transpose(processed_bad_pixels)
 
         return processed_bad_pixels
 
-    def __call__(self, array: DiffractionArray) -> DiffractionArray:
-        patterns = array.get_patterns()
+    def get_region(self) -> PatternRegion | None:
+        """returns the detector region that processing reads, if not the whole detector"""
+        return None if self.crop is None else self.crop.get_region()
+
+    def get_processed_shape(self, patterns_shape: tuple[int, ...]) -> tuple[int, int, int]:
+        """returns the shape of processed patterns read from the crop region"""
+        num_patterns = 1 if len(patterns_shape) == 2 else patterns_shape[0]
+        height, width = patterns_shape[-2:]
+
+        if self.binning is not None:
+            height //= self.binning.bin_size_y
+            width //= self.binning.bin_size_x
 
+        if self.padding is not None:
+            height += 2 * self.padding.pad_y
+            width += 2 * self.padding.pad_x
+
+        if self.transpose:
+            height, width = width, height
+
+        return num_patterns, height, width
+
+    def __call__(self, array: DiffractionArray) -> DiffractionArray:
+        patterns = array.get_patterns(self.get_region())
+        processed_patterns = numpy.empty(
+            self.get_processed_shape(patterns.shape), dtype=patterns.dtype
+        )
+        self.process_into(patterns, processed_patterns)
+        return SimpleDiffractionArray(array.get_label(), array.get_indexes(), processed_patterns)
+
+    def process_into(self, patterns: DiffractionPatterns, out: DiffractionPatterns) -> None:
+        """filters, bins, pads, flips, and transposes patterns already restricted to the crop
+        region in a single pass, writing the result into the preallocated output array"""
         if patterns.ndim == 2:
             patterns = patterns[numpy.newaxis, ...]
         elif patterns.ndim != 3:
             raise ValueError(f'Invalid diffraction pattern dimensions! (shape={patterns.shape})')
 
-        if self.filter_values is not None:
-            patterns = self.filter_values.apply(patterns)
+        # undo output transformations to get a view of the binned pattern region
+        destination = out
 
-        if self.crop is not None:
-            patterns = self.crop.apply(patterns)
+        if self.transpose:
+            destination = numpy.transpose(destination, axes=(0, 2, 1))
 
-        if self.binning is not None:
-            patterns = self.binning.apply(patterns)
+        if self.vflip:
+            destination = numpy.flip(destination, axis=-2)
+
+        if self.hflip:
+            destination = numpy.flip(destination, axis=-1)
 
         if self.padding is not None:
-            patterns = self.padding.apply(patterns)
+            destination = self.padding.get_interior(destination)
 
-        if self.hflip:
-            patterns = numpy.flip(patterns, axis=-1)
+        num_patterns, height, width = patterns.shape
 
-        if self.vflip:
-            patterns = numpy.flip(patterns, axis=-2)
+        if self.binning is not None:
+            height //= self.binning.bin_size_y
+            width //= self.binning.bin_size_x
 
-        if self.transpose:
-            patterns = numpy.transpose(patterns, axes=(0, 2, 1))
+        if destination.shape != (num_patterns, height, width):
+            raise ValueError(
+                'Processed patterns do not fit destination!'
+                f' (actual={(num_patterns, height, width)} expected={destination.shape})'
+            )
+
+        mask = None if self.filter_values is None else self.filter_values.get_mask(patterns)
+
+        if self.binning is not None:
+            self.binning.apply_into(patterns, destination, where=mask)
+        else:
+            numpy.copyto(destination, patterns, casting='unsafe')
 
-        return SimpleDiffractionArray(array.get_label(), array.get_indexes(), patterns)
+            if mask is not None:
+                numpy.copyto(destination, 0, where=numpy.logical_not(mask))
@@ -44,6 +44,15 @@ class DiffractionSettings(Observable, Observer):
         self.scratch_directory = self._group.create_path_parameter(
             'ScratchDirectory', Path.home() / '.ptychodus'
         )
+        self.multiprocess_loading_enabled = self._group.create_boolean_parameter(
+            'MultiprocessLoadingEnabled', False
+        )
+        self.pattern_cache_enabled = self._group.create_boolean_parameter(
+            'PatternCacheEnabled', False
+        )
+        self.pattern_cache_capacity_MB = self._group.create_integer_parameter(
+            'PatternCacheCapacityInMegabytes', 32000, minimum=0
+        )
 
         self.crop_enabled = self._group.create_boolean_parameter('CropEnabled', True)
         self.crop_center_x_px = self._group.create_integer_parameter(
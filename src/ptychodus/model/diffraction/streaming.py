@@ -0,0 +1,319 @@
+from __future__ import annotations
+from collections import deque
+from collections.abc import Sequence, Set
+from dataclasses import dataclass
+from enum import Enum
+from typing import Final
+import logging
+import queue
+import threading
+import time
+
+import numpy
+
+from ptychodus.api.diffraction import (
+    DiffractionArray,
+    DiffractionMetadata,
+    SimpleDiffractionArray,
+    SimpleDiffractionDataset,
+)
+from ptychodus.api.tree import SimpleTreeNode
+
+from .dataset import AssembledDiffractionDataset
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    'PatternsStreamingContext',
+    'StreamingDropPolicy',
+    'StreamingStatistics',
+]
+
+
+class StreamingDropPolicy(Enum):
+    BLOCK = 'block'  # apply backpressure to the producer
+    DROP_NEWEST = 'drop_newest'  # discard incoming frames while the queue is full
+    DROP_OLDEST = 'drop_oldest'  # discard queued frames to make room for incoming frames
+
+
+@dataclass(frozen=True)
+class StreamingStatistics:
+    num_frames_received: int
+    num_frames_loaded: int
+    num_frames_dropped: int
+    num_frames_queued: int
+    mean_latency_s: float
+    max_latency_s: float
+    throughput_Hz: float  # noqa: N815
+
+
+@dataclass(frozen=True)
+class _QueuedFrames:
+    arrival_time_s: float
+    array: DiffractionArray
+
+
+class _PendingFrames:
+    """accumulates streamed frames until there are enough to fill the next assembled array"""
+
+    def __init__(self) -> None:
+        self._frames: deque[_QueuedFrames] = deque()
+        self._num_patterns = 0
+
+    def __len__(self) -> int:
+        return self._num_patterns
+
+    def append(self, frames: _QueuedFrames) -> None:
+        self._frames.append(frames)
+        self._num_patterns += len(frames.array.get_indexes())
+
+    def pop(self, label: str, num_patterns: int) -> tuple[DiffractionArray, Sequence[float]]:
+        """removes num_patterns patterns; returns them with the arrival times of each frame"""
+        indexes_list = list()
+        patterns_list = list()
+        arrival_times_s: list[float] = list()
+        num_remaining = num_patterns
+
+        while num_remaining > 0:
+            frames = self._frames.popleft()
+            indexes = frames.array.get_indexes()
+            patterns = frames.array.get_patterns()
+
+            if len(indexes) > num_remaining:
+                # split frames that straddle assembled arrays
+                remainder = SimpleDiffractionArray(
+                    label=frames.array.get_label(),
+                    indexes=indexes[num_remaining:],
+                    patterns=patterns[num_remaining:],
+                )
+                self._frames.appendleft(_QueuedFrames(frames.arrival_time_s, remainder))
+                indexes = indexes[:num_remaining]
+                patterns = patterns[:num_remaining]
+
+            indexes_list.append(indexes)
+            patterns_list.append(patterns)
+            arrival_times_s.extend([frames.arrival_time_s] * len(indexes))
+            num_remaining -= len(indexes)
+
+        self._num_patterns -= num_patterns
+        array = SimpleDiffractionArray(
+            label=label,
+            indexes=numpy.concatenate(indexes_list),
+            patterns=numpy.concatenate(patterns_list),
+        )
+        return array, arrival_times_s
+
+
+class PatternsStreamingContext:
+    WAIT_TIME_S: Final[float] = 0.1
+
+    def __init__(
+        self,
+        dataset: AssembledDiffractionDataset,
+        metadata: DiffractionMetadata,
+        *,
+        max_queue_size: int = 4096,
+        drop_policy: StreamingDropPolicy = StreamingDropPolicy.BLOCK,
+    ) -> None:
+        self._dataset = dataset
+        self._metadata = metadata
+        self._drop_policy = drop_policy
+        self._queue: queue.Queue[_QueuedFrames] = queue.Queue(maxsize=max_queue_size)
+        self._pending = _PendingFrames()
+        self._array_index = 0
+        self._stop_event = threading.Event()
+        self._worker: threading.Thread | None = None
+        self._statistics_lock = threading.Lock()
+        self._reset_statistics()
+
+    def _reset_statistics(self) -> None:
+        with self._statistics_lock:
+            self._start_time_s = time.perf_counter()
+            self._num_frames_received = 0
+            self._num_frames_loaded = 0
+            self._num_frames_dropped = 0
+            self._total_latency_s = 0.0
+            self._max_latency_s = 0.0
+            self._loaded_indexes: set[int] = set()
+
+    def start(self) -> None:
+        if self._worker is not None:
+            logger.warning('Streaming context already started!')
+            return
+
+        contents_tree = SimpleTreeNode.create_root(['Name', 'Type', 'Details'])
+        stream_dataset = SimpleDiffractionDataset(self._metadata, contents_tree, [])
+        self._dataset.reload(stream_dataset, process_patterns=True)
+        self._dataset.load_all_arrays(block=True)
+
+        self._pending = _PendingFrames()
+        self._array_index = 0
+        self._reset_statistics()
+        self._stop_event.clear()
+        self._worker = threading.Thread(target=self._run, name='PatternsStreamingContext')
+        self._worker.start()
+
+    def append_array(self, array: DiffractionArray) -> None:
+        frames = _QueuedFrames(time.perf_counter(), array)
+        num_frames = len(array.get_indexes())
+
+        with self._statistics_lock:
+            self._num_frames_received += num_frames
+
+        if not self._is_running():
+            logger.warning(f'Dropping {num_frames} frames received while not streaming!')
+            self._count_dropped(num_frames)
+            return
+
+        match self._drop_policy:
+            case StreamingDropPolicy.BLOCK:
+                self._put_blocking(frames, num_frames)
+            case StreamingDropPolicy.DROP_NEWEST:
+                try:
+                    self._queue.put_nowait(frames)
+                except queue.Full:
+                    self._count_dropped(num_frames)
+            case StreamingDropPolicy.DROP_OLDEST:
+                while True:
+                    try:
+                        self._queue.put_nowait(frames)
+                    except queue.Full:
+                        try:
+                            dropped = self._queue.get_nowait()
+                        except queue.Empty:
+                            continue
+
+                        self._queue.task_done()
+                        self._count_dropped(len(dropped.array.get_indexes()))
+                    else:
+                        break
+
+    def _is_running(self) -> bool:
+        return self._worker is not None and not self._stop_event.is_set()
+
+    def _put_blocking(self, frames: _QueuedFrames, num_frames: int) -> None:
+        """waits for room in the queue while the worker runs; drops frames if streaming stops"""
+        while self._is_running():
+            try:
+                self._queue.put(frames, timeout=self.WAIT_TIME_S)
+            except queue.Full:
+                continue
+            else:
+                return
+
+        logger.warning(f'Dropping {num_frames} frames received while stopping!')
+        self._count_dropped(num_frames)
+
+    def _count_dropped(self, num_frames: int) -> None:
+        with self._statistics_lock:
+            self._num_frames_dropped += num_frames
+
+    def _load_pending(self) -> None:
+        num_patterns_per_array = self._metadata.num_patterns_per_array
+
+        while self._array_index < len(num_patterns_per_array):
+            num_patterns = num_patterns_per_array[self._array_index]
+
+            if len(self._pending) < num_patterns:
+                return
+
+            array, arrival_times_s = self._pending.pop(f'Stream{self._array_index}', num_patterns)
+            self._array_index += 1
+
+            try:
+                self._dataset.load_array(array, process_patterns=True)
+            except Exception:
+                logger.exception(f'Failed to load streamed array "{array.get_label()}"!')
+                self._count_dropped(num_patterns)
+                continue
+
+            latencies_s = time.perf_counter() - numpy.asarray(arrival_times_s)
+
+            with self._statistics_lock:
+                self._num_frames_loaded += num_patterns
+                self._loaded_indexes.update(array.get_indexes().tolist())
+                self._total_latency_s += float(latencies_s.sum())
+                self._max_latency_s = max(self._max_latency_s, float(latencies_s.max()))
+
+        if len(self._pending) > 0:
+            logger.warning(f'Dropping {len(self._pending)} frames beyond stream metadata!')
+            self._count_dropped(len(self._pending))
+            self._pending = _PendingFrames()
+
+    def _run(self) -> None:
+        while not (self._stop_event.is_set() and self._queue.empty()):
+            try:
+                frames = self._queue.get(block=True, timeout=self.WAIT_TIME_S)
+            except queue.Empty:
+                continue
+
+            # drain everything that is already queued to batch frames into arrays
+            batch = [frames]
+
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for frames in batch:
+                self._pending.append(frames)
+
+            self._load_pending()
+
+            for _ in batch:
+                self._queue.task_done()
+
+    def _get_num_frames_queued(self) -> int:
+        # every received frame is eventually either loaded or dropped
+        return self._num_frames_received - self._num_frames_loaded - self._num_frames_dropped
+
+    def get_queue_size(self) -> int:
+        """returns the number of frames that have been received but not loaded or dropped"""
+        with self._statistics_lock:
+            return self._get_num_frames_queued()
+
+    def get_loaded_indexes(self) -> Set[int]:
+        with self._statistics_lock:
+            return frozenset(self._loaded_indexes)
+
+    def get_statistics(self) -> StreamingStatistics:
+        with self._statistics_lock:
+            elapsed_time_s = time.perf_counter() - self._start_time_s
+            num_frames_loaded = self._num_frames_loaded
+            return StreamingStatistics(
+                num_frames_received=self._num_frames_received,
+                num_frames_loaded=num_frames_loaded,
+                num_frames_dropped=self._num_frames_dropped,
+                num_frames_queued=self._get_num_frames_queued(),
+                mean_latency_s=self._total_latency_s / num_frames_loaded
+                if num_frames_loaded > 0
+                else 0.0,
+                max_latency_s=self._max_latency_s,
+                throughput_Hz=num_frames_loaded / elapsed_time_s if elapsed_time_s > 0 else 0.0,
+            )
+
+    def stop(self) -> None:
+        if self._worker is None:
+            return
+
+        self._stop_event.set()
+        self._worker.join()
+        self._worker = None
+
+        # frames put while the worker was exiting are never loaded
+        while True:
+            try:
+                frames = self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+            self._queue.task_done()
+            self._count_dropped(len(frames.array.get_indexes()))
+
+        if len(self._pending) > 0:
+            logger.warning(f'Dropping {len(self._pending)} frames of an incomplete array!')
+            self._count_dropped(len(self._pending))
+            self._pending = _PendingFrames()
+
+        logger.info(self.get_statistics())
@@ -49,13 +49,18 @@ class TwoStepFluorescenceEnhancingAlgorithm(FluorescenceEnhancingAlgorithm, Obse
         deconvolver = self._deconvolution_strategy_chooser.get_current_plugin().strategy
         element_maps: list[ElementMap] = list()
 
-        for emap in dataset.element_maps:
-            logger.info(f'Enhancing "{emap.name}"...')
+        logger.info(f'Upscaling {len(dataset.element_maps)} element maps...')
+        tic = time.perf_counter()
+        emaps_upscaled = upscaler.upscale_all(dataset.element_maps, product)
+        toc = time.perf_counter()
+        logger.info(f'Upscaled element maps in {toc - tic:.4f} seconds.')
+
+        for emap_upscaled in emaps_upscaled:
+            logger.info(f'Deconvolving "{emap_upscaled.name}"...')
             tic = time.perf_counter()
-            emap_upscaled = upscaler(emap, product)
             emap_enhanced = deconvolver(emap_upscaled, product)
             toc = time.perf_counter()
-            logger.info(f'Enhanced "{emap.name}" in {toc - tic:.4f} seconds.')
+            logger.info(f'Deconvolved "{emap_upscaled.name}" in {toc - tic:.4f} seconds.')
 
             element_maps.append(emap_enhanced)
 
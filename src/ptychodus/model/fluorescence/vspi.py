@@ -1,20 +1,21 @@
 from __future__ import annotations
 from typing import Final
+import concurrent.futures
 import logging
 import time
 
-from scipy.sparse.linalg import lsmr, LinearOperator
 import numpy
+import scipy.sparse
+import scipy.sparse.linalg
 
 from ptychodus.api.fluorescence import (
     ElementMap,
     FluorescenceDataset,
     FluorescenceEnhancingAlgorithm,
 )
-from ptychodus.api.object import ObjectPosition
 from ptychodus.api.observer import Observable, Observer
 from ptychodus.api.product import Product
-from ptychodus.api.typing import RealArrayType
+from ptychodus.api.typing import IntegerArrayType, RealArrayType
 
 from .settings import FluorescenceSettings
 
@@ -25,100 +26,113 @@ __all__ = [
 ]
 
 
-class ArrayPatchInterpolator:
-    def __init__(self, array: RealArrayType, point: ObjectPosition, shape: tuple[int, ...]) -> None:
-        # top left corner of object support
-        xmin = point.coordinate_x_px - shape[-1] / 2
-        ymin = point.coordinate_y_px - shape[-2] / 2
-
-        # whole components (pixel indexes)
-        xmin_wh = int(xmin)
-        ymin_wh = int(ymin)
-
-        # fractional (subpixel) components
-        xmin_fr = xmin - xmin_wh
-        ymin_fr = ymin - ymin_wh
-
-        # bottom right corner of object patch support
-        xmax_wh = xmin_wh + shape[-1] + 1
-        ymax_wh = ymin_wh + shape[-2] + 1
-
-        # reused quantities
-        xmin_fr_c = 1.0 - xmin_fr
-        ymin_fr_c = 1.0 - ymin_fr
-
-        # barycentric interpolant weights
-        self._weight00 = ymin_fr_c * xmin_fr_c
-        self._weight01 = ymin_fr_c * xmin_fr
-        self._weight10 = ymin_fr * xmin_fr_c
-        self._weight11 = ymin_fr * xmin_fr
-
-        # extract patch support region from full object
-        self._support = array[ymin_wh:ymax_wh, xmin_wh:xmax_wh]
-
-    def get_patch(self) -> RealArrayType:
-        """interpolate array support to extract patch"""
-        patch = self._weight00 * self._support[:-1, :-1]
-        patch += self._weight01 * self._support[:-1, 1:]
-        patch += self._weight10 * self._support[1:, :-1]
-        patch += self._weight11 * self._support[1:, 1:]
-        return patch
-
-    def accumulate_patch(self, patch: RealArrayType) -> None:
-        """add patch update to array support"""
-        self._support[:-1, :-1] += self._weight00 * patch
-        self._support[:-1, 1:] += self._weight01 * patch
-        self._support[1:, :-1] += self._weight10 * patch
-        self._support[1:, 1:] += self._weight11 * patch
-
-
-class VSPILinearOperator(LinearOperator):
-    def __init__(self, product: Product) -> None:
-        """
-        M: number of XRF positions
-        N: number of ptychography object pixels
-        P: number of XRF channels
-
-        A[M,N] * X[N,P] = B[M,P]
-        """
-        object_geometry = product.object_.get_geometry()
-        M = len(product.probe_positions)  # noqa: N806
-        N = object_geometry.height_px * object_geometry.width_px  # noqa: N806
-        super().__init__(float, (M, N))
-        self._product = product
-
-    def _matvec(self, x: RealArrayType) -> RealArrayType:  # noqa: N803
-        object_geometry = self._product.object_.get_geometry()
-        object_array = x.reshape((object_geometry.height_px, object_geometry.width_px))
-        AX = numpy.zeros(len(self._product.probe_positions))  # noqa: N806
-
-        for index, (scan_point, probe) in enumerate(
-            zip(self._product.probe_positions, self._product.probes)
-        ):
-            object_point = object_geometry.map_coordinates_probe_to_object(scan_point)
-            probe_intensity = probe.get_intensity()
-            psf = probe_intensity / probe_intensity.sum()
-            interpolator = ArrayPatchInterpolator(object_array, object_point, psf.shape)
-            AX[index] = numpy.sum(psf * interpolator.get_patch())
-
-        return AX
-
-    def _rmatvec(self, x: RealArrayType) -> RealArrayType:  # noqa: N803
-        object_geometry = self._product.object_.get_geometry()
-        object_array = numpy.zeros((object_geometry.height_px, object_geometry.width_px))
-
-        for index, (scan_point, probe) in enumerate(
-            zip(self._product.probe_positions, self._product.probes)
-        ):
-            object_point = object_geometry.map_coordinates_probe_to_object(scan_point)
-            probe_intensity = probe.get_intensity()
-            psf = probe_intensity / probe_intensity.sum()
-            interpolator = ArrayPatchInterpolator(object_array, object_point, psf.shape)
-            interpolator.accumulate_patch(x[index] * psf)
-
-        HX = object_array.flatten()  # noqa: N806
-
-        return HX
+def assemble_vspi_matrix(product: Product, *, chunk_size: int = 256) -> scipy.sparse.csr_array:
+    """
+    assembles the sparse matrix A that maps object pixels to XRF positions
+    by integrating the normalized probe intensity (point spread function)
+
+    M: number of XRF positions
+    N: number of ptychography object pixels
+    P: number of XRF channels
+
+    A[M,N] * X[N,P] = B[M,P]
+    """
+    object_geometry = product.object_.get_geometry()
+    object_coordinates_px = object_geometry.map_coordinates_probe_to_object_array(
+        product.probe_positions.coordinates_m
+    )
+    centers_x = object_coordinates_px[:, -1]
+    centers_y = object_coordinates_px[:, -2]
+
+    M = len(object_coordinates_px)  # noqa: N806
+    N = object_geometry.height_px * object_geometry.width_px  # noqa: N806
+
+    def get_psf(probe_index: int) -> RealArrayType:
+        probe_intensity = product.probes[probe_index].get_intensity()
+        return probe_intensity / probe_intensity.sum()
+
+    shared_psf = get_psf(0) if len(product.probes) == 1 else None
+    row_list: list[IntegerArrayType] = list()
+    col_list: list[IntegerArrayType] = list()
+    data_list: list[RealArrayType] = list()
+
+    for start in range(0, M, chunk_size):
+        stop = min(start + chunk_size, M)
+
+        if shared_psf is None:
+            psfs = numpy.stack([get_psf(index) for index in range(start, stop)])
+        else:
+            psfs = numpy.broadcast_to(shared_psf, (stop - start, *shared_psf.shape))
+
+        psf_height, psf_width = psfs.shape[-2:]
+
+        x_lower = centers_x[start:stop] - psf_width / 2
+        x_whole = numpy.floor(x_lower).astype(int)
+        x_frac = (x_lower - x_whole).reshape(-1, 1, 1)
+        x_frac_c = 1.0 - x_frac
+
+        y_lower = centers_y[start:stop] - psf_height / 2
+        y_whole = numpy.floor(y_lower).astype(int)
+        y_frac = (y_lower - y_whole).reshape(-1, 1, 1)
+        y_frac_c = 1.0 - y_frac
+
+        # barycentric interpolation spreads each psf over a support one pixel larger
+        support = numpy.zeros((stop - start, psf_height + 1, psf_width + 1))
+        support[:, :-1, :-1] += y_frac_c * x_frac_c * psfs
+        support[:, :-1, 1:] += y_frac_c * x_frac * psfs
+        support[:, 1:, :-1] += y_frac * x_frac_c * psfs
+        support[:, 1:, 1:] += y_frac * x_frac * psfs
+
+        rows = y_whole[:, numpy.newaxis] + numpy.arange(psf_height + 1)
+        cols = x_whole[:, numpy.newaxis] + numpy.arange(psf_width + 1)
+        valid_rows = numpy.logical_and(rows >= 0, rows < object_geometry.height_px)
+        valid_cols = numpy.logical_and(cols >= 0, cols < object_geometry.width_px)
+        valid = valid_rows[:, :, numpy.newaxis] & valid_cols[:, numpy.newaxis, :]
+
+        pixels = rows[:, :, numpy.newaxis] * object_geometry.width_px + cols[:, numpy.newaxis, :]
+        positions = numpy.broadcast_to(numpy.arange(start, stop).reshape(-1, 1, 1), support.shape)
+
+        row_list.append(positions[valid])
+        col_list.append(pixels[valid])
+        data_list.append(support[valid])
+
+    return scipy.sparse.csr_array(
+        (
+            numpy.concatenate(data_list) if data_list else numpy.zeros(0),
+            (
+                numpy.concatenate(row_list) if row_list else numpy.zeros(0, dtype=int),
+                numpy.concatenate(col_list) if col_list else numpy.zeros(0, dtype=int),
+            ),
+        ),
+        shape=(M, N),
+    )
+
+
+def solve_lsmr_columns(
+    A: scipy.sparse.csr_array,  # noqa: N803
+    B: RealArrayType,  # noqa: N803
+    *,
+    damp: float = 0.0,
+    maxiter: int | None = None,
+    max_workers: int | None = None,
+) -> tuple[RealArrayType, IntegerArrayType]:
+    """
+    solves min ||A X - B||^2 + damp^2 ||X||^2 for each column of B with scipy's LSMR, running
+    the columns concurrently on a thread pool. Returns the solution and iterations per column.
+    """
+    X = numpy.zeros((A.shape[1], B.shape[1]))  # noqa: N806
+    num_iterations = numpy.zeros(B.shape[1], dtype=int)
+
+    def solve_column(column: int) -> None:
+        result = scipy.sparse.linalg.lsmr(A, B[:, column], damp=damp, maxiter=maxiter)
+        X[:, column] = result[0]
+        num_iterations[column] = result[2]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for _ in executor.map(solve_column, range(B.shape[1])):
+            pass
+
+    return X, num_iterations
 
 
 class VSPIFluorescenceEnhancingAlgorithm(FluorescenceEnhancingAlgorithm, Observable, Observer):
@@ -135,27 +149,34 @@ class VSPIFluorescenceEnhancingAlgorithm(FluorescenceEnhancingAlgorithm, Observa
     def enhance(self, dataset: FluorescenceDataset, product: Product) -> FluorescenceDataset:
         object_geometry = product.object_.get_geometry()
         e_cps_shape = object_geometry.height_px, object_geometry.width_px
-        element_maps: list[ElementMap] = list()
-        A = VSPILinearOperator(product)  # noqa: N806
-
-        for emap in dataset.element_maps:
-            logger.info(f'Enhancing "{emap.name}"...')
-            tic = time.perf_counter()
-            m_cps = emap.counts_per_second
-            result = lsmr(
-                A,
-                m_cps.flatten(),
-                damp=self._settings.vspi_damping_factor.get_value(),
-                maxiter=self._settings.vspi_max_iterations.get_value(),
-                show=True,
-            )
-            logger.debug(result)
-            e_cps = result[0].reshape(e_cps_shape)
-            emap_enhanced = ElementMap(emap.name, e_cps)
-            toc = time.perf_counter()
-            logger.info(f'Enhanced "{emap.name}" in {toc - tic:.4f} seconds.')
-
-            element_maps.append(emap_enhanced)
+
+        tic = time.perf_counter()
+        A = assemble_vspi_matrix(product)  # noqa: N806
+        toc = time.perf_counter()
+        logger.info(
+            f'Assembled {A.shape} VSPI matrix with {A.nnz} nonzeros in {toc - tic:.4f} seconds.'
+        )
+
+        element_names = [emap.name for emap in dataset.element_maps]
+        logger.info(f'Enhancing {element_names}...')
+        tic = time.perf_counter()
+        m_cps = numpy.stack(
+            [emap.counts_per_second.flatten() for emap in dataset.element_maps], axis=-1
+        )
+        e_cps, num_iterations = solve_lsmr_columns(
+            A,
+            m_cps,
+            damp=self._settings.vspi_damping_factor.get_value(),
+            maxiter=self._settings.vspi_max_iterations.get_value(),
+        )
+        toc = time.perf_counter()
+        logger.info(f'Enhanced {element_names} in {toc - tic:.4f} seconds.')
+        logger.debug(f'{num_iterations=}')
+
+        element_maps = [
+            ElementMap(name, e_cps[:, index].reshape(e_cps_shape))
+            for index, name in enumerate(element_names)
+        ]
 
         return FluorescenceDataset(
             element_maps=element_maps,
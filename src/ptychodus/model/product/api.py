@@ -1,9 +1,13 @@
-from collections.abc import Iterator, Mapping, Sequence
+from collections.abc import Iterator, Mapping, Sequence, Set
 from pathlib import Path
 from typing import Any
 import logging
+import threading
+
+import numpy
 
 from ptychodus.api.plugins import PluginChooser
+from ptychodus.api.probe_positions import ProbePositionSequence
 from ptychodus.api.product import Product, ProductFileReader, ProductFileWriter
 
 from .item import ProductRepositoryItem
@@ -24,28 +28,86 @@ logger = logging.getLogger(__name__)
 
 
 class PositionsStreamingContext:
-    def __init__(self) -> None:
-        self._positions_x_m: list[float] = []
-        self._triggers_x: list[int] = []
-        self._positions_y_m: list[float] = []
-        self._triggers_y: list[int] = []
+    """
+    joins streamed x and y positions by trigger count as they arrive; stopping the stream
+    assigns the joined positions to the probe positions of a product
+    """
+
+    def __init__(self, repository: ProbePositionsRepository, product_index: int) -> None:
+        self._repository = repository
+        self._product_index = product_index
+        self._lock = threading.Lock()
+        self._pending_x_m: dict[int, float] = {}
+        self._pending_y_m: dict[int, float] = {}
+        self._indexes: list[int] = []
+        self._coordinates_m: list[tuple[float, float]] = []
 
     def start(self) -> None:
-        self._positions_x_m.clear()
-        self._triggers_x.clear()
-        self._positions_y_m.clear()
-        self._triggers_y.clear()
+        with self._lock:
+            self._pending_x_m.clear()
+            self._pending_y_m.clear()
+            self._indexes.clear()
+            self._coordinates_m.clear()
+
+    def _join(
+        self,
+        values_m: Sequence[float],
+        trigger_counts: Sequence[int],
+        pending_m: dict[int, float],
+        pending_other_m: dict[int, float],
+        *,
+        is_x: bool,
+    ) -> None:
+        with self._lock:
+            for value_m, trigger_count in zip(values_m, trigger_counts):
+                try:
+                    other_m = pending_other_m.pop(trigger_count)
+                except KeyError:
+                    pending_m[trigger_count] = value_m
+                else:
+                    self._indexes.append(trigger_count)
+                    self._coordinates_m.append((other_m, value_m) if is_x else (value_m, other_m))
 
     def append_positions_x(self, values_m: Sequence[float], trigger_counts: Sequence[int]) -> None:
-        self._positions_x_m.extend(values_m)
-        self._triggers_x.extend(trigger_counts)
+        self._join(values_m, trigger_counts, self._pending_x_m, self._pending_y_m, is_x=True)
 
     def append_positions_y(self, values_m: Sequence[float], trigger_counts: Sequence[int]) -> None:
-        self._positions_y_m.extend(values_m)
-        self._triggers_y.extend(trigger_counts)
+        self._join(values_m, trigger_counts, self._pending_y_m, self._pending_x_m, is_x=False)
+
+    def get_num_unmatched_positions(self) -> int:
+        with self._lock:
+            return len(self._pending_x_m) + len(self._pending_y_m)
+
+    def get_probe_positions(self, indexes: Set[int] | None = None) -> ProbePositionSequence:
+        """returns joined positions, optionally only those with trigger counts in indexes"""
+        with self._lock:
+            position_indexes = numpy.array(self._indexes)
+            coordinates_m = numpy.array(self._coordinates_m, dtype=float).reshape(-1, 2)
+
+        if indexes is not None:
+            is_selected = numpy.isin(position_indexes, list(indexes))
+            position_indexes = position_indexes[is_selected]
+            coordinates_m = coordinates_m[is_selected]
+
+        return ProbePositionSequence.create_from_arrays(position_indexes, coordinates_m)
+
+    def stop(self, indexes: Set[int] | None = None) -> None:
+        """assigns joined positions (those matching indexes, if given) to the product"""
+        num_unmatched = self.get_num_unmatched_positions()
+
+        if num_unmatched > 0:
+            logger.warning(f'{num_unmatched} streamed positions lack a matching trigger count!')
+
+        positions = self.get_probe_positions(indexes)
+
+        try:
+            item = self._repository[self._product_index]
+        except IndexError:
+            logger.warning(f'Failed to assign streamed positions to item {self._product_index}!')
+            return
 
-    def stop(self) -> None:
-        pass  # TODO
+        item.assign(positions)
+        logger.info(f'Assigned {len(positions)} streamed positions to item {self._product_index}.')
 
 
 class ProbePositionsAPI:
@@ -59,8 +121,8 @@ class ProbePositionsAPI:
         self._repository = repository
         self._builder_factory = builder_factory
 
-    def create_streaming_context(self) -> PositionsStreamingContext:
-        return PositionsStreamingContext()
+    def create_streaming_context(self, product_index: int) -> PositionsStreamingContext:
+        return PositionsStreamingContext(self._repository, product_index)
 
     def builder_names(self) -> Iterator[str]:
         return iter(self._builder_factory)
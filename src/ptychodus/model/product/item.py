@@ -68,11 +68,11 @@ class ProductRepositoryItem(ParameterGroup):
 
         self._index = -1  # used by ProductRepository
 
-    def assign(self, product: Product) -> None:
+    def assign(self, product: Product, *, copy_object: bool = True) -> None:
         self._metadata_item.assign(product.metadata)
         self._probe_positions_item.assign(product.probe_positions)
         self._probe_item.assign(product.probes)
-        self._object_item.assign(product.object_)
+        self._object_item.assign(product.object_, copy=copy_object)
         self._losses = list(product.losses)
         self._parent.handle_losses_changed(self)
 
@@ -97,10 +97,10 @@ class ObjectBuilder(ParameterGroup):
 
 
 class FromMemoryObjectBuilder(ObjectBuilder):
-    def __init__(self, settings: ObjectSettings, object_: Object) -> None:
+    def __init__(self, settings: ObjectSettings, object_: Object, *, copy: bool = True) -> None:
         super().__init__(settings, 'from_memory')
         self._settings = settings
-        self._object = object_.copy()
+        self._object = object_.copy() if copy else object_
 
     def copy(self) -> FromMemoryObjectBuilder:
         return FromMemoryObjectBuilder(self._settings, self._object)
@@ -36,8 +36,9 @@ class ObjectRepositoryItem(ParameterGroup):
         self.set_builder(item.get_builder().copy())
         self.rebuild()
 
-    def assign(self, object_: Object) -> None:
-        builder = FromMemoryObjectBuilder(self._settings, object_)
+    def assign(self, object_: Object, *, copy: bool = True) -> None:
+        """assigns the object; pass copy=False to take ownership of an unshared object"""
+        builder = FromMemoryObjectBuilder(self._settings, object_, copy=copy)
         self.set_builder(builder)
 
     def sync_to_settings(self) -> None:
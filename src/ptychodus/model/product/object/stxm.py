@@ -2,9 +2,9 @@ from __future__ import annotations
 from collections.abc import Sequence
 import logging
 
-from scipy.interpolate import griddata
 import numpy
 
+from ptychodus.api.interpolation import get_grid_interpolator
 from ptychodus.api.object import Object, ObjectGeometryProvider
 
 from ...diffraction import AssembledDiffractionDataset
@@ -55,11 +55,9 @@ class STXMObjectBuilder(ObjectBuilder):
                 values.append(value)
 
         points = numpy.reshape(coordinates_px, (-1, 2))
-        YY, XX = numpy.mgrid[: geometry.height_px, : geometry.width_px]  # noqa: N806
-        query_points = numpy.transpose((YY.flat, XX.flat))
-        intensity = griddata(points, values, query_points, method='linear', fill_value=0.0).reshape(
-            XX.shape
-        )
+        # the triangulation is reused across rebuilds with the same positions and geometry
+        interpolator = get_grid_interpolator(points, (geometry.height_px, geometry.width_px))
+        intensity = interpolator(numpy.asarray(values, dtype=float), fill_value=0.0)
 
         return self._create_object(
             array=numpy.sqrt(intensity[numpy.newaxis, :, :]).astype('complex'),
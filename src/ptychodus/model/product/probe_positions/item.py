@@ -1,14 +1,10 @@
 from __future__ import annotations
-from itertools import pairwise
 import logging
 
-import numpy
-
 from ptychodus.api.observer import Observable
 from ptychodus.api.parametric import ParameterGroup
-from ptychodus.api.probe_positions import ProbePositionSequence, ScanBoundingBox, ProbePosition
+from ptychodus.api.probe_positions import ProbePositionSequence, ScanBoundingBox
 
-from .bounding_box import ScanBoundingBoxBuilder
 from .builder import FromMemoryProbePositionsBuilder, ProbePositionsBuilder
 from .settings import ProbePositionsSettings
 from .transform import ProbePositionTransform
@@ -29,7 +25,7 @@ class ProbePositionsRepositoryItem(ParameterGroup):
         self._transform = transform
         self._untransformed_scan = ProbePositionSequence()
         self._transformed_scan = ProbePositionSequence()
-        self._bbox_builder = ScanBoundingBoxBuilder()
+        self._bbox: ScanBoundingBox | None = None
         self._length_m = 0.0
 
         self._add_group('builder', builder, observe=True)
@@ -94,7 +90,7 @@ class ProbePositionsRepositoryItem(ParameterGroup):
         self._rebuild()
 
     def get_bounding_box(self) -> ScanBoundingBox | None:
-        bbox = self._bbox_builder.get_bounding_box()
+        bbox = self._bbox
 
         if self.expand_bbox.get_value():
             expanded_bbox = ScanBoundingBox(
@@ -111,23 +107,11 @@ class ProbePositionsRepositoryItem(ParameterGroup):
         return self._length_m
 
     def _transform_scan(self) -> None:
-        transformed_points: list[ProbePosition] = list()
-        bbox_builder = ScanBoundingBoxBuilder()
-        length_m = 0.0
-
-        for untransformed_point in self._untransformed_scan:
-            transformed_point = self._transform(untransformed_point)
-            transformed_points.append(transformed_point)
-            bbox_builder.hull(transformed_point)
-
-        for point_l, point_r in pairwise(transformed_points):
-            dx = point_r.coordinate_x_m - point_l.coordinate_x_m
-            dy = point_r.coordinate_y_m - point_l.coordinate_y_m
-            length_m += numpy.hypot(dx, dy)
-
-        self._transformed_scan = ProbePositionSequence(transformed_points)
-        self._bbox_builder = bbox_builder
-        self._length_m = length_m
+        transformed_scan = self._transform.transform_positions(self._untransformed_scan)
+
+        self._transformed_scan = transformed_scan
+        self._bbox = transformed_scan.get_bounding_box()
+        self._length_m = transformed_scan.get_length_m()
         self.notify_observers()
 
     def _rebuild(self) -> None:
@@ -5,7 +5,8 @@ import numpy
 
 from ptychodus.api.geometry import AffineTransform
 from ptychodus.api.parametric import ParameterGroup
-from ptychodus.api.probe_positions import ProbePosition
+from ptychodus.api.probe_positions import ProbePosition, ProbePositionSequence
+from ptychodus.api.typing import RealArrayType
 
 from .settings import ProbePositionsSettings
 
@@ -97,19 +98,42 @@ class ProbePositionTransform(ParameterGroup):
     def set_identity(self) -> None:
         self.apply_presets(0)
 
+    def _sample_jitter(self, num_points: int) -> RealArrayType:
+        """rejection samples (y, x) offsets with shape (num_points, 2) in the unit circle"""
+        jitter = numpy.empty((num_points, 2))
+        is_pending = numpy.ones(num_points, dtype=bool)
+
+        while True:
+            num_pending = numpy.count_nonzero(is_pending)
+
+            if num_pending == 0:
+                break
+
+            dxy = self._rng.uniform(size=(num_pending, 2))
+            is_accepted = numpy.sum(dxy * dxy, axis=1) < 1.0
+            pending_indexes = numpy.flatnonzero(is_pending)[is_accepted]
+            jitter[pending_indexes] = dxy[is_accepted]
+            is_pending[pending_indexes] = False
+
+        return jitter
+
+    def transform_positions(self, positions: ProbePositionSequence) -> ProbePositionSequence:
+        coordinates_m = self.get_transform().transform_coordinates(positions.coordinates_m)
+        rad = self.jitter_radius_m.get_value()
+
+        if rad > 0.0:
+            coordinates_m += rad * self._sample_jitter(len(positions))
+
+        return ProbePositionSequence.create_from_arrays(positions.indexes.copy(), coordinates_m)
+
     def __call__(self, point: ProbePosition) -> ProbePosition:
         transform = self.get_transform()
         pos_y, pos_x = transform(point.coordinate_y_m, point.coordinate_x_m)
         rad = self.jitter_radius_m.get_value()
 
         if rad > 0.0:
-            while True:
-                dx = self._rng.uniform()
-                dy = self._rng.uniform()
-
-                if dx * dx + dy * dy < 1.0:
-                    pos_x += dx * rad
-                    pos_y += dy * rad
-                    break
+            dy, dx = self._sample_jitter(1)[0]
+            pos_x += dx * rad
+            pos_y += dy * rad
 
-        return ProbePosition(point.index, pos_x, pos_y)
+        return ProbePosition(point.index, float(pos_x), float(pos_y))
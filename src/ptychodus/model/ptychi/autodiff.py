@@ -16,7 +16,7 @@ from ptychi.api.task import PtychographyTask
 
 from ptychodus.api.object import Object, ObjectGeometry
 from ptychodus.api.probe import ProbeSequence
-from ptychodus.api.product import LossValue, ProductMetadata
+from ptychodus.api.product import ProductMetadata
 from ptychodus.api.reconstructor import ReconstructInput, ReconstructOutput, Reconstructor
 from ptychodus.api.probe_positions import ProbePositionSequence
 
@@ -33,7 +33,6 @@ class AutodiffReconstructor(Reconstructor):
         super().__init__()
         self._options_helper = options_helper
         self._settings = settings
-        self._epoch = 0
 
     def get_name(self) -> str:
         return 'Autodiff'
@@ -183,39 +182,4 @@ class AutodiffReconstructor(Reconstructor):
 
         task = PtychographyTask(task_options)
 
-        with task:
-            self._epoch = 0
-            step_epochs = self._options_helper.num_sync_epochs
-
-            task_reconstructor = task.reconstructor
-
-            if task_reconstructor is None:
-                raise RuntimeError('Task reconstructor is None!')
-
-            loss_tracker = task_reconstructor.loss_tracker
-
-            while self._epoch < num_epochs:
-                task.run(step_epochs)
-
-                losses: list[LossValue] = list()
-                epoch_array = loss_tracker.table['epoch'].to_numpy()
-                loss_array = loss_tracker.table['loss'].to_numpy()
-
-                for epoch, loss in zip(epoch_array.flat, loss_array.flat):
-                    loss_value = LossValue(epoch=epoch, value=loss.item())
-                    losses.append(loss_value)
-
-                product = self._options_helper.create_product(
-                    product=parameters.product,
-                    position_x_px=task.get_probe_positions_x(as_numpy=True),
-                    position_y_px=task.get_probe_positions_y(as_numpy=True),
-                    probe_array=task.get_data_to_cpu('probe', as_numpy=True),
-                    object_array=task.get_data_to_cpu('object', as_numpy=True),
-                    opr_weights=task.get_data_to_cpu('opr_mode_weights', as_numpy=True),
-                    losses=losses,
-                )
-
-                self._epoch += step_epochs
-                step_epochs = min(step_epochs, num_epochs - self._epoch)
-
-                yield ReconstructOutput(product=product, progress=self._epoch, result=0)
+        yield from self._options_helper.run_task(task, parameters, num_epochs)
@@ -1,4 +1,4 @@
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 import logging
 
 import torch
@@ -41,12 +41,14 @@ from ptychi.api.options.base import (
     RemoveObjectProbeAmbiguityOptions,
     SliceSpacingOptions,
 )
+from ptychi.api.task import PtychographyTask
 
-from ptychodus.api.object import Object, ObjectGeometry, ObjectPosition
+from ptychodus.api.geometry import PixelGeometry
+from ptychodus.api.object import Object, ObjectCenter, ObjectGeometry
 from ptychodus.api.probe import ProbeSequence
 from ptychodus.api.product import LossValue, Product, ProductMetadata
-from ptychodus.api.reconstructor import ReconstructInput
-from ptychodus.api.probe_positions import ProbePositionSequence, ProbePosition
+from ptychodus.api.reconstructor import ReconstructInput, ReconstructOutput
+from ptychodus.api.probe_positions import ProbePositionSequence
 from ptychodus.api.typing import ComplexArrayType, RealArrayType
 
 from ..diffraction import PatternSizer
@@ -91,6 +93,10 @@ class PtyChiReconstructorOptionsHelper:
     def num_sync_epochs(self) -> int:
         return self._settings.num_sync_epochs.get_value()
 
+    @property
+    def sync_preview_size(self) -> int:
+        return self._settings.sync_preview_size.get_value()
+
     @property
     def batch_size(self) -> int:
         return self._settings.batch_size.get_value()
@@ -562,15 +568,8 @@ class PtyChiProbePositionOptionsHelper:
     def get_positions_px(
         self, scan: ProbePositionSequence, object_geometry: ObjectGeometry
     ) -> tuple[RealArrayType, RealArrayType]:
-        position_x_px: list[float] = list()
-        position_y_px: list[float] = list()
-
-        for scan_point in scan:
-            object_point = object_geometry.map_coordinates_probe_to_object(scan_point)
-            position_x_px.append(object_point.coordinate_x_px)
-            position_y_px.append(object_point.coordinate_y_px)
-
-        return numpy.array(position_x_px), numpy.array(position_y_px)
+        coordinates_px = object_geometry.map_coordinates_probe_to_object_array(scan.coordinates_m)
+        return coordinates_px[:, -1].copy(), coordinates_px[:, -2].copy()
 
 
 class PtyChiOPROptionsHelper:
@@ -682,6 +681,32 @@ class PtyChiOptionsHelper:
             save_data_on_device=self._reconstructor_settings.save_data_on_device.get_value(),
         )
 
+    def get_object_array(
+        self, task: PtychographyTask, *, preview: bool
+    ) -> tuple[ComplexArrayType, int]:
+        """
+        returns the object array and its stride in object pixels; previews are
+        block-averaged on the device so that only the downsampled array is copied
+        """
+        object_data = task.get_data('object').detach()
+        preview_size = self.reconstructor_helper.sync_preview_size
+        height, width = object_data.shape[-2:]
+        stride = 1
+
+        if preview and preview_size > 0:
+            stride = max(1, -(-max(height, width) // preview_size))
+
+        if stride > 1:
+            preview_height = height // stride
+            preview_width = width // stride
+            object_data = (
+                object_data[..., : preview_height * stride, : preview_width * stride]
+                .reshape(*object_data.shape[:-2], preview_height, stride, preview_width, stride)
+                .mean(dim=(-3, -1))
+            )
+
+        return object_data.cpu().numpy(), stride
+
     def create_product(
         self,
         product: Product,
@@ -691,13 +716,38 @@ class PtyChiOptionsHelper:
         object_array: torch.Tensor | numpy.ndarray,
         opr_weights: torch.Tensor | numpy.ndarray,
         losses: Sequence[LossValue],
+        *,
+        object_stride: int = 1,
     ) -> Product:
         object_in = product.object_
+        object_geometry = object_in.get_geometry()
+        pixel_geometry = object_in.get_pixel_geometry()
+        center = object_in.get_center()
+        object_out_array = numpy.asarray(object_array)
+
+        if object_stride > 1:
+            # a block-averaged preview covers the leading whole blocks of the object
+            pixel_geometry = PixelGeometry(
+                width_m=pixel_geometry.width_m * object_stride,
+                height_m=pixel_geometry.height_m * object_stride,
+            )
+            preview_height_px, preview_width_px = object_out_array.shape[-2:]
+            center = ObjectCenter(
+                coordinate_x_m=center.coordinate_x_m
+                + (preview_width_px * object_stride - object_geometry.width_px)
+                * object_geometry.pixel_width_m
+                / 2,
+                coordinate_y_m=center.coordinate_y_m
+                + (preview_height_px * object_stride - object_geometry.height_px)
+                * object_geometry.pixel_height_m
+                / 2,
+            )
+
         object_out = Object(
-            array=numpy.array(object_array),
+            array=object_out_array,
             layer_spacing_m=object_in.layer_spacing_m,
-            pixel_geometry=object_in.get_pixel_geometry(),
-            center=object_in.get_center(),
+            pixel_geometry=pixel_geometry,
+            center=center,
         )
 
         probe_out = ProbeSequence(
@@ -706,21 +756,16 @@ class PtyChiOptionsHelper:
             pixel_geometry=product.probes.get_pixel_geometry(),
         )
 
-        corrected_scan_points: list[ProbePosition] = list()
-        object_geometry = object_in.get_geometry()
-
-        for uncorrected_point, pos_x_px, pos_y_px in zip(
-            product.probe_positions, position_x_px, position_y_px
-        ):
-            object_point = ObjectPosition(
-                index=uncorrected_point.index,
-                coordinate_x_px=float(pos_x_px),
-                coordinate_y_px=float(pos_y_px),
+        coordinates_px = numpy.column_stack(
+            (
+                numpy.asarray(position_y_px, dtype=float),
+                numpy.asarray(position_x_px, dtype=float),
             )
-            scan_point = object_geometry.map_coordinates_object_to_probe(object_point)
-            corrected_scan_points.append(scan_point)
-
-        scan_out = ProbePositionSequence(corrected_scan_points)
+        )
+        scan_out = ProbePositionSequence.create_from_arrays(
+            product.probe_positions.indexes.copy(),
+            object_geometry.map_coordinates_object_to_probe_array(coordinates_px),
+        )
 
         return Product(
             metadata=product.metadata,
@@ -730,6 +775,76 @@ class PtyChiOptionsHelper:
             losses=losses,
         )
 
+    def _create_task_output(
+        self,
+        task: PtychographyTask,
+        parameters: ReconstructInput,
+        epoch: int,
+        *,
+        preview: bool,
+    ) -> ReconstructOutput:
+        task_reconstructor = task.reconstructor
+
+        if task_reconstructor is None:
+            raise RuntimeError('Task reconstructor is None!')
+
+        loss_tracker = task_reconstructor.loss_tracker
+        losses: list[LossValue] = list()
+        epoch_array = loss_tracker.table['epoch'].to_numpy()
+        loss_array = loss_tracker.table['loss'].to_numpy()
+
+        for loss_epoch, loss in zip(epoch_array.flat, loss_array.flat):
+            loss_value = LossValue(epoch=loss_epoch, value=loss.item())
+            losses.append(loss_value)
+
+        object_array, object_stride = self.get_object_array(task, preview=preview)
+        product = self.create_product(
+            product=parameters.product,
+            position_x_px=task.get_probe_positions_x(as_numpy=True),
+            position_y_px=task.get_probe_positions_y(as_numpy=True),
+            probe_array=task.get_data_to_cpu('probe', as_numpy=True),
+            object_array=object_array,
+            opr_weights=task.get_data_to_cpu('opr_mode_weights', as_numpy=True),
+            losses=losses,
+            object_stride=object_stride,
+        )
+        return ReconstructOutput(product=product, progress=epoch, result=0)
+
+    def run_task(
+        self, task: PtychographyTask, parameters: ReconstructInput, num_epochs: int
+    ) -> Iterator[ReconstructOutput]:
+        """
+        runs the task in steps of sync epochs and yields the product after each step;
+        intermediate products carry a downsampled object preview, so when the run stops
+        early (an exception raised by the task or thrown into this generator, such as a
+        cancellation) the full resolution object is yielded before the exception propagates
+        """
+        with task:
+            if task.reconstructor is None:
+                raise RuntimeError('Task reconstructor is None!')
+
+            epoch = 0
+            step_epochs = self.num_sync_epochs
+            is_preview = False
+
+            try:
+                while epoch < num_epochs:
+                    task.run(step_epochs)
+                    epoch += step_epochs
+                    step_epochs = min(step_epochs, num_epochs - epoch)
+                    is_preview = epoch < num_epochs
+                    yield self._create_task_output(task, parameters, epoch, preview=is_preview)
+            except Exception:
+                if is_preview:
+                    try:
+                        output = self._create_task_output(task, parameters, epoch, preview=False)
+                    except Exception:
+                        logger.exception('Failed to restore the full resolution object!')
+                    else:
+                        yield output
+
+                raise
+
     @property
     def num_epochs(self) -> int:
         return self.reconstructor_helper.num_epochs
@@ -11,6 +11,9 @@ class PtyChiSettings(Observable, Observer):
         # ReconstructorOptions
         self.num_epochs = self._group.create_integer_parameter('NumEpochs', 100, minimum=1)
         self.num_sync_epochs = self._group.create_integer_parameter('NumSyncEpochs', 1, minimum=1)
+        self.sync_preview_size = self._group.create_integer_parameter(
+            'SyncPreviewSize', 2048, minimum=0
+        )
         self.batch_size = self._group.create_integer_parameter('BatchSize', 100, minimum=1)
         self.batching_mode = self._group.create_string_parameter('BatchingMode', 'random')
         self.compact_mode_update_clustering = self._group.create_integer_parameter(
@@ -94,20 +94,22 @@ class PtychoNNTrainableReconstructor(TrainableReconstructor):
             upper=numpy.zeros_like(object_array), lower=numpy.zeros_like(object_array, dtype=float)
         )
 
-        for scan_point, object_patch_channels in zip(
-            parameters.product.probe_positions, object_patches
-        ):
-            patch_array = numpy.exp(1j * object_patch_channels[0])
-
-            if object_patch_channels.shape[0] == 2:
-                patch_array *= object_patch_channels[1]
-            else:
-                patch_array *= 0.5
-
-            object_point = object_geometry.map_coordinates_probe_to_object(scan_point)
-            stitcher.add_patch(
-                object_point.coordinate_x_px, object_point.coordinate_y_px, patch_array
-            )
+        object_coordinates_px = object_geometry.map_coordinates_probe_to_object_array(
+            parameters.product.probe_positions.coordinates_m
+        )
+        patch_array = numpy.exp(1j * object_patches[:, 0])
+
+        if object_patches.shape[1] == 2:
+            patch_array *= object_patches[:, 1]
+        else:
+            patch_array *= 0.5
+
+        stitcher.add_patches(
+            object_coordinates_px[:, -1],
+            object_coordinates_px[:, -2],
+            patch_array,
+            numpy.broadcast_to(1.0, patch_array.shape),
+        )
 
         object_ = Object(
             array=stitcher.stitch(),
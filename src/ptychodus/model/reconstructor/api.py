@@ -13,7 +13,7 @@ from ptychodus.api.reconstructor import (
 )
 
 from ..product import ProductAPI
-from ..task_manager import TaskManager
+from ..task_manager import CancellationToken, TaskManager, TaskPriority
 from .context import ReconstructBackgroundTask, ReconstructorContext, ReconstructorProgressMonitor
 from .matcher import DiffractionPatternPositionMatcher, PositionIndexFilter
 
@@ -34,6 +34,7 @@ class ReconstructorAPI:
         self._product_api = product_api
         self._context = context
         self._reconstructor_chooser = reconstructor_chooser
+        self._cancellation_tokens: list[CancellationToken] = list()
 
     def get_progress_monitor(self) -> ReconstructorProgressMonitor:
         return self._context.get_progress_monitor()
@@ -87,6 +88,7 @@ class ReconstructorAPI:
         logger.debug(parameters)
 
         finished_event = threading.Event()
+        cancellation_token = CancellationToken()
 
         background_task = ReconstructBackgroundTask(
             self._context,
@@ -94,8 +96,15 @@ class ReconstructorAPI:
             parameters,
             output_product_item,
             finished_event,
+            cancellation_token,
         )
-        self._task_manager.put_background_task(background_task)
+        self._task_manager.put_background_task(
+            background_task, priority=TaskPriority.COMPUTE, token=cancellation_token
+        )
+        self._cancellation_tokens = [
+            token for token in self._cancellation_tokens if not token.is_cancelled
+        ]
+        self._cancellation_tokens.append(cancellation_token)
 
         if block:
             while not self._task_manager.is_stopping:
@@ -104,6 +113,12 @@ class ReconstructorAPI:
 
         return output_product_index
 
+    def cancel_reconstructions(self) -> None:
+        for token in self._cancellation_tokens:
+            token.cancel()
+
+        self._cancellation_tokens.clear()
+
     def reconstruct_split(self, input_product_index: int) -> tuple[int, int]:
         output_product_index_odd = self.reconstruct(
             input_product_index,
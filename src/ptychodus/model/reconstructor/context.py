@@ -1,5 +1,5 @@
 from __future__ import annotations
-from collections.abc import Iterator
+from collections.abc import Generator, Iterator
 from dataclasses import dataclass
 from types import TracebackType
 from typing import overload
@@ -12,7 +12,7 @@ from ptychodus.api.product import Product
 from ptychodus.api.reconstructor import ReconstructInput, ReconstructOutput, Reconstructor
 
 from ..product import ProductRepositoryItem
-from ..task_manager import ForegroundTaskManager
+from ..task_manager import CancellationToken, ForegroundTaskManager, TaskCancelledError
 from .log import ReconstructorLogHandler
 
 __all__ = [
@@ -32,7 +32,8 @@ class UpdateProductTask:
 
     def __call__(self) -> None:
         name = self._product_item.get_name()
-        self._product_item.assign(self._product)
+        # reconstructors hand over freshly transferred arrays, so there is no need to copy
+        self._product_item.assign(self._product, copy_object=False)
         self._product_item.set_name(name)
 
 
@@ -137,20 +138,44 @@ class ReconstructBackgroundTask:
     parameters: ReconstructInput
     product_item: ProductRepositoryItem
     finished_event: threading.Event
+    cancellation_token: CancellationToken
 
     def __call__(self) -> None:
-        with self.context as context:
-            progress_monitor = context.get_progress_monitor()
-            progress_monitor.set_progress_goal(self.reconstructor.get_progress_goal())
-            tic = time.perf_counter()
+        try:
+            with self.context as context:
+                progress_monitor = context.get_progress_monitor()
+                progress_monitor.set_progress_goal(self.reconstructor.get_progress_goal())
+                tic = time.perf_counter()
 
-            for result in self.reconstructor.reconstruct(self.parameters):
-                context.update_progress(self.product_item, result)
+                outputs = self.reconstructor.reconstruct(self.parameters)
+
+                for result in outputs:
+                    context.update_progress(self.product_item, result)
+
+                    # stop between progress updates when cancelled
+                    if self.cancellation_token.is_cancelled:
+                        self._finish_cancelled(context, outputs)
 
-            toc = time.perf_counter()
-            logger.info(f'Reconstruction time {toc - tic:.4f} seconds.')
+                toc = time.perf_counter()
+                logger.info(f'Reconstruction time {toc - tic:.4f} seconds.')
+        finally:
+            self.finished_event.set()
+
+    def _finish_cancelled(
+        self, context: ReconstructorContext, outputs: Iterator[ReconstructOutput]
+    ) -> None:
+        """throws the cancellation into the reconstructor so it can yield a final result"""
+        if isinstance(outputs, Generator):
+            try:
+                result = outputs.throw(TaskCancelledError())
+            except (TaskCancelledError, StopIteration):
+                pass
+            else:
+                context.update_progress(self.product_item, result)
+            finally:
+                outputs.close()
 
-        self.finished_event.set()
+        raise TaskCancelledError
 
 
 class TrainBackgroundTask:  # TODO
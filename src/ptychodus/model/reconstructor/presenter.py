@@ -53,6 +53,9 @@ class ReconstructorPresenter(Observable, Observer):
     def reconstruct_transformed(self, input_product_index: int) -> Sequence[int]:
         return self._reconstructor_api.reconstruct_transformed(input_product_index)
 
+    def cancel_reconstructions(self) -> None:
+        self._reconstructor_api.cancel_reconstructions()
+
     @property
     def is_trainable(self) -> bool:
         reconstructor = self._reconstructor_chooser.get_current_plugin().strategy
@@ -1,8 +1,14 @@
+from __future__ import annotations
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass
+from enum import IntEnum
 from typing import Callable, Final, TypeAlias
 import logging
 import queue
 import threading
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -23,9 +29,51 @@ class ForegroundTaskManager(ABC):
 BackgroundTask: TypeAlias = Callable[[], ForegroundTask | None]
 
 
+class TaskPriority(IntEnum):
+    IO = 0
+    COMPUTE = 1
+
+
+class TaskCancelledError(Exception):
+    pass
+
+
+class CancellationToken:
+    """cooperative cancellation; long-running tasks should poll the token"""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise TaskCancelledError
+
+
+@dataclass(frozen=True)
+class TaskTelemetry:
+    name: str
+    priority: TaskPriority
+    wait_time_s: float
+    run_time_s: float
+    status: str
+
+
 class BackgroundTaskManager(ABC):
     @abstractmethod
-    def put_background_task(self, task: BackgroundTask) -> None:
+    def put_background_task(
+        self,
+        task: BackgroundTask,
+        *,
+        priority: TaskPriority = TaskPriority.IO,
+        token: CancellationToken | None = None,
+    ) -> CancellationToken:
         pass
 
     @property
@@ -34,43 +82,136 @@ class BackgroundTaskManager(ABC):
         pass
 
 
+@dataclass(frozen=True)
+class _QueuedTask:
+    task: BackgroundTask
+    name: str
+    priority: TaskPriority
+    token: CancellationToken
+    enqueue_time_s: float
+
+
 class TaskManager(BackgroundTaskManager, ForegroundTaskManager):
     WAIT_TIME_S: Final[float] = 1.0
+    DEFAULT_NUM_WORKERS: Final[Mapping[TaskPriority, int]] = {
+        TaskPriority.IO: 2,
+        TaskPriority.COMPUTE: 1,
+    }
 
-    def __init__(self) -> None:
+    def __init__(self, num_workers: Mapping[TaskPriority, int] | None = None) -> None:
+        """
+        workers serve their priority class and any more urgent class, so I/O tasks always have
+        workers that never pick up long-running compute tasks. Unlike the former single worker,
+        I/O tasks (such as appended diffraction arrays) may now run concurrently and finish out
+        of order; array loaders write disjoint slices and are reordered by array index on the
+        foreground thread.
+        """
         super().__init__()
-        self._background_queue: queue.Queue[BackgroundTask] = queue.Queue()
+        self._num_workers = dict(self.DEFAULT_NUM_WORKERS)
+
+        if num_workers is not None:
+            self._num_workers.update(num_workers)
+
+        self._background_queues: dict[TaskPriority, deque[_QueuedTask]] = {
+            priority: deque() for priority in TaskPriority
+        }
+        self._condition = threading.Condition()
+        self._num_unfinished_tasks = 0
+        self._running_tokens: set[CancellationToken] = set()
         self._foreground_queue: queue.Queue[ForegroundTask] = queue.Queue()
         self._stop_event = threading.Event()
-        self._worker: threading.Thread | None = None
+        self._workers: list[threading.Thread] = []
 
     @property
     def is_stopping(self) -> bool:
         return self._stop_event.is_set()
 
-    def put_background_task(self, task: BackgroundTask) -> None:
-        self._background_queue.put(task)
+    def put_background_task(
+        self,
+        task: BackgroundTask,
+        *,
+        priority: TaskPriority = TaskPriority.IO,
+        token: CancellationToken | None = None,
+    ) -> CancellationToken:
+        if token is None:
+            token = CancellationToken()
+
+        name = getattr(task, '__qualname__', type(task).__qualname__)
+        queued_task = _QueuedTask(task, name, priority, token, time.perf_counter())
+
+        with self._condition:
+            self._background_queues[priority].append(queued_task)
+            self._num_unfinished_tasks += 1
+            self._condition.notify_all()
+
+        return token
 
     @property
     def background_queue_size(self) -> int:
-        return self._background_queue.qsize()
+        with self._condition:
+            return sum(len(tasks) for tasks in self._background_queues.values())
+
+    def get_background_queue_size(self, priority: TaskPriority) -> int:
+        with self._condition:
+            return len(self._background_queues[priority])
+
+    def _get_next_task(self, max_priority: TaskPriority) -> _QueuedTask | None:
+        with self._condition:
+            while not self._stop_event.is_set():
+                for priority in TaskPriority:
+                    if priority > max_priority:
+                        break
+
+                    tasks = self._background_queues[priority]
 
-    def _run_background_tasks(self) -> None:
+                    if tasks:
+                        queued_task = tasks.popleft()
+                        self._running_tokens.add(queued_task.token)
+                        return queued_task
+
+                if not self._condition.wait(timeout=self.WAIT_TIME_S):
+                    return None
+
+        return None
+
+    def _run_background_task(self, queued_task: _QueuedTask) -> None:
+        tic = time.perf_counter()
+        status = 'finished'
+
+        try:
+            queued_task.token.raise_if_cancelled()
+            foreground_task = queued_task.task()
+        except TaskCancelledError:
+            status = 'cancelled'
+            logger.info(f'Background task {queued_task.name} cancelled.')
+        except Exception:
+            status = 'failed'
+            logger.exception(f'Background task exception during {queued_task.task}!')
+        else:
+            if foreground_task is not None:
+                self._foreground_queue.put(foreground_task)
+        finally:
+            toc = time.perf_counter()
+            telemetry = TaskTelemetry(
+                name=queued_task.name,
+                priority=queued_task.priority,
+                wait_time_s=tic - queued_task.enqueue_time_s,
+                run_time_s=toc - tic,
+                status=status,
+            )
+            logger.debug(telemetry)
+
+            with self._condition:
+                self._running_tokens.discard(queued_task.token)
+                self._num_unfinished_tasks -= 1
+                self._condition.notify_all()
+
+    def _run_background_tasks(self, max_priority: TaskPriority) -> None:
         while not self._stop_event.is_set():
-            try:
-                background_task = self._background_queue.get(block=True, timeout=self.WAIT_TIME_S)
-            except queue.Empty:
-                continue
+            queued_task = self._get_next_task(max_priority)
 
-            try:
-                foreground_task = background_task()
-            except Exception:
-                logger.exception(f'Background task exception during {background_task}!')
-            else:
-                if foreground_task is not None:
-                    self._foreground_queue.put(foreground_task)
-            finally:
-                self._background_queue.task_done()
+            if queued_task is not None:
+                self._run_background_task(queued_task)
 
     def put_foreground_task(self, task: ForegroundTask) -> None:
         self._foreground_queue.put(task)
@@ -94,32 +235,64 @@ class TaskManager(BackgroundTaskManager, ForegroundTaskManager):
                 self._foreground_queue.task_done()
 
     def start(self) -> None:
-        if self._worker is None:
-            logger.info('Starting task manager...')
-            self._stop_event.clear()
-            self._worker = threading.Thread(target=self._run_background_tasks)
-            self._worker.start()
-            logger.info('Task manager started.')
-        else:
-            logger.warning('Worker already started!')
+        if self._workers:
+            logger.warning('Workers already started!')
+            return
+
+        logger.info('Starting task manager...')
+        self._stop_event.clear()
+
+        for priority, num_workers in self._num_workers.items():
+            for worker_index in range(num_workers):
+                worker = threading.Thread(
+                    target=self._run_background_tasks,
+                    args=(priority,),
+                    name=f'TaskManager-{priority.name}-{worker_index}',
+                )
+                worker.start()
+                self._workers.append(worker)
+
+        logger.info(f'Task manager started with {len(self._workers)} workers.')
 
     def _stop(self) -> None:
-        if self._worker is None:
-            logger.warning('Worker is None!')
+        if not self._workers:
+            logger.warning('No workers!')
         else:
             logger.info('Stopping task manager...')
-            self._stop_event.set()
-            self._worker.join()
-            self._worker = None
+
+            with self._condition:
+                self._stop_event.set()
+                self._condition.notify_all()
+
+            for worker in self._workers:
+                worker.join()
+
+            self._workers.clear()
             logger.info('Task manager stopped.')
 
+    def cancel_background_tasks(self) -> None:
+        """cancels queued and running background tasks"""
+        with self._condition:
+            for tasks in self._background_queues.values():
+                for queued_task in tasks:
+                    queued_task.token.cancel()
+
+            for token in self._running_tokens:
+                token.cancel()
+
     def stop(self, *, await_finish: bool) -> None:
         if self._stop_event.is_set():
             logger.info('Task manager already stopped.')
         else:
             if await_finish:
                 logger.info('Finishing tasks...')
-                self._background_queue.join()
+
+                with self._condition:
+                    while self._num_unfinished_tasks > 0 and self._workers:
+                        self._condition.wait()
+
                 logger.info('Tasks finished.')
+            else:
+                self.cancel_background_tasks()
 
             self._stop()
@@ -1,19 +1,20 @@
 from __future__ import annotations
 from collections.abc import Iterator
 
-from matplotlib.colors import Normalize
 import numpy
 
 from ptychodus.api.geometry import PixelGeometry
 from ptychodus.api.visualization import (
     NumberArrayType,
     RealArrayType,
+    RGBAArrayType,
     VisualizationProduct,
 )
 
 from .color_axis import ColorAxis
-from .color_model import CylindricalColorModelParameter
+from .color_model import CylindricalColorModel, CylindricalColorModelParameter
 from .components import AmplitudeArrayComponent, PhaseInRadiansArrayComponent
+from .lookup_table import CylindricalLookupTable
 from .renderer import Renderer
 from .transformation import ScalarTransformationParameter
 
@@ -35,6 +36,8 @@ class CylindricalColorModelRenderer(Renderer):
         self._add_group('color_axis', color_axis, observe=True)
         self._color_model = CylindricalColorModelParameter()
         self._add_parameter('color_model', self._color_model)
+        self._lookup_table_model: CylindricalColorModel | None = None
+        self._lookup_table: CylindricalLookupTable | None = None
 
     def variants(self) -> Iterator[str]:
         return self._color_model.choices()
@@ -48,31 +51,53 @@ class CylindricalColorModelRenderer(Renderer):
     def is_cyclic(self) -> bool:
         return True
 
-    def _colorize(self, amplitude: RealArrayType, phase_rad: RealArrayType) -> RealArrayType:
-        vrange = self._color_axis.get_range()
-        norm = Normalize(vmin=vrange.lower, vmax=vrange.upper, clip=False)
+    def is_elementwise(self) -> bool:
+        return True
 
+    def _get_lookup_table(self) -> CylindricalLookupTable:
         model = self._color_model.get_plugin()
+
+        if self._lookup_table is None or self._lookup_table_model is not model:
+            self._lookup_table = CylindricalLookupTable(model)
+            self._lookup_table_model = model
+
+        return self._lookup_table
+
+    def _colorize(self, amplitude: RealArrayType, phase_rad: RealArrayType) -> RGBAArrayType:
+        vrange = self._color_axis.get_range()
+        lookup_table = self._get_lookup_table()
         h = (phase_rad + numpy.pi) / (2 * numpy.pi)
-        return model(h, norm(amplitude))
+        return lookup_table(h, amplitude, vrange.lower, vrange.upper)
 
     def colorize(self, array: NumberArrayType) -> RealArrayType:
+        return self.colorize_rgba(array) / 255.0
+
+    def colorize_rgba(self, array: NumberArrayType) -> RGBAArrayType:
         amplitude = self._amplitude_component.calculate(array)
         amplitude_transformed = self._transformation.transform(amplitude)
         phase_rad = self._phase_component.calculate(array)
         return self._colorize(amplitude_transformed, phase_rad)
 
     def render(
-        self, array: NumberArrayType, pixel_geometry: PixelGeometry, *, autoscale_color_axis: bool
+        self,
+        array: NumberArrayType,
+        pixel_geometry: PixelGeometry,
+        *,
+        autoscale_color_axis: bool,
+        include_rgba: bool = True,
     ) -> VisualizationProduct:
-        amplitude = self._amplitude_component.calculate(array)
-        amplitude_transformed = self._transformation.transform(amplitude)
-        phase_rad = self._phase_component.calculate(array)
+        rgba: RGBAArrayType | None = None
+
+        if autoscale_color_axis or include_rgba:
+            amplitude = self._amplitude_component.calculate(array)
+            amplitude_transformed = self._transformation.transform(amplitude)
 
-        if autoscale_color_axis:
-            self._color_axis.set_to_data_range(amplitude_transformed)
+            if autoscale_color_axis:
+                self._color_axis.set_to_data_range(amplitude_transformed)
 
-        rgba = self._colorize(amplitude_transformed, phase_rad)
+            if include_rgba:
+                phase_rad = self._phase_component.calculate(array)
+                rgba = self._colorize(amplitude_transformed, phase_rad)
 
         return VisualizationProduct(
             value_label=self._transformation.decorate_text(self._amplitude_component.name),
@@ -1,18 +1,20 @@
 from __future__ import annotations
 from collections.abc import Iterator
-from matplotlib.cm import ScalarMappable
-from matplotlib.colors import Normalize
+
+from matplotlib.colors import Colormap
 
 from ptychodus.api.geometry import PixelGeometry
 from ptychodus.api.visualization import (
     NumberArrayType,
     RealArrayType,
+    RGBAArrayType,
     VisualizationProduct,
 )
 
 from .color_axis import ColorAxis
 from .colormap import ColormapParameter
 from .components import DataArrayComponent
+from .lookup_table import ColormapLookupTable
 from .renderer import Renderer
 from .transformation import ScalarTransformationParameter
 
@@ -33,6 +35,8 @@ class ColormapRenderer(Renderer):
         self._add_group('color_axis', color_axis, observe=True)
         self._colormap = colormap
         self._add_parameter('colormap', colormap)
+        self._lookup_table_cmap: Colormap | None = None
+        self._lookup_table: ColormapLookupTable | None = None
 
     def variants(self) -> Iterator[str]:
         return self._colormap.choices()
@@ -46,14 +50,27 @@ class ColormapRenderer(Renderer):
     def is_cyclic(self) -> bool:
         return self._component.is_cyclic
 
-    def _colorize(self, values_transformed: RealArrayType) -> RealArrayType:
-        vrange = self._color_axis.get_range()
-        norm = Normalize(vmin=vrange.lower, vmax=vrange.upper, clip=False)
+    def is_elementwise(self) -> bool:
+        return self._component.is_elementwise
+
+    def _get_lookup_table(self) -> ColormapLookupTable:
         cmap = self._colormap.get_plugin()
-        scalar_mappable = ScalarMappable(norm, cmap)
-        return scalar_mappable.to_rgba(values_transformed)
+
+        if self._lookup_table is None or self._lookup_table_cmap is not cmap:
+            self._lookup_table = ColormapLookupTable(cmap)
+            self._lookup_table_cmap = cmap
+
+        return self._lookup_table
+
+    def _colorize(self, values_transformed: RealArrayType) -> RGBAArrayType:
+        vrange = self._color_axis.get_range()
+        lookup_table = self._get_lookup_table()
+        return lookup_table(values_transformed, vrange.lower, vrange.upper)
 
     def colorize(self, array: NumberArrayType) -> RealArrayType:
+        return self.colorize_rgba(array) / 255.0
+
+    def colorize_rgba(self, array: NumberArrayType) -> RGBAArrayType:
         values = self._component.calculate(array)
         values_transformed = self._transformation.transform(values)
         return self._colorize(values_transformed)
@@ -64,14 +81,19 @@ class ColormapRenderer(Renderer):
         pixel_geometry: PixelGeometry,
         *,
         autoscale_color_axis: bool,
+        include_rgba: bool = True,
     ) -> VisualizationProduct:
-        values = self._component.calculate(array)
-        values_transformed = self._transformation.transform(values)
+        rgba: RGBAArrayType | None = None
+
+        if autoscale_color_axis or include_rgba:
+            values = self._component.calculate(array)
+            values_transformed = self._transformation.transform(values)
 
-        if autoscale_color_axis:
-            self._color_axis.set_to_data_range(values_transformed)
+            if autoscale_color_axis:
+                self._color_axis.set_to_data_range(values_transformed)
 
-        rgba = self._colorize(values_transformed)
+            if include_rgba:
+                rgba = self._colorize(values_transformed)
 
         return VisualizationProduct(
             value_label=self._transformation.decorate_text(self._component.name),
@@ -7,9 +7,10 @@ from ptychodus.api.typing import NumberArrayType, RealArrayType
 
 
 class DataArrayComponent(ABC):
-    def __init__(self, name: str, *, is_cyclic: bool) -> None:
+    def __init__(self, name: str, *, is_cyclic: bool, is_elementwise: bool = True) -> None:
         self._name = name
         self._is_cyclic = is_cyclic
+        self._is_elementwise = is_elementwise
 
     @property
     def name(self) -> str:
@@ -19,6 +20,10 @@ class DataArrayComponent(ABC):
     def is_cyclic(self) -> bool:
         return self._is_cyclic
 
+    @property
+    def is_elementwise(self) -> bool:
+        return self._is_elementwise
+
     @abstractmethod
     def calculate(self, array: NumberArrayType) -> RealArrayType:
         pass
@@ -58,7 +63,7 @@ class PhaseInRadiansArrayComponent(DataArrayComponent):
 
 class UnwrappedPhaseInRadiansArrayComponent(DataArrayComponent):
     def __init__(self) -> None:
-        super().__init__('unwrapped_phase', is_cyclic=False)
+        super().__init__('unwrapped_phase', is_cyclic=False, is_elementwise=False)
 
     def calculate(self, array: NumberArrayType) -> RealArrayType:
         phase_rad = numpy.angle(array).astype(numpy.single)  # type: ignore
@@ -1,14 +1,16 @@
 from __future__ import annotations
 from collections.abc import Iterator
+from typing import Final
 import logging
 
-from ptychodus.api.geometry import PixelGeometry
+from ptychodus.api.geometry import Box2D, PixelGeometry
 from ptychodus.api.observer import Observable, Observer
 from ptychodus.api.plugins import PluginChooser
 from ptychodus.api.visualization import (
     NumberArrayType,
     RealArrayType,
     VisualizationProduct,
+    VisualizationTile,
 )
 
 from .color_axis import ColorAxis
@@ -23,6 +25,7 @@ from .components import (
     UnwrappedPhaseInRadiansArrayComponent,
 )
 
+from .pyramid import TilePyramid
 from .renderer import Renderer
 from .transformation import ScalarTransformationParameter
 
@@ -30,8 +33,11 @@ logger = logging.getLogger(__name__)
 
 
 class VisualizationEngine(Observable, Observer):
+    TILED_RENDERING_THRESHOLD: Final[int] = 4096 * 4096  # pixels
+
     def __init__(self, *, is_complex: bool) -> None:
         super().__init__()
+        self._pyramid: TilePyramid | None = None
         self._renderer_chooser = PluginChooser[Renderer]()
         self._transformation = ScalarTransformationParameter()
         self._color_axis = ColorAxis()
@@ -159,11 +165,32 @@ class VisualizationEngine(Observable, Observer):
         *,
         autoscale_color_axis: bool,
     ) -> VisualizationProduct:
+        """renders the full image, unless the array is large enough to be rendered as tiles"""
+        include_rgba = not self.is_rendered_as_tiles(array)
         return self._renderer_plugin.strategy.render(
-            array, pixel_geometry, autoscale_color_axis=autoscale_color_axis
+            array,
+            pixel_geometry,
+            autoscale_color_axis=autoscale_color_axis,
+            include_rgba=include_rgba,
         )
 
+    def is_rendered_as_tiles(self, array: NumberArrayType) -> bool:
+        return array.size > VisualizationEngine.TILED_RENDERING_THRESHOLD
+
+    def render_tiles(
+        self, array: NumberArrayType, viewport: Box2D, zoom: float
+    ) -> list[VisualizationTile]:
+        """renders the tiles covering the viewport (in array pixel coordinates) at a level of
+        detail matching the zoom (screen pixels per array pixel); tiles are cached until the
+        array or any visualization parameter changes"""
+        if self._pyramid is None or self._pyramid.array is not array:
+            self._pyramid = TilePyramid(array, self._renderer_plugin.strategy)
+
+        return self._pyramid.get_tiles(viewport, zoom)
+
     def _update(self, observable: Observable) -> None:
+        self._pyramid = None
+
         if observable is self._renderer_chooser:
             self._renderer_plugin.strategy.remove_observer(self)
             self._renderer_plugin = self._renderer_chooser.get_current_plugin()
@@ -0,0 +1,156 @@
+from collections.abc import Callable
+import concurrent.futures
+
+from matplotlib.colors import Colormap, to_rgba_array
+import numpy
+
+from ptychodus.api.typing import RealArrayType
+from ptychodus.api.visualization import RGBAArrayType
+
+from .color_model import CylindricalColorModel
+
+__all__ = [
+    'ColormapLookupTable',
+    'CylindricalLookupTable',
+]
+
+RGBA_TILE_SIZE = 1 << 20  # pixels per tile
+
+
+def _to_uint8(rgba: RealArrayType) -> RGBAArrayType:
+    return numpy.rint(numpy.clip(rgba, 0.0, 1.0) * 255.0).astype(numpy.uint8)
+
+
+def _get_scale(size: int, vmin: float, vmax: float) -> float:
+    # matches matplotlib.colors.Normalize, which maps everything to zero when vmin == vmax
+    return size / (vmax - vmin) if vmax > vmin else 0.0
+
+
+def _map_in_tiles(
+    map_tile: Callable[[slice], None], shape: tuple[int, ...], max_workers: int | None
+) -> None:
+    num_rows = shape[0] if shape else 1
+    row_size = max(1, int(numpy.prod(shape[1:])))
+    rows_per_tile = max(1, RGBA_TILE_SIZE // row_size)
+    tiles = [slice(start, start + rows_per_tile) for start in range(0, num_rows, rows_per_tile)]
+
+    if len(tiles) <= 1 or max_workers == 1:
+        for tile in tiles:
+            map_tile(tile)
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for _ in executor.map(map_tile, tiles):
+                pass
+
+
+class ColormapLookupTable:
+    """
+    quantizes normalized values into a precomputed uint8 RGBA colormap table; the default size
+    matches the colormap's own quantization so colors agree with ScalarMappable.to_rgba
+    """
+
+    def __init__(self, cmap: Colormap, size: int | None = None) -> None:
+        size = cmap.N if size is None else size
+        self._size = size
+        colors = cmap(numpy.linspace(0.0, 1.0, size))
+        under = to_rgba_array(cmap.get_under())
+        over = to_rgba_array(cmap.get_over())
+        bad = to_rgba_array(cmap.get_bad())
+        # layout: under, colors..., over, bad
+        self._table = _to_uint8(numpy.concatenate((under, colors, over, bad)))
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def _quantize(self, values: RealArrayType, vmin: float, vmax: float) -> numpy.ndarray:
+        size = self._size
+
+        with numpy.errstate(invalid='ignore', over='ignore'):
+            x = numpy.subtract(values, vmin, dtype=numpy.float64)
+            x *= _get_scale(size, vmin, vmax)
+            is_over = x > size
+            is_bad = numpy.isnan(x)
+            numpy.floor(x, out=x)
+            numpy.clip(x, -1, size - 1, out=x)
+            x += 1
+            x[is_over] = size + 1
+            x[is_bad] = size + 2
+
+        return x.astype(numpy.intp)
+
+    def __call__(
+        self, values: RealArrayType, vmin: float, vmax: float, *, max_workers: int | None = None
+    ) -> RGBAArrayType:
+        rgba = numpy.empty(values.shape + (4,), dtype=numpy.uint8)
+
+        def map_tile(tile: slice) -> None:
+            indexes = self._quantize(values[tile], vmin, vmax)
+            numpy.take(self._table, indexes, axis=0, out=rgba[tile], mode='clip')
+
+        _map_in_tiles(map_tile, values.shape, max_workers)
+        return rgba
+
+
+class CylindricalLookupTable:
+    """
+    quantizes (hue, value) pairs into a precomputed uint8 RGBA table for a color model; hue
+    changes RGB channels six times faster than value, hence the finer hue sampling
+    """
+
+    def __init__(
+        self, model: CylindricalColorModel, hue_size: int = 1536, value_size: int = 512
+    ) -> None:
+        self._hue_size = hue_size
+        self._value_size = value_size
+        hue, value = numpy.meshgrid(
+            numpy.arange(hue_size) / hue_size,
+            numpy.linspace(0.0, 1.0, value_size),
+            indexing='ij',
+        )
+        colors = model(hue.ravel(), value.ravel())
+        bad = numpy.zeros((1, 4))
+        # layout: hue-major colors..., bad
+        self._table = _to_uint8(numpy.concatenate((colors, bad)))
+
+    def _quantize(
+        self, hue: RealArrayType, values: RealArrayType, vmin: float, vmax: float
+    ) -> numpy.ndarray:
+        hue_size = self._hue_size
+        value_size = self._value_size
+
+        with numpy.errstate(invalid='ignore', over='ignore'):
+            h = numpy.multiply(hue, hue_size, dtype=numpy.float64)
+            numpy.rint(h, out=h)
+            numpy.mod(h, hue_size, out=h)
+
+            x = numpy.subtract(values, vmin, dtype=numpy.float64)
+            x *= _get_scale(value_size - 1, vmin, vmax)
+            numpy.rint(x, out=x)
+            numpy.clip(x, 0, value_size - 1, out=x)
+
+            x += h * value_size
+            x[numpy.isnan(x)] = hue_size * value_size
+
+        return x.astype(numpy.intp)
+
+    def __call__(
+        self,
+        hue: RealArrayType,
+        values: RealArrayType,
+        vmin: float,
+        vmax: float,
+        *,
+        max_workers: int | None = None,
+    ) -> RGBAArrayType:
+        if hue.shape != values.shape:
+            raise ValueError(f'Shape mismatch (hue={hue.shape} and values={values.shape}).')
+
+        rgba = numpy.empty(values.shape + (4,), dtype=numpy.uint8)
+
+        def map_tile(tile: slice) -> None:
+            indexes = self._quantize(hue[tile], values[tile], vmin, vmax)
+            numpy.take(self._table, indexes, axis=0, out=rgba[tile], mode='clip')
+
+        _map_in_tiles(map_tile, values.shape, max_workers)
+        return rgba
@@ -0,0 +1,143 @@
+from __future__ import annotations
+from collections import OrderedDict
+import math
+
+import numpy
+
+from ptychodus.api.geometry import Box2D
+from ptychodus.api.typing import NumberArrayType
+from ptychodus.api.visualization import RGBAArrayType, VisualizationTile
+
+from .renderer import Renderer
+
+
+def _average_blocks(array: NumberArrayType) -> NumberArrayType:
+    """averages 2x2 blocks; a trailing odd row or column is averaged with itself"""
+    height, width = array.shape
+    padded = numpy.pad(array, ((0, height % 2), (0, width % 2)), mode='edge')
+    blocks = padded.reshape(padded.shape[0] // 2, 2, padded.shape[1] // 2, 2)
+    return blocks.mean(axis=(1, 3))
+
+
+class TilePyramid:
+    """
+    level-of-detail pyramid of rendered tiles; level k averages 2**k by 2**k blocks of the
+    array so that coarse levels do not alias
+    """
+
+    def __init__(
+        self,
+        array: NumberArrayType,
+        renderer: Renderer,
+        *,
+        tile_size: int = 512,
+        max_num_tiles: int = 256,
+    ) -> None:
+        if array.ndim != 2:
+            raise ValueError(f'Array must be 2-dimensional (actual={array.ndim}).')
+
+        self._array = array
+        self._renderer = renderer
+        self._tile_size = tile_size
+        self._max_num_tiles = max_num_tiles
+        self._tiles: OrderedDict[tuple[int, int, int], VisualizationTile] = OrderedDict()
+        self._level_arrays: dict[int, NumberArrayType] = {0: array}
+        self._level_rgba: dict[int, RGBAArrayType] = dict()
+
+        num_levels = 1
+        max_extent = max(array.shape)
+
+        while max_extent > tile_size:
+            max_extent = (max_extent + 1) // 2
+            num_levels += 1
+
+        self._num_levels = num_levels
+
+    @property
+    def array(self) -> NumberArrayType:
+        return self._array
+
+    @property
+    def num_levels(self) -> int:
+        return self._num_levels
+
+    def get_level_for_zoom(self, zoom: float) -> int:
+        """returns the coarsest level with at least one sample per screen pixel at this zoom"""
+        if zoom <= 0.0:
+            return self._num_levels - 1
+
+        level = math.floor(math.log2(1.0 / zoom)) if zoom < 1.0 else 0
+        return min(max(level, 0), self._num_levels - 1)
+
+    def _get_level_array(self, level: int) -> NumberArrayType:
+        try:
+            return self._level_arrays[level]
+        except KeyError:
+            pass
+
+        # each level is computed once from the next finer level
+        level_array = _average_blocks(self._get_level_array(level - 1))
+        self._level_arrays[level] = level_array
+        return level_array
+
+    def _render_tile(self, level: int, row: int, column: int) -> VisualizationTile:
+        level_array = self._get_level_array(level)
+        row_slice = slice(row * self._tile_size, (row + 1) * self._tile_size)
+        column_slice = slice(column * self._tile_size, (column + 1) * self._tile_size)
+
+        if self._renderer.is_elementwise():
+            rgba = self._renderer.colorize_rgba(level_array[row_slice, column_slice])
+        else:
+            # the whole level is needed to render any part of it
+            try:
+                level_rgba = self._level_rgba[level]
+            except KeyError:
+                level_rgba = self._renderer.colorize_rgba(level_array)
+                self._level_rgba[level] = level_rgba
+
+            rgba = level_rgba[row_slice, column_slice]
+
+        step = 1 << level
+        box = Box2D(
+            x=column * self._tile_size * step,
+            y=row * self._tile_size * step,
+            width=rgba.shape[1] * step,
+            height=rgba.shape[0] * step,
+        )
+        return VisualizationTile(level=level, row=row, column=column, box=box, rgba=rgba)
+
+    def get_tile(self, level: int, row: int, column: int) -> VisualizationTile:
+        key = (level, row, column)
+
+        try:
+            tile = self._tiles[key]
+        except KeyError:
+            tile = self._render_tile(level, row, column)
+            self._tiles[key] = tile
+
+            while len(self._tiles) > self._max_num_tiles:
+                self._tiles.popitem(last=False)
+        else:
+            self._tiles.move_to_end(key)
+
+        return tile
+
+    def get_tiles(self, viewport: Box2D, zoom: float) -> list[VisualizationTile]:
+        """returns tiles covering the viewport (in array pixel coordinates) at the zoom level
+        matching the number of screen pixels per array pixel"""
+        level = self.get_level_for_zoom(zoom)
+        level_height, level_width = self._get_level_array(level).shape
+        tile_extent = self._tile_size << level
+        num_rows = math.ceil(level_height / self._tile_size)
+        num_columns = math.ceil(level_width / self._tile_size)
+
+        row_begin = max(math.floor(viewport.y_begin / tile_extent), 0)
+        row_end = min(math.ceil(viewport.y_end / tile_extent), num_rows)
+        column_begin = max(math.floor(viewport.x_begin / tile_extent), 0)
+        column_end = min(math.ceil(viewport.x_end / tile_extent), num_columns)
+
+        return [
+            self.get_tile(level, row, column)
+            for row in range(row_begin, row_end)
+            for column in range(column_begin, column_end)
+        ]
@@ -6,6 +6,7 @@ from ptychodus.api.parametric import ParameterGroup
 from ptychodus.api.visualization import (
     NumberArrayType,
     RealArrayType,
+    RGBAArrayType,
     VisualizationProduct,
 )
 
@@ -34,12 +35,26 @@ class Renderer(ParameterGroup):
     def is_cyclic(self) -> bool:
         pass
 
+    @abstractmethod
+    def is_elementwise(self) -> bool:
+        """returns whether each output pixel depends only on the matching array element"""
+        pass
+
     @abstractmethod
     def colorize(self, array: NumberArrayType) -> RealArrayType:
         pass
 
+    @abstractmethod
+    def colorize_rgba(self, array: NumberArrayType) -> RGBAArrayType:
+        pass
+
     @abstractmethod
     def render(
-        self, array: NumberArrayType, pixel_geometry: PixelGeometry, *, autoscale_color_axis: bool
+        self,
+        array: NumberArrayType,
+        pixel_geometry: PixelGeometry,
+        *,
+        autoscale_color_axis: bool,
+        include_rgba: bool = True,
     ) -> VisualizationProduct:
         pass
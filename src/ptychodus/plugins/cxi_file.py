@@ -5,7 +5,7 @@ import logging
 import h5py
 import numpy
 
-from .h5_diffraction_file import H5DiffractionPatternArray, H5DiffractionFileTreeBuilder
+from .h5_diffraction_file import H5DiffractionFileTreeBuilder, split_h5_diffraction_pattern_array
 from ptychodus.api.geometry import ImageExtent, PixelGeometry
 from ptychodus.api.diffraction import (
     DiffractionDataset,
@@ -19,7 +19,6 @@ from ptychodus.api.product import ELECTRON_VOLT_J
 from ptychodus.api.probe_positions import (
     ProbePositionSequence,
     ProbePositionFileReader,
-    ProbePosition,
 )
 from ptychodus.api.typing import ComplexArrayType
 
@@ -38,7 +37,7 @@ class CXIDiffractionFileReader(DiffractionFileReader):
             data = h5_file[self._data_path]
 
             if isinstance(data, h5py.Dataset):
-                num_patterns, detector_height, detector_width = data.shape
+                _, detector_height, detector_width = data.shape
 
                 detector_extent = ImageExtent(detector_width, detector_height)
                 detector_distance_m = float(
@@ -54,8 +53,12 @@ class CXIDiffractionFileReader(DiffractionFileReader):
                 # TODO load detector mask; zeros are good pixels
                 # /entry_1/instrument_1/detector_1/mask Dataset {512, 512}
 
+                array_list = split_h5_diffraction_pattern_array(
+                    file_path.stem, file_path, self._data_path, data
+                )
+
                 metadata = DiffractionMetadata(
-                    num_patterns_per_array=[num_patterns],
+                    num_patterns_per_array=[len(array.get_indexes()) for array in array_list],
                     pattern_dtype=data.dtype,
                     detector_distance_m=detector_distance_m,
                     detector_extent=detector_extent,
@@ -64,30 +67,19 @@ class CXIDiffractionFileReader(DiffractionFileReader):
                     file_path=file_path,
                 )
 
-                array = H5DiffractionPatternArray(
-                    label=file_path.stem,
-                    indexes=numpy.arange(num_patterns),
-                    file_path=file_path,
-                    data_path=self._data_path,
-                )
-
-                return SimpleDiffractionDataset(metadata, contents_tree, [array])
+                return SimpleDiffractionDataset(metadata, contents_tree, array_list)
             else:
                 raise ValueError(f'Expected dataset at {self._data_path}, got {type(data)}.')
 
 
 class CXIPositionFileReader(ProbePositionFileReader):
     def read(self, file_path: Path) -> ProbePositionSequence:
-        point_list: list[ProbePosition] = list()
-
         with h5py.File(file_path, 'r') as h5_file:
             xyz_m = h5_file['/entry_1/data_1/translation'][()]
 
-            for idx, (x, y, z) in enumerate(xyz_m):
-                point = ProbePosition(idx, x, y)
-                point_list.append(point)
-
-        return ProbePositionSequence(point_list)
+        return ProbePositionSequence.create_from_arrays(
+            numpy.arange(len(xyz_m)), numpy.column_stack((xyz_m[:, 1], xyz_m[:, 0]))
+        )
 
 
 class CXIProbeFileReader(ProbeFileReader):
@@ -1,5 +1,8 @@
+from collections.abc import Sequence
 from pathlib import Path
+import functools
 import logging
+import os
 
 import h5py
 import numpy
@@ -13,6 +16,7 @@ from ptychodus.api.diffraction import (
     DiffractionArray,
     DiffractionPatterns,
     DiffractionIndexes,
+    PatternRegion,
     SimpleDiffractionDataset,
 )
 from ptychodus.api.plugins import PluginRegistry
@@ -23,13 +27,19 @@ logger = logging.getLogger(__name__)
 
 class H5DiffractionPatternArray(DiffractionArray):
     def __init__(
-        self, label: str, indexes: DiffractionIndexes, file_path: Path, data_path: str
+        self,
+        label: str,
+        indexes: DiffractionIndexes,
+        file_path: Path,
+        data_path: str,
+        patterns_slice: slice | None = None,
     ) -> None:
         super().__init__()
         self._label = label
         self._indexes = indexes
         self._file_path = file_path
         self._data_path = data_path
+        self._patterns_slice = slice(None) if patterns_slice is None else patterns_slice
 
     def get_label(self) -> str:
         return self._label
@@ -37,7 +47,32 @@ class H5DiffractionPatternArray(DiffractionArray):
     def get_indexes(self) -> DiffractionIndexes:
         return self._indexes
 
-    def get_patterns(self) -> DiffractionPatterns:
+    def get_source_files(self) -> Sequence[Path]:
+        """returns the file path along with any external link, virtual dataset source, or
+        external raw storage files that the dataset reads from"""
+        source_files = [self._file_path]
+
+        try:
+            with h5py.File(self._file_path, 'r') as h5_file:
+                item = h5_file[self._data_path]
+
+                if isinstance(item, h5py.Dataset):
+                    source_files.append(Path(item.file.filename))
+
+                    if item.is_virtual:
+                        source_files.extend(
+                            Path(source.file_name) for source in item.virtual_sources()
+                        )
+
+                    if item.external is not None:
+                        source_files.extend(Path(external[0]) for external in item.external)
+        except (OSError, KeyError):
+            logger.debug(f'Failed to resolve source files for "{self._data_path}"!')
+
+        resolved = (fp if fp.is_absolute() else self._file_path.parent / fp for fp in source_files)
+        return list(dict.fromkeys(resolved))
+
+    def get_patterns(self, region: PatternRegion | None = None) -> DiffractionPatterns:
         with h5py.File(self._file_path, 'r') as h5_file:
             try:
                 item = h5_file[self._data_path]
@@ -80,12 +115,71 @@ class H5DiffractionPatternArray(DiffractionArray):
                     names = ' '.join(missing_filter_names)
                     raise RuntimeError(f'Missing filters needed to read dataset: {names}!')
 
-                return item[:]
+                if region is None:
+                    return item[self._patterns_slice]
+                elif item.ndim == 3:
+                    # read only the hyperslab (and the chunks) that overlap the region
+                    return item[self._patterns_slice, region.slice_y, region.slice_x]
+
+                return region.apply(item[self._patterns_slice])
             else:
                 raise ValueError(f'Path {self._file_path}:{self._data_path} is not a dataset!')
 
 
+def split_h5_diffraction_pattern_array(
+    label: str,
+    file_path: Path,
+    data_path: str,
+    data: h5py.Dataset,
+    *,
+    max_num_arrays: int | None = None,
+) -> Sequence[H5DiffractionPatternArray]:
+    """
+    splits a single pattern dataset into chunk-aligned arrays that can be loaded concurrently;
+    arrays reopen the dataset through data_path (the path that was opened, which may be an
+    external or soft link) rather than the resolved dataset name.
+
+    note that h5py serializes every call into libhdf5 behind a global lock, so loading these
+    arrays on threads overlaps only the preprocessing, not the reads and filter decompression;
+    enable MultiprocessLoadingEnabled to decompress the arrays in parallel worker processes
+    """
+    num_patterns = data.shape[0]
+    patterns_per_chunk = 1 if data.chunks is None else data.chunks[0]
+    num_arrays = max(1, os.cpu_count() or 1) if max_num_arrays is None else max_num_arrays
+    num_chunks_per_array = -(-num_patterns // (num_arrays * patterns_per_chunk))
+    patterns_per_array = max(1, num_chunks_per_array) * patterns_per_chunk
+
+    if patterns_per_array >= num_patterns:
+        return [
+            H5DiffractionPatternArray(
+                label=label,
+                indexes=numpy.arange(num_patterns),
+                file_path=file_path,
+                data_path=data_path,
+            )
+        ]
+
+    array_list: list[H5DiffractionPatternArray] = list()
+
+    for start in range(0, num_patterns, patterns_per_array):
+        stop = min(start + patterns_per_array, num_patterns)
+        array = H5DiffractionPatternArray(
+            label=f'{label}[{start}:{stop}]',
+            indexes=numpy.arange(start, stop),
+            file_path=file_path,
+            data_path=data_path,
+            patterns_slice=slice(start, stop),
+        )
+        array_list.append(array)
+
+    logger.debug(f'Split "{data_path}" into {len(array_list)} arrays of {patterns_per_array}.')
+    return array_list
+
+
 class H5DiffractionFileTreeBuilder:
+    """builds the file tree lazily: groups are enumerated when expanded, external links are
+    resolved when expanded, and dataset values are read when displayed"""
+
     def _add_attributes(
         self, tree_node: SimpleTreeNode, attribute_manager: h5py.AttributeManager
     ) -> None:
@@ -108,78 +202,130 @@ class H5DiffractionFileTreeBuilder:
 
             tree_node.create_child([str(name), 'Attribute', item_details])
 
+    def _get_dataset_details(self, h5_item: h5py.Dataset) -> str:
+        item_details = f'{h5_item.shape} {h5_item.dtype}'
+        space_id = h5_item.id.get_space()
+
+        if space_id.get_simple_extent_type() == h5py.h5s.SCALAR:
+            value = h5_item[()]
+
+            if isinstance(value, bytes):
+                item_details = value.decode()
+            elif isinstance(value, numpy.ndarray):
+                item_details = f'STRING = {h5_item.asstr()}'
+            else:
+                string_info = h5py.check_string_dtype(value.dtype)
+
+                if string_info:
+                    item_details = f'STRING = "{value.decode(string_info.encoding)}"'
+                else:
+                    item_details = f'SCALAR {value.dtype} = {value}'
+        elif h5_item.size == 1:
+            try:
+                value = h5_item[()]
+            except Exception:
+                pass
+            else:
+                item_details = f'DATASET {value.dtype} = {value}'
+
+        return item_details
+
+    def _load_dataset_item_data(
+        self, file_path: str, item_path: str, item_name: str, item_type: str
+    ) -> list[str]:
+        try:
+            with h5py.File(file_path, 'r') as h5_file:
+                h5_item = h5_file[item_path]
+
+                if not isinstance(h5_item, h5py.Dataset):
+                    raise ValueError(f'{item_path} is not a dataset!')
+
+                item_details = self._get_dataset_details(h5_item)
+        except Exception as exc:
+            logger.debug(f'Failed to read "{item_path}": {exc}')
+            item_details = ''
+
+        return [item_name, item_type, item_details]
+
+    def _load_children(self, file_path: str, item_path: str, parent_node: SimpleTreeNode) -> None:
+        try:
+            with h5py.File(file_path, 'r') as h5_file:
+                h5_item = h5_file[item_path]
+                self._add_attributes(parent_node, h5_item.attrs)
+
+                if isinstance(h5_item, h5py.Group):
+                    self._add_children(parent_node, file_path, item_path, h5_item)
+        except Exception:
+            logger.exception(f'Failed to read "{item_path}"!')
+
+    def _add_children(
+        self, parent_node: SimpleTreeNode, file_path: str, group_path: str, h5_group: h5py.Group
+    ) -> None:
+        # paths are relative to the file the tree was built from, even across external links
+        group_path = group_path.rstrip('/')
+
+        for item_name in h5_group:
+            item_path = f'{group_path}/{item_name}'
+            h5_link = h5_group.get(item_name, getlink=True)
+            tree_node = parent_node.create_child([item_name, 'Unknown', ''])
+
+            if isinstance(h5_link, h5py.HardLink):
+                h5_item = h5_group.get(item_name, getlink=False)
+
+                if isinstance(h5_item, h5py.Group):
+                    tree_node.item_data = [item_name, 'Group', '']
+
+                    if len(h5_item) > 0 or len(h5_item.attrs) > 0:
+                        tree_node.set_child_loader(
+                            functools.partial(self._load_children, file_path, item_path)
+                        )
+                elif isinstance(h5_item, h5py.Dataset):
+                    tree_node.set_item_data_loader(
+                        functools.partial(
+                            self._load_dataset_item_data,
+                            file_path,
+                            item_path,
+                            item_name,
+                            'Dataset',
+                        )
+                    )
+
+                    if len(h5_item.attrs) > 0:
+                        tree_node.set_child_loader(
+                            functools.partial(self._load_children, file_path, item_path)
+                        )
+                else:
+                    tree_node.item_data = [item_name, 'Hard Link', '']
+            elif isinstance(h5_link, h5py.SoftLink):
+                tree_node.item_data = [item_name, 'Soft Link', f'{h5_link.path}']
+            elif isinstance(h5_link, h5py.ExternalLink):
+                tree_node.item_data = [
+                    item_name,
+                    'External Link',
+                    f'{h5_link.filename}/{h5_link.path}',
+                ]
+                # resolving the link opens the external file; defer until expanded
+                tree_node.set_child_loader(
+                    functools.partial(self._load_children, file_path, item_path)
+                )
+            else:
+                logger.debug(f'Unknown item "{item_name}"')
+
     def create_root_node(self) -> SimpleTreeNode:
         return SimpleTreeNode.create_root(['Name', 'Type', 'Details'])
 
     def build(self, h5_file: h5py.File) -> SimpleTreeNode:
         root_node = self.create_root_node()
-        unvisited: list[tuple[SimpleTreeNode, h5py.Group]] = [(root_node, h5_file)]
-
-        while unvisited:
-            parent_item, h5_group = unvisited.pop()
-
-            for item_name in h5_group:
-                item_type = 'Unknown'
-                item_details = ''
-                h5_item = h5_group.get(item_name, getlink=True)
-
-                tree_node = parent_item.create_child([])
-
-                if isinstance(h5_item, h5py.HardLink):
-                    item_type = 'Hard Link'
-                    h5_item = h5_group.get(item_name, getlink=False)
-
-                    if isinstance(h5_item, h5py.Group):
-                        item_type = 'Group'
-                        self._add_attributes(tree_node, h5_item.attrs)
-                        unvisited.append((tree_node, h5_item))
-                    elif isinstance(h5_item, h5py.Dataset):
-                        item_type = 'Dataset'
-                        self._add_attributes(tree_node, h5_item.attrs)
-                        space_id = h5_item.id.get_space()
-
-                        if space_id.get_simple_extent_type() == h5py.h5s.SCALAR:
-                            value = h5_item[()]
-
-                            if isinstance(value, bytes):
-                                item_details = value.decode()
-                            elif isinstance(value, numpy.ndarray):
-                                item_details = f'STRING = {h5_item.asstr()}'
-                            else:
-                                string_info = h5py.check_string_dtype(value.dtype)
-
-                                if string_info:
-                                    item_details = (
-                                        f'STRING = "{value.decode(string_info.encoding)}"'
-                                    )
-                                else:
-                                    item_details = f'SCALAR {value.dtype} = {value}'
-                        elif h5_item.size == 1:
-                            try:
-                                value = h5_item[()]
-                            except Exception:
-                                item_details = f'{h5_item.shape} {h5_item.dtype}'
-                            else:
-                                item_details = f'DATASET {value.dtype} = {value}'
-                        else:
-                            item_details = f'{h5_item.shape} {h5_item.dtype}'
-                elif isinstance(h5_item, h5py.SoftLink):
-                    item_type = 'Soft Link'
-                    item_details = f'{h5_item.path}'
-                elif isinstance(h5_item, h5py.ExternalLink):
-                    item_type = 'External Link'
-                    item_details = f'{h5_item.filename}/{h5_item.path}'
-                else:
-                    logger.debug(f'Unknown item "{item_name}"')
-
-                tree_node.item_data = [item_name, item_type, item_details]
-
+        root_node.set_child_loader(
+            functools.partial(self._load_children, h5_file.filename, h5_file.name)
+        )
         return root_node
 
 
 class H5DiffractionFileReader(DiffractionFileReader):
-    def __init__(self, data_path: str) -> None:
+    def __init__(self, data_path: str, *, split_into_chunks: bool = True) -> None:
         self._data_path = data_path
+        self._split_into_chunks = split_into_chunks
         self._tree_builder = H5DiffractionFileTreeBuilder()
 
     def read(self, file_path: Path) -> DiffractionDataset:
@@ -188,23 +334,23 @@ class H5DiffractionFileReader(DiffractionFileReader):
             data = h5_file[self._data_path]
 
             if isinstance(data, h5py.Dataset):
-                num_patterns, detector_height, detector_width = data.shape
+                _, detector_height, detector_width = data.shape
+                array_list = split_h5_diffraction_pattern_array(
+                    file_path.stem,
+                    file_path,
+                    self._data_path,
+                    data,
+                    max_num_arrays=None if self._split_into_chunks else 1,
+                )
 
                 metadata = DiffractionMetadata(
-                    num_patterns_per_array=[num_patterns],
+                    num_patterns_per_array=[len(array.get_indexes()) for array in array_list],
                     pattern_dtype=data.dtype,
                     detector_extent=ImageExtent(detector_width, detector_height),
                     file_path=file_path,
                 )
 
-                array = H5DiffractionPatternArray(
-                    label=file_path.stem,
-                    indexes=numpy.arange(num_patterns),
-                    file_path=file_path,
-                    data_path=self._data_path,
-                )
-
-                return SimpleDiffractionDataset(metadata, contents_tree, [array])
+                return SimpleDiffractionDataset(metadata, contents_tree, array_list)
             else:
                 raise ValueError(f'Expected {self._data_path} to be a dataset; got {type(data)}.')
 
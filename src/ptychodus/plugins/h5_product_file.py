@@ -1,12 +1,18 @@
 from pathlib import Path
-from typing import Final
+from typing import Any, Final
 import logging
 
+try:
+    # NOTE must import hdf5plugin before h5py
+    import hdf5plugin
+except ModuleNotFoundError:
+    hdf5plugin = None  # type: ignore[assignment]
+
 import h5py
 import numpy
 
 from ptychodus.api.geometry import PixelGeometry
-from ptychodus.api.object import Object, ObjectCenter
+from ptychodus.api.object import Object, ObjectCenter, ObjectRegion
 from ptychodus.api.plugins import PluginRegistry
 from ptychodus.api.probe import ProbeSequence
 from ptychodus.api.product import (
@@ -15,7 +21,7 @@ from ptychodus.api.product import (
     ProductFileWriter,
     ProductMetadata,
 )
-from ptychodus.api.probe_positions import ProbePositionSequence, ProbePosition
+from ptychodus.api.probe_positions import ProbePositionSequence
 from ptychodus.api.reconstructor import LossValue
 
 logger = logging.getLogger(__name__)
@@ -24,6 +30,8 @@ logger = logging.getLogger(__name__)
 class H5ProductFileIO(ProductFileReader, ProductFileWriter):
     SIMPLE_NAME: Final[str] = 'HDF5'
     DISPLAY_NAME: Final[str] = 'Ptychodus Product Files (*.h5 *.hdf5)'
+    COMPRESSED_SIMPLE_NAME: Final[str] = 'HDF5_Compressed'
+    COMPRESSED_DISPLAY_NAME: Final[str] = 'Compressed Ptychodus Product Files (*.h5 *.hdf5)'
 
     NAME: Final[str] = 'name'
     COMMENTS: Final[str] = 'comments'
@@ -52,120 +60,180 @@ class H5ProductFileIO(ProductFileReader, ProductFileWriter):
     LOSS_EPOCHS: Final[str] = 'loss_epochs'
     LOSS_VALUES: Final[str] = 'loss_values'
 
-    def read(self, file_path: Path) -> Product:
-        point_list: list[ProbePosition] = []
+    def __init__(
+        self,
+        *,
+        chunk_size: int | None = None,
+        compression: Any = None,
+        use_complex64: bool = False,
+    ) -> None:
+        """chunk_size limits the chunk extent along the last two array axes; compression is
+        any h5py compression filter, such as those provided by hdf5plugin"""
+        self._chunk_size = chunk_size
+        self._compression = compression
+        self._use_complex64 = use_complex64
+
+    def _read_metadata(self, h5_file: h5py.File) -> ProductMetadata:
+        probe_photon_count = 0.0
+
+        try:
+            probe_photon_count = float(h5_file.attrs[self.PROBE_PHOTON_COUNT])
+        except KeyError:
+            logger.debug('Probe photon count not found.')
+
+        mass_attenuation_m2_kg = 0.0
+
+        try:
+            mass_attenuation_m2_kg = float(h5_file.attrs[self.MASS_ATTENUATION])
+        except KeyError:
+            logger.debug('Mass attenuation not found.')
+
+        tomography_angle_deg = 0.0
+
+        try:
+            tomography_angle_deg = float(h5_file.attrs[self.TOMOGRAPHY_ANGLE])
+        except KeyError:
+            logger.debug('Tomography angle not found.')
+
+        return ProductMetadata(
+            name=str(h5_file.attrs[self.NAME]),
+            comments=str(h5_file.attrs[self.COMMENTS]),
+            detector_distance_m=float(h5_file.attrs[self.DETECTOR_OBJECT_DISTANCE]),
+            probe_energy_eV=float(h5_file.attrs[self.PROBE_ENERGY]),
+            probe_photon_count=probe_photon_count,
+            exposure_time_s=float(h5_file.attrs[self.EXPOSURE_TIME]),
+            mass_attenuation_m2_kg=mass_attenuation_m2_kg,
+            tomography_angle_deg=tomography_angle_deg,
+        )
 
-        with h5py.File(file_path, 'r') as h5_file:
-            probe_photon_count = 0.0
+    def _read_probe_positions(self, h5_file: h5py.File) -> ProbePositionSequence:
+        h5_scan_indexes = h5_file[self.PROBE_POSITION_INDEXES]
+        h5_scan_x = h5_file[self.PROBE_POSITION_X]
+        h5_scan_y = h5_file[self.PROBE_POSITION_Y]
+        return ProbePositionSequence.create_from_arrays(
+            h5_scan_indexes[()],
+            numpy.column_stack((h5_scan_y[()], h5_scan_x[()])),
+        )
 
-            try:
-                probe_photon_count = float(h5_file.attrs[self.PROBE_PHOTON_COUNT])
-            except KeyError:
-                logger.debug('Probe photon count not found.')
+    def _read_probes(self, h5_file: h5py.File) -> ProbeSequence:
+        h5_probe = h5_file[self.PROBE_ARRAY]
+        probe_pixel_geometry = PixelGeometry(
+            width_m=float(h5_probe.attrs[self.PROBE_PIXEL_WIDTH]),
+            height_m=float(h5_probe.attrs[self.PROBE_PIXEL_HEIGHT]),
+        )
 
-            mass_attenuation_m2_kg = 0.0
+        try:
+            opr_weights = h5_probe.attrs[self.OPR_WEIGHTS]
+        except KeyError:
+            logger.debug('OPR weights not found.')
+            opr_weights = None
 
-            try:
-                mass_attenuation_m2_kg = float(h5_file.attrs[self.MASS_ATTENUATION])
-            except KeyError:
-                logger.debug('Mass attenuation not found.')
+        return ProbeSequence(
+            array=h5_probe[()],
+            opr_weights=opr_weights,
+            pixel_geometry=probe_pixel_geometry,
+        )
 
-            tomography_angle_deg = 0.0
+    def _read_object(self, h5_file: h5py.File, region: ObjectRegion | None) -> Object:
+        h5_object = h5_file[self.OBJECT_ARRAY]
+        object_pixel_geometry = PixelGeometry(
+            width_m=float(h5_object.attrs[self.OBJECT_PIXEL_WIDTH]),
+            height_m=float(h5_object.attrs[self.OBJECT_PIXEL_HEIGHT]),
+        )
+        object_center = ObjectCenter(
+            coordinate_x_m=float(h5_object.attrs[self.OBJECT_CENTER_X]),
+            coordinate_y_m=float(h5_object.attrs[self.OBJECT_CENTER_Y]),
+        )
+        h5_object_layer_spacing = h5_file[self.OBJECT_LAYER_SPACING]
 
-            try:
-                tomography_angle_deg = float(h5_file.attrs[self.TOMOGRAPHY_ANGLE])
-            except KeyError:
-                logger.debug('Tomography angle not found.')
-
-            metadata = ProductMetadata(
-                name=str(h5_file.attrs[self.NAME]),
-                comments=str(h5_file.attrs[self.COMMENTS]),
-                detector_distance_m=float(h5_file.attrs[self.DETECTOR_OBJECT_DISTANCE]),
-                probe_energy_eV=float(h5_file.attrs[self.PROBE_ENERGY]),
-                probe_photon_count=probe_photon_count,
-                exposure_time_s=float(h5_file.attrs[self.EXPOSURE_TIME]),
-                mass_attenuation_m2_kg=mass_attenuation_m2_kg,
-                tomography_angle_deg=tomography_angle_deg,
-            )
+        if region is None:
+            region = ObjectRegion()
 
-            h5_scan_indexes = h5_file[self.PROBE_POSITION_INDEXES]
-            h5_scan_x = h5_file[self.PROBE_POSITION_X]
-            h5_scan_y = h5_file[self.PROBE_POSITION_Y]
+        # reads only the selected hyperslab of the object dataset
+        return region.select(
+            h5_object,
+            object_pixel_geometry,
+            object_center,
+            h5_object_layer_spacing[()],
+        )
 
-            for idx, x_m, y_m in zip(h5_scan_indexes[()], h5_scan_x[()], h5_scan_y[()]):
-                point = ProbePosition(idx, x_m, y_m)
-                point_list.append(point)
+    def _read_losses(self, h5_file: h5py.File) -> list[LossValue]:
+        try:
+            h5_loss_values = h5_file[self.LOSS_VALUES]
+        except KeyError:
+            h5_loss_values = h5_file['costs']
 
-            h5_probe = h5_file[self.PROBE_ARRAY]
-            probe_pixel_geometry = PixelGeometry(
-                width_m=float(h5_probe.attrs[self.PROBE_PIXEL_WIDTH]),
-                height_m=float(h5_probe.attrs[self.PROBE_PIXEL_HEIGHT]),
-            )
+        loss_values = h5_loss_values[()]
 
-            try:
-                opr_weights = h5_probe.attrs[self.OPR_WEIGHTS]
-            except KeyError:
-                logger.debug('OPR weights not found.')
-                opr_weights = None
-
-            probe = ProbeSequence(
-                array=h5_probe[()],
-                opr_weights=opr_weights,
-                pixel_geometry=probe_pixel_geometry,
-            )
+        try:
+            loss_epochs = h5_file[self.LOSS_EPOCHS][()]
+        except KeyError:
+            loss_epochs = numpy.arange(len(loss_values))
 
-            h5_object = h5_file[self.OBJECT_ARRAY]
-            object_pixel_geometry = PixelGeometry(
-                width_m=float(h5_object.attrs[self.OBJECT_PIXEL_WIDTH]),
-                height_m=float(h5_object.attrs[self.OBJECT_PIXEL_HEIGHT]),
-            )
-            object_center = ObjectCenter(
-                coordinate_x_m=float(h5_object.attrs[self.OBJECT_CENTER_X]),
-                coordinate_y_m=float(h5_object.attrs[self.OBJECT_CENTER_Y]),
-            )
-            h5_object_layer_spacing = h5_file[self.OBJECT_LAYER_SPACING]
-            object_ = Object(
-                array=h5_object[()],
-                pixel_geometry=object_pixel_geometry,
-                center=object_center,
-                layer_spacing_m=h5_object_layer_spacing[()],
+        return [LossValue(epoch, value) for epoch, value in zip(loss_epochs, loss_values)]
+
+    def read(self, file_path: Path) -> Product:
+        with h5py.File(file_path, 'r') as h5_file:
+            return Product(
+                metadata=self._read_metadata(h5_file),
+                probe_positions=self._read_probe_positions(h5_file),
+                probes=self._read_probes(h5_file),
+                object_=self._read_object(h5_file, None),
+                losses=self._read_losses(h5_file),
             )
 
-            try:
-                h5_loss_values = h5_file[self.LOSS_VALUES]
-            except KeyError:
-                h5_loss_values = h5_file['costs']
+    def read_metadata(self, file_path: Path) -> ProductMetadata:
+        with h5py.File(file_path, 'r') as h5_file:
+            return self._read_metadata(h5_file)
 
-            loss_values = h5_loss_values[()]
+    def read_probe_positions(self, file_path: Path) -> ProbePositionSequence:
+        with h5py.File(file_path, 'r') as h5_file:
+            return self._read_probe_positions(h5_file)
 
-            try:
-                loss_epochs = h5_file[self.LOSS_EPOCHS][()]
-            except KeyError:
-                loss_epochs = numpy.arange(len(loss_values))
-
-            losses: list[LossValue] = []
-
-            for epoch, value in zip(loss_epochs, loss_values):
-                loss = LossValue(epoch, value)
-                losses.append(loss)
-
-        return Product(
-            metadata=metadata,
-            probe_positions=ProbePositionSequence(point_list),
-            probes=probe,
-            object_=object_,
-            losses=losses,
+    def read_probes(self, file_path: Path) -> ProbeSequence:
+        with h5py.File(file_path, 'r') as h5_file:
+            return self._read_probes(h5_file)
+
+    def read_object(self, file_path: Path, region: ObjectRegion | None = None) -> Object:
+        with h5py.File(file_path, 'r') as h5_file:
+            return self._read_object(h5_file, region)
+
+    def _create_array_dataset(
+        self, h5_file: h5py.File, name: str, array: numpy.ndarray
+    ) -> h5py.Dataset:
+        dtype = array.dtype
+
+        if self._use_complex64 and numpy.iscomplexobj(array):
+            dtype = numpy.dtype(numpy.complex64)
+
+        chunks: tuple[int, ...] | None = None
+
+        if self._chunk_size is not None and array.ndim > 0:
+            leading_shape = (1,) * (array.ndim - 2)
+            trailing_shape = tuple(
+                max(1, min(self._chunk_size, extent)) for extent in array.shape[-2:]
+            )
+            chunks = leading_shape + trailing_shape
+
+        h5_dataset = h5_file.create_dataset(
+            name,
+            shape=array.shape,
+            dtype=dtype,
+            chunks=chunks,
+            compression=self._compression,
         )
 
-    def write(self, file_path: Path, product: Product) -> None:
-        scan_indexes: list[int] = []
-        scan_x_m: list[float] = []
-        scan_y_m: list[float] = []
+        if array.ndim > 2:
+            # convert one layer at a time to avoid a full-size temporary copy
+            for index in range(array.shape[0]):
+                h5_dataset[index] = array[index]
+        else:
+            h5_dataset[()] = array
+
+        return h5_dataset
 
-        for point in product.probe_positions:
-            scan_indexes.append(point.index)
-            scan_x_m.append(point.coordinate_x_m)
-            scan_y_m.append(point.coordinate_y_m)
+    def write(self, file_path: Path, product: Product) -> None:
+        probe_positions = product.probe_positions
 
         with h5py.File(file_path, 'w') as h5_file:
             metadata = product.metadata
@@ -177,19 +245,19 @@ class H5ProductFileIO(ProductFileReader, ProductFileWriter):
             h5_file.attrs[self.EXPOSURE_TIME] = metadata.exposure_time_s
             h5_file.attrs[self.MASS_ATTENUATION] = metadata.mass_attenuation_m2_kg
 
-            h5_file.create_dataset(self.PROBE_POSITION_INDEXES, data=scan_indexes)
-            h5_file.create_dataset(self.PROBE_POSITION_X, data=scan_x_m)
-            h5_file.create_dataset(self.PROBE_POSITION_Y, data=scan_y_m)
+            h5_file.create_dataset(self.PROBE_POSITION_INDEXES, data=probe_positions.indexes)
+            h5_file.create_dataset(self.PROBE_POSITION_X, data=probe_positions.coordinates_x_m)
+            h5_file.create_dataset(self.PROBE_POSITION_Y, data=probe_positions.coordinates_y_m)
 
             probe = product.probes
-            h5_probe = h5_file.create_dataset(self.PROBE_ARRAY, data=probe.get_array())
+            h5_probe = self._create_array_dataset(h5_file, self.PROBE_ARRAY, probe.get_array())
 
             try:
                 opr_weights = probe.get_opr_weights()
             except ValueError:
                 pass
             else:
-                h5_file.create_dataset(self.OPR_WEIGHTS, data=opr_weights)
+                self._create_array_dataset(h5_file, self.OPR_WEIGHTS, opr_weights)
 
             probe_pixel_geometry = probe.get_pixel_geometry()
             h5_probe.attrs[self.PROBE_PIXEL_WIDTH] = probe_pixel_geometry.width_m
@@ -197,7 +265,7 @@ class H5ProductFileIO(ProductFileReader, ProductFileWriter):
 
             object_ = product.object_
             object_geometry = object_.get_geometry()
-            h5_object = h5_file.create_dataset(self.OBJECT_ARRAY, data=object_.get_array())
+            h5_object = self._create_array_dataset(h5_file, self.OBJECT_ARRAY, object_.get_array())
             h5_object.attrs[self.OBJECT_CENTER_X] = object_geometry.center_x_m
             h5_object.attrs[self.OBJECT_CENTER_Y] = object_geometry.center_y_m
             h5_object.attrs[self.OBJECT_PIXEL_WIDTH] = object_geometry.pixel_width_m
@@ -228,3 +296,14 @@ def register_plugins(registry: PluginRegistry) -> None:
         simple_name=H5ProductFileIO.SIMPLE_NAME,
         display_name=H5ProductFileIO.DISPLAY_NAME,
     )
+
+    if hdf5plugin is None:
+        compression: Any = 'gzip'
+    else:
+        compression = hdf5plugin.Blosc(cname='zstd', clevel=5, shuffle=hdf5plugin.Blosc.SHUFFLE)
+
+    registry.product_file_writers.register_plugin(
+        H5ProductFileIO(chunk_size=1024, compression=compression, use_complex64=True),
+        simple_name=H5ProductFileIO.COMPRESSED_SIMPLE_NAME,
+        display_name=H5ProductFileIO.COMPRESSED_DISPLAY_NAME,
+    )
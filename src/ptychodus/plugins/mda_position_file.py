@@ -5,6 +5,7 @@ from enum import IntEnum
 from pathlib import Path
 from typing import Any, Generic, TypeVar
 import logging
+import os
 import sys
 import typing
 import yaml
@@ -20,11 +21,7 @@ import numpy
 import numpy.typing
 
 from ptychodus.api.plugins import PluginRegistry
-from ptychodus.api.probe_positions import (
-    ProbePositionSequence,
-    ProbePositionFileReader,
-    ProbePosition,
-)
+from ptychodus.api.probe_positions import ProbePositionSequence, ProbePositionFileReader
 
 T = TypeVar('T')
 
@@ -151,8 +148,7 @@ class MDAScanHeader:
         lower_scan_offsets: list[int] = list()
 
         if rank > 1:
-            unpacker.reset(fp.read(4 * npts))
-            lower_scan_offsets = unpacker.unpack_farray(npts, unpacker.unpack_int)
+            lower_scan_offsets = numpy.frombuffer(fp.read(4 * npts), dtype='>i4').tolist()
 
         return cls(rank, npts, cpt, lower_scan_offsets)
 
@@ -309,19 +305,27 @@ class MDAScanData:
 
     @classmethod
     def read(
-        cls, fp: typing.BinaryIO, scan_header: MDAScanHeader, scan_info: MDAScanInfo
+        cls,
+        fp: typing.BinaryIO,
+        scan_header: MDAScanHeader,
+        scan_info: MDAScanInfo,
+        *,
+        read_detectors: bool = True,
     ) -> MDAScanData:
+        """reads XDR (big-endian) arrays in bulk; optionally skips over the detector arrays"""
         npts = scan_header.num_requested_points
         np = scan_info.num_positioners
         nd = scan_info.num_detectors
 
-        unpacker = xdrlib.Unpacker(fp.read(8 * np * npts))
-        readback_lol = [unpacker.unpack_farray(npts, unpacker.unpack_double) for p in range(np)]
-        readback_array = numpy.array(readback_lol)
+        readback_array = numpy.frombuffer(fp.read(8 * np * npts), dtype='>f8')
+        readback_array = readback_array.reshape(np, npts).astype(numpy.float64)
 
-        unpacker.reset(fp.read(4 * nd * npts))
-        detector_lol = [unpacker.unpack_farray(npts, unpacker.unpack_float) for d in range(nd)]
-        detector_array = numpy.array(detector_lol)
+        if read_detectors:
+            detector_array = numpy.frombuffer(fp.read(4 * nd * npts), dtype='>f4')
+            detector_array = detector_array.reshape(nd, npts).astype(numpy.float32)
+        else:
+            fp.seek(4 * nd * npts, os.SEEK_CUR)
+            detector_array = numpy.zeros((0, npts), dtype=numpy.float32)
 
         return cls(readback_array, detector_array)
 
@@ -340,15 +344,15 @@ class MDAScan:
     lower_scans: list[MDAScan]
 
     @classmethod
-    def read(cls, fp: typing.BinaryIO) -> MDAScan:
+    def read(cls, fp: typing.BinaryIO, *, read_detectors: bool = True) -> MDAScan:
         header = MDAScanHeader.read(fp)
         info = MDAScanInfo.read(fp)
-        data = MDAScanData.read(fp, header, info)
+        data = MDAScanData.read(fp, header, info, read_detectors=read_detectors)
         lower_scans: list[MDAScan] = list()
 
         for offset in header.lower_scan_offsets:
             fp.seek(offset)
-            scan = MDAScan.read(fp)
+            scan = MDAScan.read(fp, read_detectors=read_detectors)
             lower_scans.append(scan)
 
         return cls(header, info, data, lower_scans)
@@ -422,12 +426,12 @@ class MDAFile:
         return MDAProcessVariable[str](pv_name, pv_desc, pv_type, pv_unit, str())
 
     @classmethod
-    def read(cls, file_path: Path) -> MDAFile:
+    def read(cls, file_path: Path, *, read_detectors: bool = True) -> MDAFile:
         extra_pvs: list[MDAProcessVariable[Any]] = list()
 
         with file_path.open(mode='rb') as fp:
             header = MDAHeader.read(fp)
-            scan = MDAScan.read(fp)
+            scan = MDAScan.read(fp, read_detectors=read_detectors)
 
             if header.has_extra_pvs:
                 fp.seek(header.extra_pvs_offset)
@@ -456,25 +460,23 @@ class MDAPositionFileReader(ProbePositionFileReader):
         self._scale_to_meters = scale_to_meters
 
     def read(self, file_path: Path) -> ProbePositionSequence:
-        point_list: list[ProbePosition] = list()
-
-        mda_file = MDAFile.read(file_path)
+        mda_file = MDAFile.read(file_path, read_detectors=False)
 
         yscan = mda_file.scan
         yarray = yscan.data.readback_array[0, :]
+        num_rows = min(len(yarray), len(yscan.lower_scans))
+        xarrays = [xscan.data.readback_array[0, :] for xscan in yscan.lower_scans[:num_rows]]
+        num_points_per_row = [len(xarray) for xarray in xarrays]
+        coordinates = numpy.column_stack(
+            (
+                numpy.repeat(yarray[:num_rows], num_points_per_row),
+                numpy.concatenate(xarrays) if xarrays else numpy.zeros(0),
+            )
+        )
 
-        for y, xscan in zip(yarray, yscan.lower_scans):
-            xarray = xscan.data.readback_array[0, :]
-
-            for x in xarray:
-                point = ProbePosition(
-                    index=len(point_list),
-                    coordinate_x_m=float(x) * self._scale_to_meters,
-                    coordinate_y_m=float(y) * self._scale_to_meters,
-                )
-                point_list.append(point)
-
-        return ProbePositionSequence(point_list)
+        return ProbePositionSequence.create_from_arrays(
+            numpy.arange(len(coordinates)), coordinates * self._scale_to_meters
+        )
 
 
 class MDAFlatScanPositionFileReader(ProbePositionFileReader):
@@ -482,21 +484,13 @@ class MDAFlatScanPositionFileReader(ProbePositionFileReader):
         self._scale_to_meters = scale_to_meters
 
     def read(self, file_path: Path) -> ProbePositionSequence:
-        point_list = list()
-
-        mda_file = MDAFile.read(file_path)
+        mda_file = MDAFile.read(file_path, read_detectors=False)
         xarray = mda_file.scan.data.readback_array[0, :]
         yarray = mda_file.scan.data.readback_array[1, :]
 
-        for idx, (x, y) in enumerate(zip(xarray, yarray)):
-            point = ProbePosition(
-                index=idx,
-                coordinate_x_m=float(x) * self._scale_to_meters,
-                coordinate_y_m=float(y) * self._scale_to_meters,
-            )
-            point_list.append(point)
-
-        return ProbePositionSequence(point_list)
+        return ProbePositionSequence.create_from_arrays(
+            numpy.arange(len(xarray)), numpy.column_stack((yarray, xarray)) * self._scale_to_meters
+        )
 
 
 def register_plugins(registry: PluginRegistry) -> None:
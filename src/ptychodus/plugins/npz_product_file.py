@@ -15,7 +15,7 @@ from ptychodus.api.product import (
     ProductMetadata,
 )
 from ptychodus.api.reconstructor import LossValue
-from ptychodus.api.probe_positions import ProbePositionSequence, ProbePosition
+from ptychodus.api.probe_positions import ProbePositionSequence
 
 logger = logging.getLogger(__name__)
 
@@ -131,11 +131,9 @@ class NPZProductFileIO(ProductFileReader, ProductFileWriter):
             except KeyError:
                 loss_epochs = numpy.arange(len(loss_values))
 
-        point_list: list[ProbePosition] = []
-
-        for idx, x_m, y_m in zip(scan_indexes, scan_x_m, scan_y_m):
-            point = ProbePosition(idx, x_m, y_m)
-            point_list.append(point)
+        probe_positions = ProbePositionSequence.create_from_arrays(
+            scan_indexes, numpy.column_stack((scan_y_m, scan_x_m))
+        )
 
         losses: list[LossValue] = []
 
@@ -145,7 +143,7 @@ class NPZProductFileIO(ProductFileReader, ProductFileWriter):
 
         return Product(
             metadata=metadata,
-            probe_positions=ProbePositionSequence(point_list),
+            probe_positions=probe_positions,
             probes=probe,
             object_=object_,
             losses=losses,
@@ -153,14 +151,7 @@ class NPZProductFileIO(ProductFileReader, ProductFileWriter):
 
     def write(self, file_path: Path, product: Product) -> None:
         contents: dict[str, Any] = dict()
-        scan_indexes: list[int] = []
-        scan_x_m: list[float] = []
-        scan_y_m: list[float] = []
-
-        for point in product.probe_positions:
-            scan_indexes.append(point.index)
-            scan_x_m.append(point.coordinate_x_m)
-            scan_y_m.append(point.coordinate_y_m)
+        probe_positions = product.probe_positions
 
         metadata = product.metadata
         contents[self.NAME] = metadata.name
@@ -171,9 +162,9 @@ class NPZProductFileIO(ProductFileReader, ProductFileWriter):
         contents[self.EXPOSURE_TIME] = metadata.exposure_time_s
         contents[self.MASS_ATTENUATION] = metadata.mass_attenuation_m2_kg
 
-        contents[self.PROBE_POSITION_INDEXES] = scan_indexes
-        contents[self.PROBE_POSITION_X] = scan_x_m
-        contents[self.PROBE_POSITION_Y] = scan_y_m
+        contents[self.PROBE_POSITION_INDEXES] = probe_positions.indexes
+        contents[self.PROBE_POSITION_X] = probe_positions.coordinates_x_m
+        contents[self.PROBE_POSITION_Y] = probe_positions.coordinates_y_m
 
         probe = product.probes
         contents[self.PROBE_ARRAY] = probe.get_array()
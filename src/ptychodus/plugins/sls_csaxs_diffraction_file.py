@@ -3,7 +3,6 @@ from typing import Final
 import logging
 
 import h5py
-import numpy
 
 from ptychodus.api.geometry import ImageExtent, PixelGeometry
 from ptychodus.api.diffraction import (
@@ -14,7 +13,7 @@ from ptychodus.api.diffraction import (
 )
 from ptychodus.api.plugins import PluginRegistry
 
-from .h5_diffraction_file import H5DiffractionPatternArray, H5DiffractionFileTreeBuilder
+from .h5_diffraction_file import H5DiffractionFileTreeBuilder, split_h5_diffraction_pattern_array
 
 logger = logging.getLogger(__name__)
 
@@ -32,15 +31,18 @@ class CSAXSDiffractionFileReader(DiffractionFileReader):
             data = h5_file[self._data_path]
 
             if isinstance(data, h5py.Dataset):
-                num_patterns, detector_height, detector_width = data.shape
+                _, detector_height, detector_width = data.shape
 
                 distance_mm = h5_file['/entry/instrument/monochromator/distance']
                 x_pixel_size_um = h5_file['/entry/instrument/eiger_4/x_pixel_size']
                 y_pixel_size_um = h5_file['/entry/instrument/eiger_4/y_pixel_size']
                 energy_keV = h5_file['/entry/instrument/monochromator/energy']  # noqa: N806
+                array_list = split_h5_diffraction_pattern_array(
+                    file_path.stem, file_path, self._data_path, data
+                )
 
                 metadata = DiffractionMetadata(
-                    num_patterns_per_array=[num_patterns],
+                    num_patterns_per_array=[len(array.get_indexes()) for array in array_list],
                     pattern_dtype=data.dtype,
                     detector_distance_m=abs(float(distance_mm[()])) * self.ONE_MILLIMETER_M,
                     detector_extent=ImageExtent(detector_width, detector_height),
@@ -52,14 +54,8 @@ class CSAXSDiffractionFileReader(DiffractionFileReader):
                     file_path=file_path,
                 )
                 contents_tree = self._tree_builder.build(h5_file)
-                array = H5DiffractionPatternArray(
-                    label=file_path.stem,
-                    indexes=numpy.arange(num_patterns),
-                    file_path=file_path,
-                    data_path=self._data_path,
-                )
 
-                return SimpleDiffractionDataset(metadata, contents_tree, [array])
+                return SimpleDiffractionDataset(metadata, contents_tree, array_list)
             else:
                 raise ValueError(f'Expected {self._data_path} to be a dataset; got {type(data)}.')
 
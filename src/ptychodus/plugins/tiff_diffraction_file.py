@@ -1,4 +1,4 @@
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from pathlib import Path
 import logging
 import re
@@ -6,6 +6,7 @@ import sys
 
 from tifffile import TiffFile
 import numpy
+import tifffile
 
 from ptychodus.api.geometry import ImageExtent
 from ptychodus.api.diffraction import (
@@ -15,6 +16,7 @@ from ptychodus.api.diffraction import (
     DiffractionArray,
     DiffractionPatterns,
     DiffractionIndexes,
+    PatternRegion,
     SimpleDiffractionDataset,
 )
 from ptychodus.api.plugins import PluginRegistry
@@ -32,12 +34,25 @@ class TiffDiffractionPatternArray(DiffractionArray):
     def get_label(self) -> str:
         return self._file_path.stem
 
+    def get_source_files(self) -> Sequence[Path]:
+        return [self._file_path]
+
     def get_indexes(self) -> DiffractionIndexes:
         return self._indexes
 
-    def get_patterns(self) -> DiffractionPatterns:
-        with TiffFile(self._file_path) as tiff:
-            data = tiff.asarray()
+    def get_patterns(self, region: PatternRegion | None = None) -> DiffractionPatterns:
+        if region is None:
+            with TiffFile(self._file_path) as tiff:
+                data = tiff.asarray()
+        else:
+            try:
+                # uncompressed contiguous images can be memory-mapped to read only the region
+                data = region.apply(tifffile.memmap(self._file_path, mode='r'))
+            except ValueError:
+                with TiffFile(self._file_path) as tiff:
+                    data = region.apply(tiff.asarray())
+            else:
+                data = numpy.array(data)
 
         if data.ndim == 2:
             data = data[numpy.newaxis, :, :]
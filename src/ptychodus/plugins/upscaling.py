@@ -1,9 +1,13 @@
-from scipy.interpolate import griddata, RBFInterpolator
+from collections.abc import Sequence
+
+from scipy.interpolate import RBFInterpolator
 import numpy
 
 from ptychodus.api.fluorescence import ElementMap, UpscalingStrategy
+from ptychodus.api.interpolation import evaluate_on_grid, get_grid_interpolator
 from ptychodus.api.plugins import PluginRegistry
 from ptychodus.api.product import Product
+from ptychodus.api.typing import RealArrayType
 
 
 class IdentityUpscaling(UpscalingStrategy):
@@ -11,29 +15,40 @@ class IdentityUpscaling(UpscalingStrategy):
         return emap
 
 
+def _get_scan_coordinates_px(product: Product) -> RealArrayType:
+    object_geometry = product.object_.get_geometry()
+    return object_geometry.map_coordinates_probe_to_object_array(
+        product.probe_positions.coordinates_m
+    )
+
+
+def _stack_counts(emaps: Sequence[ElementMap]) -> RealArrayType:
+    return numpy.column_stack([emap.counts_per_second.ravel() for emap in emaps])
+
+
+def _unstack_counts(emaps: Sequence[ElementMap], cps: RealArrayType) -> list[ElementMap]:
+    return [
+        ElementMap(emap.name, emap_cps.astype(emap.counts_per_second.dtype))
+        for emap, emap_cps in zip(emaps, cps)
+    ]
+
+
 class GridDataUpscaling(UpscalingStrategy):
     def __init__(self, method: str) -> None:
         self._method = method
 
     def __call__(self, emap: ElementMap, product: Product) -> ElementMap:
-        object_geometry = product.object_.get_geometry()
-        scan_coords_px: list[float] = list()
-
-        for scan_point in product.probe_positions:
-            object_point = object_geometry.map_coordinates_probe_to_object(scan_point)
-            scan_coords_px.append(object_point.coordinate_y_px)
-            scan_coords_px.append(object_point.coordinate_x_px)
+        return self.upscale_all([emap], product)[0]
 
-        points = numpy.reshape(scan_coords_px, (-1, 2))
-        values = emap.counts_per_second.flat
-        YY, XX = numpy.mgrid[: object_geometry.height_px, : object_geometry.width_px]  # noqa: N806
-        query_points = numpy.transpose((YY.flat, XX.flat))
-
-        cps = griddata(points, values, query_points, method=self._method, fill_value=0.0).reshape(
-            XX.shape
+    def upscale_all(self, emaps: Sequence[ElementMap], product: Product) -> Sequence[ElementMap]:
+        object_geometry = product.object_.get_geometry()
+        interpolator = get_grid_interpolator(
+            _get_scan_coordinates_px(product),
+            (object_geometry.height_px, object_geometry.width_px),
+            self._method,
         )
-
-        return ElementMap(emap.name, cps.astype(emap.counts_per_second.dtype))
+        cps = interpolator(_stack_counts(emaps), fill_value=0.0)
+        return _unstack_counts(emaps, cps)
 
 
 class RadialBasisFunctionUpscaling(UpscalingStrategy):
@@ -51,25 +66,21 @@ class RadialBasisFunctionUpscaling(UpscalingStrategy):
         self._degree = degree
 
     def __call__(self, emap: ElementMap, product: Product) -> ElementMap:
-        object_geometry = product.object_.get_geometry()
-        scan_coords_px: list[float] = list()
-
-        for scan_point in product.probe_positions:
-            object_point = object_geometry.map_coordinates_probe_to_object(scan_point)
-            scan_coords_px.append(object_point.coordinate_y_px)
-            scan_coords_px.append(object_point.coordinate_x_px)
+        return self.upscale_all([emap], product)[0]
 
+    def upscale_all(self, emaps: Sequence[ElementMap], product: Product) -> Sequence[ElementMap]:
+        object_geometry = product.object_.get_geometry()
+        # one multi-column interpolator shares the neighbor search across element maps
         interpolator = RBFInterpolator(
-            numpy.reshape(scan_coords_px, (-1, 2)),
-            emap.counts_per_second.flat,
+            _get_scan_coordinates_px(product),
+            _stack_counts(emaps),
             kernel=self._kernel,
             neighbors=self._neighbors,
             epsilon=self._epsilon,
             degree=self._degree,
         )
-        YY, XX = numpy.mgrid[: object_geometry.height_px, : object_geometry.width_px]  # noqa: N806
-        cps = interpolator(numpy.transpose((YY.flat, XX.flat)))
-        return ElementMap(emap.name, cps.astype(emap.counts_per_second.dtype).reshape(XX.shape))
+        cps = evaluate_on_grid(interpolator, (object_geometry.height_px, object_geometry.width_px))
+        return _unstack_counts(emaps, cps)
 
 
 def register_plugins(registry: PluginRegistry) -> None:
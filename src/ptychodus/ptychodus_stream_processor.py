@@ -12,7 +12,8 @@ from pvapy.utility.timeUtility import TimeUtility
 import pvaccess
 import pvapy
 
-from ptychodus.model import ModelCore
+from ptychodus.model import ModelCore, PtychodusStreamingContext
+from ptychodus.model.diffraction import StreamingDropPolicy
 import ptychodus
 
 
@@ -32,11 +33,14 @@ class ReconstructionThread(threading.Thread):
         self._reconstruct_event = threading.Event()
         self._stop_event = threading.Event()
 
-        self._ptychodus_streaming_context = None
+        self._ptychodus_streaming_context: PtychodusStreamingContext | None = None
 
         self._channel.subscribe('reconstructor', self._monitor)
         self._channel.startMonitor()
 
+    def set_streaming_context(self, context: PtychodusStreamingContext) -> None:
+        self._ptychodus_streaming_context = context
+
     def run(self) -> None:
         while not self._stop_event.is_set():
             if self._reconstruct_event.wait(timeout=1.0):
@@ -108,7 +112,15 @@ class PtychodusAdImageProcessor(AdImageProcessor):
             num_patterns_per_array=[int(num_patterns_per_array)] * int(num_arrays),
             pattern_dtype=numpy.dtype(pattern_dtype),
         )
-        self._ptychodus_streaming_context = self._ptychodus.create_streaming_context(metadata)
+        # stopping the stream assigns the streamed positions to this product
+        product_index = self._ptychodus.product_core.product_api.insert_new_product('Stream')
+        self._ptychodus_streaming_context = self._ptychodus.create_streaming_context(
+            metadata,
+            product_index=product_index,
+            max_queue_size=int(config_dict.get('max_queue_size', 4096)),
+            drop_policy=StreamingDropPolicy(config_dict.get('drop_policy', 'block')),
+        )
+        self._reconstruction_thread.set_streaming_context(self._ptychodus_streaming_context)
         self._ptychodus_streaming_context.start()  # TODO clean up
 
     def process(self, pv_object: pvaccess.PvObject) -> pvaccess.PvObject:
@@ -169,7 +181,7 @@ class PtychodusAdImageProcessor(AdImageProcessor):
 
     def getStats(self) -> dict[str, Any]:  # noqa: N802
         """Retrieves statistics for user processor"""
-        num_frames_queued = self._ptychodus_streaming_context.get_queue_size()
+        streaming_stats = self._ptychodus_streaming_context.get_statistics()
         processed_frame_rate = 0.0
 
         if self._processing_time > 0.0:
@@ -177,9 +189,14 @@ class PtychodusAdImageProcessor(AdImageProcessor):
 
         return {
             'num_frames_processed': self._num_frames_processed,
-            'num_frames_queued': num_frames_queued,
+            'num_frames_queued': streaming_stats.num_frames_queued,
+            'num_frames_loaded': streaming_stats.num_frames_loaded,
+            'num_frames_dropped': streaming_stats.num_frames_dropped,
             'processing_time': FloatWithUnits(self._processing_time, 's'),
             'processed_frame_rate': FloatWithUnits(processed_frame_rate, 'fps'),
+            'mean_latency': FloatWithUnits(streaming_stats.mean_latency_s, 's'),
+            'max_latency': FloatWithUnits(streaming_stats.max_latency_s, 's'),
+            'loaded_frame_rate': FloatWithUnits(streaming_stats.throughput_Hz, 'fps'),
         }
 
     def getStatsPvaTypes(self) -> dict[str, pvaccess.ScalarType]:  # noqa: N802
@@ -187,6 +204,11 @@ class PtychodusAdImageProcessor(AdImageProcessor):
         return {
             'num_frames_processed': pvaccess.UINT,
             'num_frames_queued': pvaccess.UINT,
+            'num_frames_loaded': pvaccess.UINT,
+            'num_frames_dropped': pvaccess.UINT,
             'processing_time': pvaccess.DOUBLE,
-            'processing_frame_rate': pvaccess.DOUBLE,
+            'processed_frame_rate': pvaccess.DOUBLE,
+            'mean_latency': pvaccess.DOUBLE,
+            'max_latency': pvaccess.DOUBLE,
+            'loaded_frame_rate': pvaccess.DOUBLE,
         }
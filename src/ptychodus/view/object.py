@@ -2,6 +2,7 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import (
     QComboBox,
     QDialog,
+    QDoubleSpinBox,
     QFormLayout,
     QGridLayout,
     QGroupBox,
@@ -28,6 +29,11 @@ class FourierRingCorrelationDialog(QDialog):
         self.product1_combo_box = QComboBox()
         self.product2_label = QLabel('Product 2:')
         self.product2_combo_box = QComboBox()
+        self.apodization_label = QLabel('Apodization:')
+        self.apodization_spin_box = QDoubleSpinBox()
+        self.apodization_spin_box.setRange(0.0, 1.0)
+        self.apodization_spin_box.setSingleStep(0.05)
+        self.apodization_spin_box.setToolTip('Tapered fraction of the Tukey window on each axis')
         self.figure = Figure()
         self.figure_canvas = FigureCanvasQTAgg(self.figure)
         self.navigation_toolbar = NavigationToolbar(self.figure_canvas, self)
@@ -38,6 +44,8 @@ class FourierRingCorrelationDialog(QDialog):
         parameters_layout.addWidget(self.product1_combo_box, 0, 1)
         parameters_layout.addWidget(self.product2_label, 0, 2)
         parameters_layout.addWidget(self.product2_combo_box, 0, 3)
+        parameters_layout.addWidget(self.apodization_label, 0, 4)
+        parameters_layout.addWidget(self.apodization_spin_box, 0, 5)
         parameters_layout.setColumnStretch(1, 1)
         parameters_layout.setColumnStretch(3, 1)
 
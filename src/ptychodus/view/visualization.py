@@ -5,7 +5,16 @@ import logging
 import numpy
 
 from PyQt5.QtCore import pyqtSignal, Qt, QObject, QPointF, QLineF, QRectF, QSize, QSizeF
-from PyQt5.QtGui import QIcon, QImage, QPalette, QPen, QPixmap, QWheelEvent
+from PyQt5.QtGui import (
+    QIcon,
+    QImage,
+    QPainterPath,
+    QPalette,
+    QPen,
+    QPixmap,
+    QResizeEvent,
+    QWheelEvent,
+)
 from PyQt5.QtWidgets import (
     QAction,
     QApplication,
@@ -30,7 +39,7 @@ from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
 from matplotlib.backends.backend_qt import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
 
-from ptychodus.api.visualization import VisualizationProduct
+from ptychodus.api.visualization import RGBAArrayType, VisualizationProduct, VisualizationTile
 
 from .widgets import DecimalLineEdit
 
@@ -41,6 +50,7 @@ class ImageItemSignals(QObject):
     rectangle_finished = pyqtSignal(QRectF)
     line_cut_finished = pyqtSignal(QLineF)
     fourier_finished = pyqtSignal(QRectF)
+    moved = pyqtSignal()
 
 
 class ImageMouseTool(Enum):
@@ -57,6 +67,8 @@ class ImageItem(QGraphicsPixmapItem):
         self._signals = signals
         self._status_bar = status_bar
         self._product: VisualizationProduct | None = None
+        self._tile_items: dict[tuple[int, int, int], QGraphicsPixmapItem] = dict()
+        self._is_tiled = False
         self._mouse_tool = ImageMouseTool.MOVE_TOOL
 
         pen = QPen(Qt.PenStyle.DashLine)
@@ -91,10 +103,10 @@ class ImageItem(QGraphicsPixmapItem):
     def get_product(self) -> VisualizationProduct | None:
         return self._product
 
-    def set_product(self, product: VisualizationProduct) -> None:
-        image_rgba_f = product.get_image_rgba()
-        # NOTE .copy() ensures imageRGBAi is not a view
-        image_rgba_i = numpy.multiply(image_rgba_f, 255).astype(numpy.uint8).copy()
+    @staticmethod
+    def _create_pixmap(rgba: RGBAArrayType) -> QPixmap:
+        # NOTE QImage requires a contiguous buffer
+        image_rgba_i = numpy.ascontiguousarray(rgba)
 
         try:
             image = QImage(
@@ -104,18 +116,77 @@ class ImageItem(QGraphicsPixmapItem):
                 image_rgba_i.strides[0],
                 QImage.Format.Format_RGBA8888,
             )
-            pixmap = QPixmap.fromImage(image)
+            return QPixmap.fromImage(image)
         except Exception as exc:
             logger.exception(exc)
-            pixmap = QPixmap()
 
+        return QPixmap()
+
+    def set_product(self, product: VisualizationProduct) -> None:
+        """shows the product image, or awaits tiles if the product has no image"""
+        image_rgba = product.get_image_rgba()
+        self.prepareGeometryChange()
         self._product = product
-        self.setPixmap(pixmap)
+        self._is_tiled = image_rgba is None
+        self._clear_tiles()
+        self.setPixmap(QPixmap() if image_rgba is None else self._create_pixmap(image_rgba))
+
+    def is_tiled(self) -> bool:
+        return self._is_tiled
+
+    def set_tiles(self, tiles: list[VisualizationTile]) -> None:
+        keys = set()
+
+        for tile in tiles:
+            key = (tile.level, tile.row, tile.column)
+            keys.add(key)
+
+            if key not in self._tile_items:
+                tile_item = QGraphicsPixmapItem(self._create_pixmap(tile.rgba), self)
+                tile_item.setTransformationMode(Qt.TransformationMode.FastTransformation)
+                tile_item.setAcceptedMouseButtons(Qt.MouseButton.NoButton)
+                tile_item.setPos(tile.box.x, tile.box.y)
+                tile_item.setScale(tile.scale)
+                self._tile_items[key] = tile_item
+
+        for key in set(self._tile_items) - keys:
+            self._remove_tile_item(self._tile_items.pop(key))
+
+    def _remove_tile_item(self, tile_item: QGraphicsPixmapItem) -> None:
+        tile_item.setParentItem(None)
+        scene = self.scene()
+
+        if scene is not None:
+            scene.removeItem(tile_item)
+
+    def _clear_tiles(self) -> None:
+        for tile_item in self._tile_items.values():
+            self._remove_tile_item(tile_item)
+
+        self._tile_items.clear()
 
     def clear_product(self) -> None:
+        self.prepareGeometryChange()
         self._product = None
+        self._is_tiled = False
+        self._clear_tiles()
         self.setPixmap(QPixmap())
 
+    def boundingRect(self) -> QRectF:  # noqa: N802
+        if self._is_tiled and self._product is not None:
+            height, width = self._product.get_values().shape
+            return QRectF(0, 0, width, height)
+
+        return super().boundingRect()
+
+    def shape(self) -> QPainterPath:
+        if self._is_tiled:
+            path = QPainterPath()
+            path.addRect(self.boundingRect())
+            return path
+
+        return super().shape()
+
     def set_mouse_tool(self, mouse_tool: ImageMouseTool) -> None:
         self._fourier_item.setVisible(mouse_tool == ImageMouseTool.FOURIER_TOOL)
         self._mouse_tool = mouse_tool
@@ -203,6 +274,7 @@ class ImageItem(QGraphicsPixmapItem):
         match self._mouse_tool:
             case ImageMouseTool.MOVE_TOOL:
                 self.setPos(self.scenePos() + event.scenePos() - event.lastScenePos())
+                self._signals.moved.emit()
             case ImageMouseTool.RULER_TOOL:
                 origin = self._line_item.line().p1()
                 line = QLineF(origin, event.pos())
@@ -320,6 +392,12 @@ class HistogramDialog(QDialog):
 
 
 class VisualizationView(QGraphicsView):
+    viewport_changed = pyqtSignal()
+
+    def resizeEvent(self, event: QResizeEvent | None) -> None:  # noqa: N802
+        super().resizeEvent(event)
+        self.viewport_changed.emit()
+
     def wheelEvent(self, event: QWheelEvent | None) -> None:  # noqa: N802
         if event is None:
             return
@@ -334,6 +412,7 @@ class VisualizationView(QGraphicsView):
 
         delta_position = new_position - old_position
         self.translate(delta_position.x(), delta_position.y())
+        self.viewport_changed.emit()
 
 
 class VisualizationWidget(QGroupBox):
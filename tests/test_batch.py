@@ -0,0 +1,110 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+import os
+import socket
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from ptychodus.model.batch import (
+    BatchModeService,
+    submit_batch_mode_job,
+    wait_for_batch_mode_result,
+)
+
+
+@pytest.fixture
+def spool_directory(tmp_path: Path) -> Path:
+    return tmp_path / 'spool' / 'jobs'
+
+
+@contextmanager
+def _serving(service: BatchModeService) -> Iterator[None]:
+    thread = threading.Thread(target=service.serve)
+    thread.start()
+
+    try:
+        yield
+    finally:
+        service.stop()
+        thread.join()
+
+
+def test_submitted_jobs_return_results(spool_directory: Path, tmp_path: Path) -> None:
+    executed: list[tuple[str, Path, Path]] = list()
+
+    def execute(action: str, input_directory: Path, output_directory: Path) -> int:
+        executed.append((action, input_directory, output_directory))
+        return 7
+
+    service = BatchModeService(spool_directory, execute, lambda: None, poll_interval_s=0.01)
+    result_file_path = submit_batch_mode_job(spool_directory, 'reconstruct', tmp_path, tmp_path)
+
+    with _serving(service):
+        job_result = wait_for_batch_mode_result(
+            result_file_path, poll_interval_s=0.01, timeout_s=10.0
+        )
+
+    assert job_result.result == 7
+    assert executed == [('reconstruct', tmp_path.resolve(), tmp_path.resolve())]
+    assert list(spool_directory.iterdir()) == []
+
+
+def test_failed_reset_writes_failure_result(spool_directory: Path, tmp_path: Path) -> None:
+    num_resets = 0
+
+    def reset() -> None:
+        nonlocal num_resets
+        num_resets += 1
+
+        if num_resets == 1:
+            raise OSError('cannot open settings')
+
+    service = BatchModeService(spool_directory, lambda *args: 0, reset, poll_interval_s=0.01)
+    first = submit_batch_mode_job(spool_directory, 'reconstruct', tmp_path, tmp_path)
+    second = submit_batch_mode_job(spool_directory, 'reconstruct', tmp_path, tmp_path)
+
+    with _serving(service):
+        assert wait_for_batch_mode_result(first, poll_interval_s=0.01, timeout_s=10.0).result == -1
+        # the service keeps serving after a failure
+        assert wait_for_batch_mode_result(second, poll_interval_s=0.01, timeout_s=10.0).result == 0
+
+    assert list(spool_directory.glob('*.running.json')) == []
+
+
+def test_stale_running_jobs_fail_on_startup(spool_directory: Path) -> None:
+    exited = subprocess.run(
+        [sys.executable, '-c', 'import os; print(os.getpid())'],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    hostname = socket.gethostname()
+    spool_directory.mkdir(parents=True)
+    stale = spool_directory / f'1-stale@{hostname}-{int(exited.stdout)}.running.json'
+    stale.write_text('{}')
+    live = spool_directory / f'2-live@{hostname}-{os.getpid()}.running.json'
+    live.write_text('{}')
+
+    service = BatchModeService(spool_directory, lambda *args: 0, lambda: None, poll_interval_s=0.01)
+
+    with _serving(service):
+        job_result = wait_for_batch_mode_result(
+            spool_directory / '1-stale.result.json', poll_interval_s=0.01, timeout_s=10.0
+        )
+
+    assert job_result.result == -1
+    assert not stale.exists()
+    assert live.exists()
+
+
+def test_wait_times_out(spool_directory: Path, tmp_path: Path) -> None:
+    result_file_path = submit_batch_mode_job(spool_directory, 'train', tmp_path, tmp_path)
+
+    with pytest.raises(TimeoutError):
+        wait_for_batch_mode_result(result_file_path, poll_interval_s=0.01, timeout_s=0.05)
+
+    assert len(list(spool_directory.glob('*.job.json'))) == 1
@@ -0,0 +1,96 @@
+import numpy
+import scipy.fft
+
+from ptychodus.api.geometry import PixelGeometry
+from ptychodus.api.object import Object, ObjectCenter
+from ptychodus.model.analysis.frc import FourierRingCorrelator, FourierRings
+
+
+class _Product:
+    def __init__(self, object_: Object) -> None:
+        self._object = object_
+
+    def get_object(self) -> Object:
+        return self._object
+
+
+def _correlate_reference(
+    array1: numpy.ndarray, array2: numpy.ndarray, pixel_geometry: PixelGeometry
+) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """per-pixel ring accumulation, as implemented before vectorization"""
+    x_rm = scipy.fft.fftfreq(array1.shape[-1], d=pixel_geometry.width_m)
+    y_rm = scipy.fft.fftfreq(array1.shape[-2], d=pixel_geometry.height_m)
+    radial_bin_size_per_m = max(x_rm[1], y_rm[1])
+
+    xx_rm, yy_rm = numpy.meshgrid(x_rm, y_rm)
+    rings = numpy.divide(numpy.hypot(xx_rm, yy_rm), radial_bin_size_per_m).astype(int)
+    num_rings = numpy.max(rings) + 1
+    spatial_frequency_per_m = numpy.arange(num_rings) * radial_bin_size_per_m
+
+    sf1 = scipy.fft.fft2(array1)
+    sf2 = scipy.fft.fft2(array2)
+
+    c11 = numpy.zeros(num_rings, dtype=complex)
+    c12 = numpy.zeros(num_rings, dtype=complex)
+    c22 = numpy.zeros(num_rings, dtype=complex)
+    num_pixels = numpy.zeros(num_rings, dtype=int)
+
+    for index, v1, v2 in zip(rings.flat, sf1.flat, sf2.flat):
+        c11[index] += v1 * numpy.conj(v1)
+        c12[index] += v1 * numpy.conj(v2)
+        c22[index] += v2 * numpy.conj(v2)
+        num_pixels[index] += 1
+
+    correlation = numpy.absolute(c12) / numpy.sqrt(numpy.absolute(c11 * c22))
+    rnyquist = numpy.min(array1.shape) // 2 + 1
+    return spatial_frequency_per_m[:rnyquist], correlation[:rnyquist], num_pixels[:rnyquist]
+
+
+def test_correlation_matches_reference() -> None:
+    rng = numpy.random.default_rng(1234)
+    pixel_geometry = PixelGeometry(width_m=10e-9, height_m=12e-9)
+    center = ObjectCenter(coordinate_x_m=0.0, coordinate_y_m=0.0)
+    shape = (48, 40)
+
+    truth = rng.normal(size=shape) + 1j * rng.normal(size=shape)
+    array1 = truth + 0.5 * (rng.normal(size=shape) + 1j * rng.normal(size=shape))
+    array2 = truth + 0.5 * (rng.normal(size=shape) + 1j * rng.normal(size=shape))
+    repository = [
+        _Product(Object(array1, pixel_geometry, center)),
+        _Product(Object(array2, pixel_geometry, center)),
+    ]
+
+    correlator = FourierRingCorrelator(repository)  # type: ignore[arg-type]
+    frc = correlator.correlate(0, 1)
+    freq_rm, correlation, num_pixels = _correlate_reference(array1, array2, pixel_geometry)
+
+    numpy.testing.assert_allclose(frc.spatial_frequency_per_m, freq_rm)
+    numpy.testing.assert_allclose(frc.correlation[0], correlation, rtol=1e-10)
+
+    for snr, threshold in (
+        (FourierRingCorrelator.ONE_BIT_SNR, frc.one_bit_threshold),
+        (FourierRingCorrelator.HALF_BIT_SNR, frc.half_bit_threshold),
+    ):
+        sqrt_snr = numpy.sqrt(snr)
+        expected = [
+            (snr + (2 * sqrt_snr + 1) / numpy.sqrt(n)) / (1 + snr + 2 * sqrt_snr / numpy.sqrt(n))
+            for n in num_pixels
+        ]
+        numpy.testing.assert_allclose(threshold, expected)
+
+
+def test_rings_integrate_layers() -> None:
+    pixel_geometry = PixelGeometry(width_m=1e-9, height_m=1e-9)
+    rings = FourierRings.create(16, 20, pixel_geometry)
+    array = numpy.arange(2 * 16 * 20, dtype=float).reshape(2, 16, 20)
+    actual = rings.integrate(array)
+
+    for layer in range(2):
+        expected = numpy.zeros(rings.num_rings)
+
+        for index, value in zip(rings.rings, array[layer].flat):
+            expected[index] += value
+
+        numpy.testing.assert_allclose(actual[layer], expected)
+
+    assert rings.num_pixels_per_ring.sum() == 16 * 20
@@ -0,0 +1,83 @@
+from scipy.interpolate import griddata
+import numpy
+import pytest
+
+from ptychodus.api import interpolation
+from ptychodus.api.interpolation import GridInterpolator, get_grid_interpolator
+
+
+def _create_points(grid_shape: tuple[int, int]) -> numpy.ndarray:
+    """returns scattered (y, x) points whose convex hull leaves part of the grid uncovered"""
+    rng = numpy.random.default_rng(5)
+    height, width = grid_shape
+    return numpy.column_stack(
+        (rng.uniform(3.0, height - 6.0, 200), rng.uniform(4.0, width - 8.0, 200))
+    )
+
+
+def _griddata(
+    points: numpy.ndarray,
+    values: numpy.ndarray,
+    grid_shape: tuple[int, int],
+    method: str,
+    fill_value: float,
+) -> numpy.ndarray:
+    yy, xx = numpy.mgrid[: grid_shape[0], : grid_shape[1]]
+    return griddata(points, values, (yy, xx), method=method, fill_value=fill_value)
+
+
+def test_grid_interpolator_matches_griddata() -> None:
+    grid_shape = (40, 56)
+    points = _create_points(grid_shape)
+    values = numpy.sin(points[:, 0] / 7.0) * numpy.cos(points[:, 1] / 9.0)
+
+    for method in GridInterpolator.METHODS:
+        interpolator = GridInterpolator(points, grid_shape, method, max_workers=2)
+        actual = interpolator(values, fill_value=numpy.nan)
+        expected = _griddata(points, values, grid_shape, method, numpy.nan)
+
+        assert actual.shape == grid_shape
+        numpy.testing.assert_allclose(actual, expected, atol=1e-6, err_msg=method)
+
+        if method != 'nearest':
+            # pixels outside the convex hull are filled
+            assert numpy.isnan(actual[0, 0])
+
+
+def test_grid_interpolator_evaluates_columns() -> None:
+    grid_shape = (24, 30)
+    points = _create_points(grid_shape)
+    values = numpy.random.default_rng(6).normal(size=(len(points), 3))
+
+    for method in GridInterpolator.METHODS:
+        actual = GridInterpolator(points, grid_shape, method)(values, fill_value=-1.0)
+        assert actual.shape == (3, *grid_shape)
+
+        for column in range(3):
+            expected = _griddata(points, values[:, column], grid_shape, method, -1.0)
+            numpy.testing.assert_allclose(actual[column], expected, atol=1e-6, err_msg=method)
+
+
+def test_get_grid_interpolator_bounds_cache_bytes(monkeypatch: pytest.MonkeyPatch) -> None:
+    grid_shape = (24, 30)
+    points = _create_points(grid_shape)
+    nbytes = GridInterpolator(points, grid_shape).nbytes
+
+    monkeypatch.setattr(
+        interpolation, '_interpolator_cache', type(interpolation._interpolator_cache)()
+    )
+    monkeypatch.setattr(interpolation, '_INTERPOLATOR_CACHE_BYTES', 2 * nbytes)
+
+    first = get_grid_interpolator(points, grid_shape)
+    assert get_grid_interpolator(points, grid_shape) is first
+
+    get_grid_interpolator(points + 0.25, grid_shape)
+    get_grid_interpolator(points + 0.5, grid_shape)
+    assert get_grid_interpolator(points, grid_shape) is not first
+    assert len(interpolation._interpolator_cache) <= 2
+
+    # interpolators above the budget are not cached
+    monkeypatch.setattr(interpolation, '_INTERPOLATOR_CACHE_BYTES', nbytes - 1)
+    interpolation._interpolator_cache.clear()
+    get_grid_interpolator(points, grid_shape)
+    assert len(interpolation._interpolator_cache) == 0
@@ -0,0 +1,24 @@
+from scipy.stats import gaussian_kde
+import numpy
+
+from ptychodus.api.visualization import BinnedKernelDensity
+
+
+def test_binned_kernel_density_matches_gaussian_kde() -> None:
+    rng = numpy.random.default_rng(0)
+    dataset = numpy.concatenate((rng.normal(0.0, 1.0, 5000), rng.normal(4.0, 0.5, 3000)))
+    points = numpy.linspace(-4.0, 7.0, 500)
+
+    expected = gaussian_kde(dataset)(points)
+    actual = BinnedKernelDensity(dataset.reshape(80, 100))(points)
+
+    numpy.testing.assert_allclose(actual, expected, atol=1e-3 * expected.max())
+
+
+def test_binned_kernel_density_handles_constant_values() -> None:
+    kde = BinnedKernelDensity(numpy.full((4, 4), 2.0))
+    density = kde(numpy.linspace(1.0, 3.0, 201))
+
+    assert density.shape == (201,)
+    assert numpy.all(numpy.isfinite(density))
+    assert density.max() > 0.0
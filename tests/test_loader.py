@@ -0,0 +1,129 @@
+from pathlib import Path
+
+import h5py
+import numpy
+import pytest
+
+from ptychodus.api.diffraction import (
+    DiffractionDataset,
+    DiffractionMetadata,
+    SimpleDiffractionDataset,
+)
+from ptychodus.api.geometry import ImageExtent
+from ptychodus.api.settings import SettingsRegistry
+from ptychodus.api.tree import SimpleTreeNode
+from ptychodus.model.diffraction.bad_pixels import BadPixelsProvider
+from ptychodus.model.diffraction.cache import ProcessedPatternsCache
+from ptychodus.model.diffraction.dataset import AssembledDiffractionDataset
+from ptychodus.model.diffraction.settings import DetectorSettings, DiffractionSettings
+from ptychodus.model.diffraction.sizer import PatternSizer
+from ptychodus.model.diffraction._loader import LoadAllArraysInSubprocesses
+from ptychodus.model.task_manager import TaskManager
+from ptychodus.plugins.h5_diffraction_file import split_h5_diffraction_pattern_array
+
+
+def _write_patterns(file_path: Path) -> numpy.ndarray:
+    rng = numpy.random.default_rng(11)
+    patterns = rng.integers(0, 1000, size=(40, 48, 56)).astype(numpy.uint32)
+
+    with h5py.File(file_path, 'w') as h5_file:
+        h5_file.create_dataset('/entry/data/data', data=patterns, chunks=(8, 48, 56))
+
+    return patterns
+
+
+def _read_dataset(file_path: Path) -> DiffractionDataset:
+    """splits the patterns into several arrays regardless of the number of processors"""
+    with h5py.File(file_path, 'r') as h5_file:
+        data = h5_file['/entry/data/data']
+        array_list = split_h5_diffraction_pattern_array(
+            'patterns', file_path, '/entry/data/data', data, max_num_arrays=4
+        )
+        metadata = DiffractionMetadata(
+            num_patterns_per_array=[len(array.get_indexes()) for array in array_list],
+            pattern_dtype=data.dtype,
+            detector_extent=ImageExtent(56, 48),
+            file_path=file_path,
+        )
+
+    return SimpleDiffractionDataset(metadata, SimpleTreeNode.create_root(['Name']), array_list)
+
+
+def _load_patterns(
+    file_path: Path, scratch_directory: Path, *, multiprocess_loading_enabled: bool
+) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, int]:
+    """returns the assembled indexes, patterns, pattern counts, and number of arrays"""
+    settings_registry = SettingsRegistry()
+    detector_settings = DetectorSettings(settings_registry)
+    detector_settings.width_px.set_value(56)
+    detector_settings.height_px.set_value(48)
+    diffraction_settings = DiffractionSettings(settings_registry)
+    diffraction_settings.scratch_directory.set_value(scratch_directory)
+    diffraction_settings.multiprocess_loading_enabled.set_value(multiprocess_loading_enabled)
+    diffraction_settings.crop_center_x_px.set_value(30)
+    diffraction_settings.crop_center_y_px.set_value(22)
+    diffraction_settings.crop_width_px.set_value(32)
+    diffraction_settings.crop_height_px.set_value(24)
+    diffraction_settings.value_upper_bound_enabled.set_value(True)
+    diffraction_settings.value_upper_bound.set_value(900)
+
+    task_manager = TaskManager()
+    dataset = AssembledDiffractionDataset(
+        diffraction_settings,
+        PatternSizer(detector_settings, diffraction_settings),
+        BadPixelsProvider(detector_settings),
+        task_manager,
+        ProcessedPatternsCache(diffraction_settings),
+    )
+    task_manager.start()
+
+    try:
+        dataset.reload(_read_dataset(file_path))
+        dataset.load_all_arrays(block=True)
+        task_manager.run_foreground_tasks()
+    finally:
+        task_manager.stop(await_finish=True)
+
+    return (
+        numpy.array(dataset.get_assembled_indexes()),
+        numpy.array(dataset.get_assembled_patterns()),
+        numpy.array([dataset.get_pattern_counts_lut()[index] for index in range(40)]),
+        len(dataset),
+    )
+
+
+def test_subprocess_loading_matches_thread_loading(tmp_path: Path) -> None:
+    file_path = tmp_path / 'patterns.h5'
+    patterns = _write_patterns(file_path)
+
+    expected = _load_patterns(file_path, tmp_path, multiprocess_loading_enabled=False)
+    actual = _load_patterns(file_path, tmp_path, multiprocess_loading_enabled=True)
+
+    numpy.testing.assert_array_equal(expected[0], numpy.arange(40))
+    cropped = patterns[:, 10:34, 14:46]
+    numpy.testing.assert_array_equal(expected[1], numpy.where(cropped < 900, cropped, 0))
+
+    for expected_array, actual_array in zip(expected, actual):
+        numpy.testing.assert_array_equal(actual_array, expected_array)
+
+    assert actual[3] == expected[3] > 1  # several arrays loaded concurrently
+
+
+def test_subprocess_loading_signals_finished_on_failure(tmp_path: Path) -> None:
+    patterns = numpy.memmap(
+        tmp_path / 'patterns.dat', dtype=numpy.uint16, mode='w+', shape=(2, 4, 4)
+    )
+    loader = LoadAllArraysInSubprocesses(
+        [],
+        None,  # type: ignore[arg-type]
+        patterns,
+        [],
+        numpy.zeros((4, 4), dtype=bool),
+        None,
+        max_workers=0,
+    )
+
+    with pytest.raises(ValueError):
+        loader()
+
+    assert loader.get_finished_event().is_set()
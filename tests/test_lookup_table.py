@@ -0,0 +1,75 @@
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import Normalize
+import matplotlib
+import numpy
+
+from ptychodus.model.visualization.color_model import (
+    HLSAlphaColorModel,
+    HLSLightnessColorModel,
+    HLSSaturationColorModel,
+    HSVAlphaColorModel,
+    HSVSaturationColorModel,
+    HSVValueColorModel,
+)
+from ptychodus.model.visualization.lookup_table import (
+    ColormapLookupTable,
+    CylindricalLookupTable,
+)
+
+
+def test_colormap_lookup_table_matches_scalar_mappable() -> None:
+    rng = numpy.random.default_rng(0)
+    values = rng.uniform(-1.0, 4.0, size=(120, 150))
+    values[0, :10] = numpy.nan
+    values[1, :10] = 3.0  # upper limit
+
+    for name in ('gray', 'viridis', 'twilight', 'RdBu', 'jet'):
+        cmap = matplotlib.colormaps[name]
+        scalar_mappable = ScalarMappable(Normalize(vmin=0.0, vmax=3.0, clip=False), cmap)
+        expected = scalar_mappable.to_rgba(values) * 255.0
+        actual = ColormapLookupTable(cmap)(values, 0.0, 3.0, max_workers=2)
+
+        assert actual.dtype == numpy.uint8
+        numpy.testing.assert_allclose(actual, expected, atol=0.5 + 1e-9, err_msg=name)
+
+
+def test_colormap_lookup_table_handles_degenerate_range() -> None:
+    cmap = matplotlib.colormaps['viridis']
+    values = numpy.linspace(-1.0, 1.0, 11).reshape(1, 11)
+    scalar_mappable = ScalarMappable(Normalize(vmin=0.5, vmax=0.5, clip=False), cmap)
+    expected = scalar_mappable.to_rgba(values) * 255.0
+    actual = ColormapLookupTable(cmap)(values, 0.5, 0.5)
+    numpy.testing.assert_allclose(actual, expected, atol=0.5 + 1e-9)
+
+
+def test_cylindrical_lookup_table_matches_color_model() -> None:
+    rng = numpy.random.default_rng(1)
+    hue = rng.uniform(0.0, 1.0, size=(200, 250))
+    values = rng.uniform(2.0, 6.0, size=hue.shape)
+
+    for model in (
+        HSVSaturationColorModel(),
+        HSVValueColorModel(),
+        HSVAlphaColorModel(),
+        HLSLightnessColorModel(),
+        HLSSaturationColorModel(),
+        HLSAlphaColorModel(),
+    ):
+        expected = model(hue, Normalize(vmin=2.0, vmax=6.0, clip=False)(values)) * 255.0
+        actual = CylindricalLookupTable(model)(hue, values, 2.0, 6.0, max_workers=2)
+        error = numpy.absolute(actual - expected)
+
+        assert actual.dtype == numpy.uint8
+        assert error.max() <= 1.5, type(model).__name__
+        assert numpy.mean(error > 1.0) < 1e-3, type(model).__name__
+
+
+def test_cylindrical_lookup_table_clips_values_and_marks_bad() -> None:
+    model = HSVValueColorModel()
+    hue = numpy.array([[0.25, 0.25, 0.25]])
+    values = numpy.array([[-1.0, 2.0, numpy.nan]])
+    actual = CylindricalLookupTable(model)(hue, values, 0.0, 1.0)
+    expected = model(hue[:, :2], numpy.array([[0.0, 1.0]])) * 255.0
+
+    numpy.testing.assert_allclose(actual[:, :2], expected, atol=1.0)
+    numpy.testing.assert_array_equal(actual[0, 2], 0)
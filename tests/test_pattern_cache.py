@@ -0,0 +1,107 @@
+from pathlib import Path
+import os
+
+import h5py
+import numpy
+
+from ptychodus.api.settings import SettingsRegistry
+from ptychodus.model.diffraction._loader import AssembledDiffractionData
+from ptychodus.model.diffraction.cache import ProcessedPatternsCache
+from ptychodus.model.diffraction.settings import DiffractionSettings
+from ptychodus.plugins.h5_diffraction_file import H5DiffractionFileReader
+
+
+def _create_cache(tmp_path: Path, capacity_MB: int = 1) -> ProcessedPatternsCache:  # noqa: N803
+    settings = DiffractionSettings(SettingsRegistry())
+    settings.scratch_directory.set_value(tmp_path / 'scratch')
+    settings.pattern_cache_enabled.set_value(True)
+    settings.pattern_cache_capacity_MB.set_value(capacity_MB)
+    return ProcessedPatternsCache(settings)
+
+
+def _write_linked_patterns(tmp_path: Path, patterns: numpy.ndarray) -> Path:
+    """writes patterns to a data file referenced from a master file by an external link"""
+    data_file_path = tmp_path / 'data.h5'
+
+    with h5py.File(data_file_path, 'w') as h5_file:
+        h5_file.create_dataset('data', data=patterns, chunks=(4, *patterns.shape[1:]))
+
+    master_file_path = tmp_path / 'master.h5'
+
+    if not master_file_path.exists():
+        with h5py.File(master_file_path, 'w') as h5_file:
+            h5_file['/entry/data/data'] = h5py.ExternalLink(data_file_path.name, '/data')
+
+    return master_file_path
+
+
+def test_key_tracks_external_link_targets(tmp_path: Path) -> None:
+    cache = _create_cache(tmp_path)
+    reader = H5DiffractionFileReader('/entry/data/data')
+    bad_pixels = numpy.zeros((6, 5), dtype=bool)
+    patterns = numpy.arange(16 * 6 * 5, dtype=numpy.uint16).reshape(16, 6, 5)
+
+    master_file_path = _write_linked_patterns(tmp_path, patterns)
+    dataset = reader.read(master_file_path)
+    key = cache.get_key(dataset, bad_pixels, None)
+    assert key is not None
+    assert key == cache.get_key(reader.read(master_file_path), bad_pixels, None)
+
+    # rewrite only the link target; the master file is unchanged
+    master_stat = master_file_path.stat()
+    _write_linked_patterns(tmp_path, patterns[::-1].copy())
+    data_stat = (tmp_path / 'data.h5').stat()
+    os.utime(tmp_path / 'data.h5', ns=(data_stat.st_atime_ns, data_stat.st_mtime_ns + 10**9))
+    assert master_file_path.stat().st_mtime_ns == master_stat.st_mtime_ns
+
+    assert cache.get_key(reader.read(master_file_path), bad_pixels, None) != key
+
+
+def test_store_and_load(tmp_path: Path) -> None:
+    cache = _create_cache(tmp_path)
+    rng = numpy.random.default_rng(0)
+    bad_pixels = rng.uniform(size=(6, 5)) < 0.1
+    data = AssembledDiffractionData.create_pattern_counts(
+        indexes=numpy.arange(10, 30),
+        patterns=rng.integers(0, 100, size=(20, 6, 5)).astype(numpy.uint16),
+        bad_pixels=bad_pixels,
+    )
+    labels = ['a', 'b']
+
+    assert cache.load('key') is None
+    cache.store('key', labels, data, bad_pixels)
+    cached = cache.load('key')
+
+    assert cached is not None
+    assert list(cached.labels) == labels
+    numpy.testing.assert_array_equal(cached.data.indexes, data.indexes)
+    numpy.testing.assert_array_equal(cached.data.patterns, data.patterns)
+    numpy.testing.assert_array_equal(cached.data.pattern_counts, data.pattern_counts)
+    numpy.testing.assert_array_equal(cached.bad_pixels, bad_pixels)
+
+
+def test_store_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = _create_cache(tmp_path, capacity_MB=1)
+    bad_pixels = numpy.zeros((64, 64), dtype=bool)
+
+    def create_data(num_patterns: int) -> AssembledDiffractionData:
+        return AssembledDiffractionData.create_pattern_counts(
+            indexes=numpy.arange(num_patterns),
+            patterns=numpy.ones((num_patterns, 64, 64), dtype=numpy.float32),
+            bad_pixels=bad_pixels,
+        )
+
+    # each entry is a little over 0.4MB, so only two fit
+    cache.store('first', ['first'], create_data(26), bad_pixels)
+    cache.store('second', ['second'], create_data(26), bad_pixels)
+    entry_dir = tmp_path / 'scratch' / ProcessedPatternsCache.CACHE_DIRECTORY_NAME
+    os.utime(entry_dir / 'first', ns=(0, 0))
+    cache.store('third', ['third'], create_data(26), bad_pixels)
+
+    assert cache.load('first') is None
+    assert cache.load('second') is not None
+    assert cache.load('third') is not None
+
+    # entries larger than the capacity are not stored
+    cache.store('huge', ['huge'], create_data(100), bad_pixels)
+    assert cache.load('huge') is None
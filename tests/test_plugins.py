@@ -0,0 +1,22 @@
+from pathlib import Path
+import json
+
+from ptychodus.api.plugins import PluginRegistry
+
+
+def test_stale_manifest_is_replaced_atomically(tmp_path: Path) -> None:
+    manifest_path = tmp_path / 'manifest.json'
+    manifest_path.write_text(json.dumps({'key': 'stale', 'modules': {}}))
+
+    registry = PluginRegistry.load_plugins(manifest_path)
+    manifest = json.loads(manifest_path.read_text())
+
+    assert manifest['key'] != 'stale'
+    assert manifest['modules']
+    assert list(tmp_path.iterdir()) == [manifest_path]  # no temporary files remain
+
+    # a current manifest registers the same plugins lazily
+    lazy_registry = PluginRegistry.load_plugins(manifest_path)
+    assert [plugin.simple_name for plugin in lazy_registry.diffraction_file_readers] == [
+        plugin.simple_name for plugin in registry.diffraction_file_readers
+    ]
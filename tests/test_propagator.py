@@ -0,0 +1,64 @@
+import dataclasses
+
+import numpy
+
+from ptychodus.api.propagator import (
+    AngularSpectrumPropagator,
+    MultiplaneAngularSpectrumPropagator,
+    PropagatorParameters,
+)
+
+
+def _create_wavefield(num_modes: int, height_px: int, width_px: int) -> numpy.ndarray:
+    rng = numpy.random.default_rng(42)
+    yy, xx = numpy.mgrid[:height_px, :width_px]
+    envelope = numpy.exp(
+        -(numpy.square(xx - width_px / 2) + numpy.square(yy - height_px / 2)) / (2 * 6.0**2)
+    )
+    phase = rng.uniform(-0.5, 0.5, size=(num_modes, height_px, width_px))
+    return envelope * numpy.exp(1j * phase)
+
+
+def test_multiplane_matches_single_plane() -> None:
+    num_modes, height_px, width_px = 3, 40, 48
+    wavefield = _create_wavefield(num_modes, height_px, width_px)
+    parameters = PropagatorParameters(
+        wavelength_m=1.0e-10,
+        width_px=width_px,
+        height_px=height_px,
+        pixel_width_m=10.0e-9,
+        pixel_height_m=12.0e-9,
+        propagation_distance_m=0.0,
+    )
+    distance_m = numpy.linspace(-50.0e-6, 80.0e-6, 7)
+
+    # a small chunk budget forces several chunks of distances
+    propagator = MultiplaneAngularSpectrumPropagator(
+        parameters, max_chunk_bytes=3 * wavefield.nbytes
+    )
+    actual = propagator.propagate(wavefield, distance_m)
+    assert actual.shape == (len(distance_m), num_modes, height_px, width_px)
+
+    for idx, z_m in enumerate(distance_m):
+        single_plane = AngularSpectrumPropagator(
+            dataclasses.replace(parameters, propagation_distance_m=float(z_m))
+        )
+
+        for mode in range(num_modes):
+            expected = single_plane.propagate(wavefield[mode])
+            numpy.testing.assert_allclose(actual[idx, mode], expected, atol=1e-10)
+
+
+def test_multiplane_zero_distance_is_band_limited_identity() -> None:
+    wavefield = _create_wavefield(1, 32, 32)[0]
+    parameters = PropagatorParameters(
+        wavelength_m=1.0e-10,
+        width_px=32,
+        height_px=32,
+        pixel_width_m=10.0e-9,
+        pixel_height_m=10.0e-9,
+        propagation_distance_m=0.0,
+    )
+    propagator = MultiplaneAngularSpectrumPropagator(parameters)
+    actual = propagator.propagate(wavefield, [0.0])
+    numpy.testing.assert_allclose(actual[0], wavefield, atol=1e-12)
@@ -0,0 +1,104 @@
+import numpy
+
+from ptychodus.api.geometry import Box2D
+from ptychodus.api.typing import NumberArrayType
+from ptychodus.model.visualization.color_axis import ColorAxis
+from ptychodus.model.visualization.colormap import ColormapParameter
+from ptychodus.model.visualization.colormap_renderer import ColormapRenderer
+from ptychodus.model.visualization.components import (
+    DataArrayComponent,
+    RealArrayComponent,
+    UnwrappedPhaseInRadiansArrayComponent,
+)
+from ptychodus.model.visualization.pyramid import TilePyramid
+from ptychodus.model.visualization.transformation import ScalarTransformationParameter
+
+TILE_SIZE = 8
+
+
+def _create_renderer(component: DataArrayComponent, lower: float, upper: float) -> ColormapRenderer:
+    color_axis = ColorAxis()
+    color_axis.set_range(lower, upper)
+    return ColormapRenderer(
+        component, ScalarTransformationParameter(), color_axis, ColormapParameter(is_cyclic=False)
+    )
+
+
+def _create_level_arrays(array: NumberArrayType, num_levels: int) -> list[NumberArrayType]:
+    """replicates the last row and column when odd, then averages 2x2 blocks"""
+    level_arrays = [array]
+
+    for _ in range(1, num_levels):
+        finer = level_arrays[-1]
+        padded = numpy.pad(finer, ((0, finer.shape[0] % 2), (0, finer.shape[1] % 2)), 'edge')
+        level_arrays.append(
+            0.25
+            * (padded[0::2, 0::2] + padded[1::2, 0::2] + padded[0::2, 1::2] + padded[1::2, 1::2])
+        )
+
+    return level_arrays
+
+
+def _assemble_level(pyramid: TilePyramid, level: int, shape: tuple[int, ...]) -> numpy.ndarray:
+    """renders the whole array at a level and checks that tile boxes tile the array"""
+    step = 1 << level
+    extent = Box2D(x=0, y=0, width=pyramid.array.shape[1], height=pyramid.array.shape[0])
+    tiles = pyramid.get_tiles(extent, zoom=1.0 / step)
+    rgba = numpy.zeros((*shape, 4), dtype=numpy.uint8)
+    is_covered = numpy.zeros(shape, dtype=bool)
+
+    for tile in tiles:
+        assert tile.level == level
+        row_begin = tile.row * TILE_SIZE
+        column_begin = tile.column * TILE_SIZE
+        height, width = tile.rgba.shape[:2]
+        assert tile.box == Box2D(
+            x=column_begin * step, y=row_begin * step, width=width * step, height=height * step
+        )
+        assert tile.box.x_end <= shape[1] * step and tile.box.y_end <= shape[0] * step
+
+        rows = slice(row_begin, row_begin + height)
+        columns = slice(column_begin, column_begin + width)
+        assert not numpy.any(is_covered[rows, columns])
+        rgba[rows, columns] = tile.rgba
+        is_covered[rows, columns] = True
+
+    assert numpy.all(is_covered)
+    return rgba
+
+
+def test_tiles_render_block_averaged_levels() -> None:
+    array = numpy.random.default_rng(0).uniform(size=(37, 22))
+    renderer = _create_renderer(RealArrayComponent(), 0.2, 0.8)
+    assert renderer.is_elementwise()
+
+    pyramid = TilePyramid(array, renderer, tile_size=TILE_SIZE)
+    assert pyramid.num_levels == 4
+
+    for level, level_array in enumerate(_create_level_arrays(array, pyramid.num_levels)):
+        assert level_array.shape == (-(-37 // (1 << level)), -(-22 // (1 << level)))
+        rgba = _assemble_level(pyramid, level, level_array.shape)
+        numpy.testing.assert_array_equal(rgba, renderer.colorize_rgba(level_array))
+
+    # rendered tiles are cached
+    assert pyramid.get_tile(1, 0, 0) is pyramid.get_tile(1, 0, 0)
+
+
+def test_non_elementwise_renderers_colorize_whole_levels() -> None:
+    # phase ramps that wrap several times so unwrapping depends on neighboring tiles
+    y, x = numpy.mgrid[:30, :27]
+    array = numpy.exp(0.9j * (x + 0.5 * y))
+    renderer = _create_renderer(UnwrappedPhaseInRadiansArrayComponent(), -40.0, 40.0)
+    assert not renderer.is_elementwise()
+
+    pyramid = TilePyramid(array, renderer, tile_size=TILE_SIZE)
+
+    for level, level_array in enumerate(_create_level_arrays(array, pyramid.num_levels)):
+        rgba = _assemble_level(pyramid, level, level_array.shape)
+        numpy.testing.assert_array_equal(rgba, renderer.colorize_rgba(level_array))
+
+    # colorizing a tile alone loses the phase offset accumulated across tiles
+    tile = pyramid.get_tile(0, 2, 2)
+    assert not numpy.array_equal(
+        tile.rgba, renderer.colorize_rgba(array[2 * TILE_SIZE : 3 * TILE_SIZE, 16:24])
+    )
@@ -0,0 +1,114 @@
+import numpy
+
+from ptychodus.model.analysis.interpolators import BarycentricArrayStitcher
+
+
+def _create_patches(
+    num_patches: int, shape: tuple[int, ...], array_shape: tuple[int, int], *, seed: int
+) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """returns patch centers (x, y) that keep every patch inside the array, values, weights"""
+    rng = numpy.random.default_rng(seed)
+    patch_height, patch_width = shape[-2:]
+    array_height, array_width = array_shape
+    centers_x = rng.uniform(patch_width / 2 + 1, array_width - patch_width / 2 - 2, num_patches)
+    centers_y = rng.uniform(patch_height / 2 + 1, array_height - patch_height / 2 - 2, num_patches)
+    values = rng.normal(size=(num_patches, *shape)) + 1j * rng.normal(size=(num_patches, *shape))
+    weights = rng.uniform(0.1, 1.0, size=(num_patches, *shape))
+    return centers_x, centers_y, values, weights
+
+
+def test_add_patches_matches_add_patch() -> None:
+    array_shape = (64, 80)
+    centers_x, centers_y, values, weights = _create_patches(50, (9, 11), array_shape, seed=0)
+
+    expected = BarycentricArrayStitcher[numpy.complex128](
+        numpy.zeros(array_shape, dtype=complex), numpy.zeros(array_shape)
+    )
+
+    for center_x, center_y, value, weight in zip(centers_x, centers_y, values, weights):
+        expected.add_patch(center_x, center_y, value, weight)
+
+    # small chunks exercise many bounding boxes and concurrent accumulation
+    actual = BarycentricArrayStitcher[numpy.complex128](
+        numpy.zeros(array_shape, dtype=complex), numpy.zeros(array_shape)
+    )
+    actual.add_patches(centers_x, centers_y, values, weights, max_chunk_size=600, max_workers=4)
+
+    numpy.testing.assert_allclose(actual.stitch(), expected.stitch(), atol=1e-12)
+
+
+def test_add_patches_broadcasts_layers() -> None:
+    array_shape = (3, 40, 48)
+    centers_x, centers_y, values, _ = _create_patches(20, (7, 8), array_shape[-2:], seed=1)
+    real_values = values.real
+
+    expected = BarycentricArrayStitcher[numpy.double](numpy.zeros(array_shape))
+
+    for center_x, center_y, value in zip(centers_x, centers_y, real_values):
+        expected.add_patch(center_x, center_y, value)
+
+    actual = BarycentricArrayStitcher[numpy.double](numpy.zeros(array_shape))
+    actual.add_patches(centers_x, centers_y, real_values, max_chunk_size=300)
+
+    numpy.testing.assert_allclose(actual.stitch(), expected.stitch(), atol=1e-12)
+
+
+def test_add_patches_ignores_pixels_outside_array() -> None:
+    stitcher = BarycentricArrayStitcher[numpy.double](numpy.zeros((16, 16)))
+    stitcher.add_patches(
+        numpy.array([0.0, 15.5, 40.0]),
+        numpy.array([0.0, 15.5, 40.0]),
+        numpy.ones((3, 4, 4)),
+    )
+    stitched = stitcher.stitch()
+
+    assert numpy.isclose(stitched.sum(), 2 * 2 + 2.5 * 2.5)
+    assert numpy.all(stitched >= 0.0)
+
+
+def test_add_patches_clips_patches_at_array_edges() -> None:
+    array_shape = (24, 28)
+    padding = 8
+    centers_x = numpy.array([0.5, -1.25, 27.75, 13.0])
+    centers_y = numpy.array([-0.75, 23.5, 1.25, 12.6])
+    values = numpy.random.default_rng(2).uniform(size=(4, 6, 5))
+
+    padded = BarycentricArrayStitcher[numpy.double](
+        numpy.zeros((array_shape[0] + 2 * padding, array_shape[1] + 2 * padding))
+    )
+
+    for center_x, center_y, value in zip(centers_x, centers_y, values):
+        padded.add_patch(center_x + padding, center_y + padding, value)
+
+    expected = padded.stitch()[padding:-padding, padding:-padding]
+
+    actual = BarycentricArrayStitcher[numpy.double](numpy.zeros(array_shape))
+    actual.add_patches(centers_x, centers_y, values)
+
+    numpy.testing.assert_allclose(actual.stitch(), expected, atol=1e-12)
+
+
+def test_add_patch_matches_add_patches_for_overhanging_patches() -> None:
+    array_shape = (2, 20, 24)
+    rng = numpy.random.default_rng(3)
+    # patches hang over the top and left edges by up to their full size
+    centers_x = numpy.concatenate([rng.uniform(-5.0, 4.0, 10), rng.uniform(0.0, 24.0, 10)])
+    centers_y = numpy.concatenate([rng.uniform(0.0, 20.0, 10), rng.uniform(-4.0, 3.0, 10)])
+    values = rng.normal(size=(20, 6, 7)) + 1j * rng.normal(size=(20, 6, 7))
+    weights = rng.uniform(0.1, 1.0, size=(20, 6, 7))
+
+    expected = BarycentricArrayStitcher[numpy.complex128](
+        numpy.zeros(array_shape, dtype=complex), numpy.zeros(array_shape)
+    )
+
+    for center_x, center_y, value, weight in zip(centers_x, centers_y, values, weights):
+        expected.add_patch(center_x, center_y, value, weight)
+
+    actual = BarycentricArrayStitcher[numpy.complex128](
+        numpy.zeros(array_shape, dtype=complex), numpy.zeros(array_shape)
+    )
+    actual.add_patches(centers_x, centers_y, values, weights, max_chunk_size=200)
+
+    assert numpy.any(expected.stitch()[:, 0, :] != 0.0)
+    assert numpy.any(expected.stitch()[:, :, 0] != 0.0)
+    numpy.testing.assert_allclose(actual.stitch(), expected.stitch(), atol=1e-12)
@@ -0,0 +1,272 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+import threading
+
+import numpy
+import pytest
+
+from ptychodus.api.diffraction import DiffractionArray, DiffractionMetadata, SimpleDiffractionArray
+from ptychodus.api.observer import Observable
+from ptychodus.api.plugins import PluginChooser
+from ptychodus.api.settings import SettingsRegistry
+from ptychodus.model import PtychodusStreamingContext
+from ptychodus.model.diffraction import (
+    DiffractionCore,
+    PatternsStreamingContext,
+    StreamingDropPolicy,
+)
+from ptychodus.model.product import ProductCore
+from ptychodus.model.task_manager import TaskManager
+
+WIDTH_PX = 8
+HEIGHT_PX = 6
+
+
+def _create_frames(*indexes: int) -> SimpleDiffractionArray:
+    patterns = numpy.zeros((len(indexes), HEIGHT_PX, WIDTH_PX), dtype=numpy.uint16)
+    patterns += numpy.array(indexes, dtype=numpy.uint16)[:, numpy.newaxis, numpy.newaxis]
+    return SimpleDiffractionArray('frames', numpy.array(indexes), patterns)
+
+
+def _create_metadata(num_patterns_per_array: list[int]) -> DiffractionMetadata:
+    return DiffractionMetadata(
+        num_patterns_per_array=num_patterns_per_array, pattern_dtype=numpy.dtype(numpy.uint16)
+    )
+
+
+@contextmanager
+def _create_cores() -> Iterator[tuple[DiffractionCore, ProductCore]]:
+    settings_registry = SettingsRegistry()
+    task_manager = TaskManager()
+    reinit_observable = Observable()
+    diffraction_core = DiffractionCore(
+        task_manager,
+        settings_registry,
+        PluginChooser(),
+        PluginChooser(),
+        PluginChooser(),
+        reinit_observable,
+    )
+    diffraction_core.detector_settings.width_px.set_value(WIDTH_PX)
+    diffraction_core.detector_settings.height_px.set_value(HEIGHT_PX)
+    diffraction_core.diffraction_settings.crop_enabled.set_value(False)
+    product_core = ProductCore(
+        numpy.random.default_rng(0),
+        settings_registry,
+        diffraction_core.pattern_sizer,
+        diffraction_core.dataset,
+        PluginChooser(),
+        PluginChooser(),
+        PluginChooser(),
+        PluginChooser(),
+        PluginChooser(),
+        PluginChooser(),
+        PluginChooser(),
+        PluginChooser(),
+        PluginChooser(),
+        reinit_observable,
+    )
+    task_manager.start()
+
+    try:
+        yield diffraction_core, product_core
+    finally:
+        task_manager.stop(await_finish=True)
+
+
+class _GatedLoader:
+    """holds the streaming worker inside load_array until opened"""
+
+    def __init__(self, diffraction_core: DiffractionCore, monkeypatch: pytest.MonkeyPatch) -> None:
+        self._load_array = diffraction_core.dataset.load_array
+        self.entered = threading.Event()
+        self.opened = threading.Event()
+        monkeypatch.setattr(diffraction_core.dataset, 'load_array', self)
+
+    def __call__(self, array: DiffractionArray, *, process_patterns: bool) -> None:
+        self.entered.set()
+        assert self.opened.wait(timeout=10.0)
+        self._load_array(array, process_patterns=process_patterns)
+
+
+def _create_patterns_context(
+    diffraction_core: DiffractionCore,
+    num_patterns_per_array: list[int],
+    *,
+    max_queue_size: int = 4096,
+    drop_policy: StreamingDropPolicy = StreamingDropPolicy.BLOCK,
+) -> PatternsStreamingContext:
+    return diffraction_core.diffraction_api.create_streaming_context(
+        _create_metadata(num_patterns_per_array),
+        max_queue_size=max_queue_size,
+        drop_policy=drop_policy,
+    )
+
+
+def test_frames_are_batched_into_arrays() -> None:
+    with _create_cores() as (diffraction_core, _):
+        context = _create_patterns_context(diffraction_core, [4, 4, 4])
+        context.start()
+
+        # frames straddle the assembled arrays
+        for indexes in ([0], [1, 2, 3, 4, 5], [6], [7, 8], [9, 10, 11]):
+            context.append_array(_create_frames(*indexes))
+
+        context.stop()
+        statistics = context.get_statistics()
+
+        numpy.testing.assert_array_equal(
+            diffraction_core.dataset.get_assembled_indexes(), numpy.arange(12)
+        )
+        numpy.testing.assert_array_equal(
+            numpy.asarray(diffraction_core.dataset.get_assembled_patterns())[:, 0, 0],
+            numpy.arange(12),
+        )
+        assert statistics.num_frames_received == statistics.num_frames_loaded == 12
+        assert statistics.num_frames_dropped == statistics.num_frames_queued == 0
+        assert context.get_loaded_indexes() == set(range(12))
+
+
+def test_frames_beyond_metadata_and_incomplete_arrays_are_dropped() -> None:
+    with _create_cores() as (diffraction_core, _):
+        context = _create_patterns_context(diffraction_core, [2, 2])
+        context.start()
+        context.append_array(_create_frames(0, 1, 2))
+        context.stop()
+
+        statistics = context.get_statistics()
+        assert statistics.num_frames_loaded == 2
+        assert statistics.num_frames_dropped == 1
+        assert statistics.num_frames_queued == 0
+
+
+def test_frames_received_while_not_streaming_are_dropped() -> None:
+    with _create_cores() as (diffraction_core, _):
+        context = _create_patterns_context(diffraction_core, [1], max_queue_size=1)
+
+        # neither blocks nor fills the queue without a running worker
+        context.append_array(_create_frames(0))
+        context.append_array(_create_frames(1))
+
+        statistics = context.get_statistics()
+        assert statistics.num_frames_received == statistics.num_frames_dropped == 2
+        assert context.get_queue_size() == 0
+
+
+@pytest.mark.parametrize(
+    'drop_policy, expected_indexes',
+    [
+        (StreamingDropPolicy.DROP_NEWEST, {0, 1, 2}),
+        (StreamingDropPolicy.DROP_OLDEST, {0, 2, 3}),
+    ],
+)
+def test_drop_policies(
+    monkeypatch: pytest.MonkeyPatch, drop_policy: StreamingDropPolicy, expected_indexes: set[int]
+) -> None:
+    with _create_cores() as (diffraction_core, _):
+        loader = _GatedLoader(diffraction_core, monkeypatch)
+        context = _create_patterns_context(
+            diffraction_core, [1] * 4, max_queue_size=2, drop_policy=drop_policy
+        )
+        context.start()
+        context.append_array(_create_frames(0))
+        assert loader.entered.wait(timeout=10.0)
+
+        # the worker is busy with frame 0, so frames 1 and 2 fill the queue
+        for index in range(1, 4):
+            context.append_array(_create_frames(index))
+
+        assert context.get_queue_size() == 3
+        loader.opened.set()
+        context.stop()
+
+        statistics = context.get_statistics()
+        assert context.get_loaded_indexes() == expected_indexes
+        assert statistics.num_frames_received == 4
+        assert statistics.num_frames_loaded == 3
+        assert statistics.num_frames_dropped == 1
+
+
+def test_block_policy_applies_backpressure(monkeypatch: pytest.MonkeyPatch) -> None:
+    with _create_cores() as (diffraction_core, _):
+        loader = _GatedLoader(diffraction_core, monkeypatch)
+        context = _create_patterns_context(diffraction_core, [2] * 3, max_queue_size=1)
+        context.start()
+        context.append_array(_create_frames(0, 1))
+        assert loader.entered.wait(timeout=10.0)
+        context.append_array(_create_frames(2, 3))
+
+        producer = threading.Thread(target=context.append_array, args=(_create_frames(4, 5),))
+        producer.start()
+        producer.join(timeout=0.5)
+        assert producer.is_alive()
+
+        # the queue size counts frames rather than queued arrays
+        assert context.get_queue_size() == 6
+
+        loader.opened.set()
+        producer.join(timeout=10.0)
+        assert not producer.is_alive()
+        context.stop()
+
+        statistics = context.get_statistics()
+        assert context.get_loaded_indexes() == set(range(6))
+        assert statistics.num_frames_dropped == 0
+
+
+def test_block_policy_releases_producer_on_stop(monkeypatch: pytest.MonkeyPatch) -> None:
+    with _create_cores() as (diffraction_core, _):
+        loader = _GatedLoader(diffraction_core, monkeypatch)
+        context = _create_patterns_context(diffraction_core, [1] * 3, max_queue_size=1)
+        context.start()
+        context.append_array(_create_frames(0))
+        assert loader.entered.wait(timeout=10.0)
+        context.append_array(_create_frames(1))
+
+        producer = threading.Thread(target=context.append_array, args=(_create_frames(2),))
+        producer.start()
+        stopper = threading.Thread(target=context.stop)
+        stopper.start()
+
+        # the blocked producer gives up once streaming stops
+        producer.join(timeout=10.0)
+        assert not producer.is_alive()
+        loader.opened.set()
+        stopper.join(timeout=10.0)
+        assert not stopper.is_alive()
+
+        statistics = context.get_statistics()
+        assert statistics.num_frames_received == 3
+        assert statistics.num_frames_loaded + statistics.num_frames_dropped == 3
+        assert statistics.num_frames_queued == 0
+        assert 2 not in context.get_loaded_indexes()
+
+
+def test_stop_assigns_joined_positions_of_loaded_patterns() -> None:
+    with _create_cores() as (diffraction_core, product_core):
+        product_index = product_core.product_api.insert_new_product('Stream')
+        context = PtychodusStreamingContext(
+            product_core.probe_positions_api.create_streaming_context(product_index),
+            diffraction_core.diffraction_api.create_streaming_context(_create_metadata([2, 2])),
+        )
+        context.start()
+
+        # frame 4 exceeds the stream metadata so it is never loaded
+        for index in range(5):
+            context.append_array(_create_frames(index))
+
+        # positions arrive out of order; y for trigger count 3 never arrives
+        context.append_positions_x([4e-6, 0e-6, 1e-6], [4, 0, 1])
+        context.append_positions_y([1e-6, 0e-6, 2e-6], [0, 1, 2])
+        context.append_positions_x([2e-6, 3e-6], [2, 3])
+        context.append_positions_y([4e-6], [4])
+        context.stop()
+
+        positions = product_core.probe_positions_repository[product_index].get_probe_positions()
+        numpy.testing.assert_array_equal([position.index for position in positions], [0, 1, 2])
+        numpy.testing.assert_allclose(
+            [position.coordinate_x_m for position in positions], [0e-6, 1e-6, 2e-6]
+        )
+        numpy.testing.assert_allclose(
+            [position.coordinate_y_m for position in positions], [1e-6, 0e-6, 2e-6]
+        )
@@ -0,0 +1,114 @@
+import numpy
+import scipy.sparse
+import scipy.sparse.linalg
+
+from ptychodus.api.geometry import PixelGeometry
+from ptychodus.api.object import Object, ObjectCenter
+from ptychodus.api.probe import ProbeSequence
+from ptychodus.api.probe_positions import ProbePositionSequence
+from ptychodus.api.product import Product, ProductMetadata
+from ptychodus.model.analysis.interpolators import BarycentricArrayStitcher
+from ptychodus.model.fluorescence.vspi import assemble_vspi_matrix, solve_lsmr_columns
+
+OBJECT_HEIGHT_PX = 30
+OBJECT_WIDTH_PX = 36
+OBJECT_PIXEL_GEOMETRY = PixelGeometry(width_m=20e-9, height_m=10e-9)
+OBJECT_CENTER = ObjectCenter(coordinate_x_m=1e-6, coordinate_y_m=-2e-6)
+
+
+def _create_product(num_probes: int) -> Product:
+    rng = numpy.random.default_rng(7)
+    object_ = Object(
+        numpy.zeros((OBJECT_HEIGHT_PX, OBJECT_WIDTH_PX), dtype=complex),
+        OBJECT_PIXEL_GEOMETRY,
+        OBJECT_CENTER,
+    )
+    geometry = object_.get_geometry()
+    # (y, x) centers, including some that put the probe partly outside the object
+    coordinates_m = numpy.column_stack(
+        (
+            rng.uniform(geometry.minimum_y_m, geometry.minimum_y_m + geometry.height_m, 25),
+            rng.uniform(geometry.minimum_x_m, geometry.minimum_x_m + geometry.width_m, 25),
+        )
+    )
+    # two incoherent modes; several coherent modes mixed by orthogonal probe relaxation weights
+    num_coherent_modes = 1 if num_probes == 1 else 3
+    probe_shape = (num_coherent_modes, 2, 6, 7)
+    probes = ProbeSequence(
+        rng.normal(size=probe_shape) + 1j * rng.normal(size=probe_shape),
+        None if num_probes == 1 else rng.uniform(size=(num_probes, num_coherent_modes)),
+        PixelGeometry(width_m=20e-9, height_m=10e-9),
+    )
+    return Product(
+        metadata=ProductMetadata(
+            name='vspi',
+            comments='',
+            detector_distance_m=1.0,
+            probe_energy_eV=10000.0,
+            probe_photon_count=1e9,
+            exposure_time_s=1.0,
+            mass_attenuation_m2_kg=0.0,
+            tomography_angle_deg=0.0,
+        ),
+        probe_positions=ProbePositionSequence.create_from_arrays(numpy.arange(25), coordinates_m),
+        probes=probes,
+        object_=object_,
+        losses=[],
+    )
+
+
+def _get_probe_intensity(probes: ProbeSequence, index: int) -> numpy.ndarray:
+    """sums the incoherent mode intensities after mixing the first mode by the opr weights"""
+    array = probes.get_array()
+    modes = array[0].copy()
+
+    if len(probes) > 1:
+        modes[0] = numpy.tensordot(probes.get_opr_weights()[index], array[:, 0], axes=1)
+
+    return numpy.sum(numpy.abs(modes) ** 2, axis=0)
+
+
+def _assemble_reference(product: Product) -> numpy.ndarray:
+    """stitches the normalized probe intensity for each position one at a time"""
+    rows = list()
+
+    for index, position in enumerate(product.probe_positions):
+        center_x = (
+            position.coordinate_x_m - OBJECT_CENTER.coordinate_x_m
+        ) / OBJECT_PIXEL_GEOMETRY.width_m + OBJECT_WIDTH_PX / 2
+        center_y = (
+            position.coordinate_y_m - OBJECT_CENTER.coordinate_y_m
+        ) / OBJECT_PIXEL_GEOMETRY.height_m + OBJECT_HEIGHT_PX / 2
+        intensity = _get_probe_intensity(product.probes, 0 if len(product.probes) == 1 else index)
+        stitched = numpy.zeros((OBJECT_HEIGHT_PX, OBJECT_WIDTH_PX))
+        stitcher = BarycentricArrayStitcher[numpy.double](stitched)
+        stitcher.add_patch(center_x, center_y, intensity / intensity.sum())
+        rows.append(stitched.ravel())
+
+    return numpy.stack(rows)
+
+
+def test_assemble_vspi_matrix_matches_stitched_rows() -> None:
+    for num_probes in (1, 25):
+        product = _create_product(num_probes)
+        assert len(product.probes) == num_probes
+        actual = assemble_vspi_matrix(product, chunk_size=4)
+        expected = _assemble_reference(product)
+        assert numpy.any(expected.sum(axis=1) < 1.0 - 1e-6)  # some probes overhang the object
+        numpy.testing.assert_allclose(actual.toarray(), expected, atol=1e-14)
+
+
+def test_solve_lsmr_columns_matches_lsmr() -> None:
+    rng = numpy.random.default_rng(3)
+    A = scipy.sparse.random_array((60, 40), density=0.2, format='csr', rng=rng)  # noqa: N806
+    B = rng.normal(size=(60, 4))  # noqa: N806
+    B[:, 2] = 0.0  # zero right-hand side
+
+    X, num_iterations = solve_lsmr_columns(A, B, damp=0.1, maxiter=200)  # noqa: N806
+
+    for column in range(B.shape[1]):
+        expected = scipy.sparse.linalg.lsmr(A, B[:, column], damp=0.1, maxiter=200)
+        numpy.testing.assert_allclose(X[:, column], expected[0])
+        assert num_iterations[column] == expected[2]
+
+    numpy.testing.assert_array_equal(X[:, 2], 0.0)